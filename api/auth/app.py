@@ -3,28 +3,39 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Annotated
 
-import aiohttp
-import bcrypt
+import jwt
 from authlib.integrations.starlette_client import OAuth, OAuthError
-from fastapi import Body, Depends, FastAPI, Form, Request, status
+from fastapi import Body, Depends, FastAPI, Form, Request, Response, status
 from fastapi.openapi.utils import get_openapi
-from google.auth.transport import requests
-from google.oauth2 import id_token
 from starlette.config import Config
 from starlette.middleware.sessions import SessionMiddleware
 
+from api.auth.keys import key_ring
+from api.auth.password import password_hasher
+from api.auth.pipeline import (
+    basic_password_provider,
+    google_id_token_provider,
+    google_userinfo_provider,
+    kakao_id_token_provider,
+    signin_pipeline,
+)
+from api.auth.verifiers import http_session
+from api.common import generate_hash
 from api.db.cache import redis as cache
 from api.db.implements.mongo import add_token_log, add_user, get_user_by_email
 from api.db.implements.redis import AuthManager
-from api.errors import GoogleModuleError, KakaoModuleError
+from api.errors import GoogleModuleError, KakaoModuleError, PasswordHasherBusyError
 from api.jwt import (
     CREDENTIALS_EXCEPTION,
     bearer_scheme,
     create_access_token,
-    create_refresh_token,
     decode_token,
+    get_token_id,
+    get_token_payload,
+    is_token_revoked,
     valid_email_from_db,
 )
+from api.ratelimit import SIGNIN_LIMIT, SIGNUP_LIMIT, rate_limit
 from api.settings import env, get_description
 from enums.auth import AuthMessage, EventType, GrantType, OAuthProvider
 from responses.common import custom_response
@@ -37,7 +48,7 @@ from schemas.auth import (
     TokenLog,
     TokenResponse,
 )
-from schemas.users import UserInfo, UserModel
+from schemas.users import UserModel
 
 BASE_PATH = Path(__file__)
 
@@ -61,19 +72,6 @@ async def add_process_time_header(request, call_next):
     return response
 
 
-def hash_password(password: str) -> str:
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password_bytes, salt)
-    return hashed_password.decode("utf-8")
-
-
-def check_password(password: str, hashed_password: str) -> bool:
-    password_bytes = password.encode("utf-8")
-    hashed_password_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_password_bytes)
-
-
 def custom_openapi():
     if not auth_app.openapi_schema:
         auth_app.openapi_schema = get_openapi(
@@ -151,83 +149,7 @@ async def kakao_signin(body: IDTokenBody):
     ID Token의 무결성을 확인하고 access_token을 발급합니다.
     이 과정에서 사용자가 회원가입되어있지 않으면 DB에 회원정보를 추가합니다.
     """
-    users_id_token = body.id_token
-    signup_complete = True
-
-    async with aiohttp.ClientSession(
-        headers={
-            "Content-type": "application/x-www-form-urlencoded;charset=utf-8",
-        }
-    ) as session:
-        async with session.post(
-            "https://kauth.kakao.com/oauth/tokeninfo",
-            data={
-                "id_token": users_id_token,
-            },
-        ) as response:
-            user_data = await response.json()
-            logging.debug("user_data: %s", user_data)
-            if user_data.get("error"):
-                raise CREDENTIALS_EXCEPTION
-            if user_data.get("iss") not in ["https://kauth.kakao.com"]:
-                raise CREDENTIALS_EXCEPTION
-    try:
-        user_: UserModel = UserModel(
-            auth_provider=OAuthProvider.KAKAO,
-            email=user_data.get("email"),
-            name=user_data.get("nickname"),
-        )
-        user_info = await valid_email_from_db(
-            email=user_.email,
-            auth_provider=OAuthProvider.KAKAO,
-        )
-
-        if not user_info:
-            signup_complete = False
-            user_created, user_ = await add_user(user=user_)
-            if not user_created:
-                raise CREDENTIALS_EXCEPTION  # user not created
-            user_info = UserInfo(**user_.model_dump())
-    except Exception as user_error:
-        logging.exception("user error: %s", user_error)
-        raise CREDENTIALS_EXCEPTION from user_error
-
-    access_token_ = create_access_token(
-        email=user_info.email, auth_provider=OAuthProvider.KAKAO
-    )
-    refresh_token_ = create_refresh_token(
-        email=user_info.email, auth_provider=OAuthProvider.KAKAO
-    )
-    response_model = TokenResponse(
-        access_token=access_token_,
-        refresh_token=refresh_token_,
-        signup_complete=signup_complete,
-    )
-    created_at_ = datetime.now()
-
-    await add_token_log(
-        payload=TokenLog(
-            user_id=user_info.id,
-            event_type=EventType.SIGNIN,
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            grant_type=GrantType.REFRESH_TOKEN,
-            created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-            expired_at=(
-                created_at_
-                + timedelta(
-                    minutes=env.app_refresh_token_expire_minutes,
-                )
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-        )
-    )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        content=ResponseModel[TokenResponse](
-            message=AuthMessage.TOKEN_OKAY,
-            data=response_model,
-        ),
-    )
+    return await signin_pipeline.signin(kakao_id_token_provider, body.id_token)
 
 
 @auth_app.get(
@@ -273,89 +195,22 @@ async def kakao_auth(request: Request):
     """
     직접 호출할 일은 없지만 로그인에 성공하면 이곳으로 redirect 됩니다.
     """
-    signup_complete = True
-    async with aiohttp.ClientSession(
-        headers={
-            "Content-type": "application/x-www-form-urlencoded;charset=utf-8",
-        }
-    ) as session:
-        async with session.post(
-            "https://kauth.kakao.com/oauth/token",
-            data={
-                "grant_type": "authorization_code",
-                "client_id": KAKAO_CLIENT_ID,
-                "redirect_uri": f"{env.frontend_url}/auth/kakao/token",
-                "code": request.query_params.get("code"),
-                "client_secret": KAKAO_CLIENT_SECRET,
-            },
-        ) as response:
-            access_token = await response.json()
-            logging.debug("access_token: %s", access_token)
-            if access_token.get("error"):
-                raise CREDENTIALS_EXCEPTION
-        async with session.post(
-            "https://kauth.kakao.com/oauth/tokeninfo",
-            data={
-                "id_token": access_token.get("id_token", ""),
-            },
-        ) as response:
-            user_data = await response.json()
-            logging.info("user_data: %s", user_data)
-            if user_data.get("error"):
-                raise CREDENTIALS_EXCEPTION
-    try:
-        user_: UserModel = UserModel(
-            auth_provider=OAuthProvider.KAKAO,
-            email=user_data.get("email"),
-            name=user_data.get("nickname"),
-        )
-        user_info = await valid_email_from_db(
-            email=user_.email,
-            auth_provider=OAuthProvider.KAKAO,
-        )
-        if not user_info:
-            signup_complete = False
-            _okay, user_ = await add_user(user=user_)
-            user_info = UserInfo(**user_.model_dump())
-    except Exception as user_error:
-        logging.exception("user error: %s", user_error)
-        raise CREDENTIALS_EXCEPTION from user_error
-
-    access_token_ = create_access_token(
-        email=user_info.email, auth_provider=OAuthProvider.KAKAO
-    )
-    refresh_token_ = create_refresh_token(
-        email=user_info.email, auth_provider=OAuthProvider.KAKAO
-    )
-    response_model = TokenResponse(
-        access_token=access_token_,
-        refresh_token=refresh_token_,
-        signup_complete=signup_complete,
-    )
-    created_at_ = datetime.utcnow()
-
-    await add_token_log(
-        payload=TokenLog(
-            user_id=user_info.id,
-            event_type=EventType.SIGNIN,
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            grant_type=GrantType.REFRESH_TOKEN,
-            created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-            expired_at=(
-                created_at_
-                + timedelta(
-                    minutes=env.app_refresh_token_expire_minutes,
-                )
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-        )
-    )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        content=ResponseModel[TokenResponse](
-            message=AuthMessage.TOKEN_OKAY,
-            data=response_model,
-        ),
+    async with http_session.get().post(
+        "https://kauth.kakao.com/oauth/token",
+        data={
+            "grant_type": "authorization_code",
+            "client_id": KAKAO_CLIENT_ID,
+            "redirect_uri": f"{env.frontend_url}/auth/kakao/token",
+            "code": request.query_params.get("code"),
+            "client_secret": KAKAO_CLIENT_SECRET,
+        },
+    ) as response:
+        access_token = await response.json()
+        logging.debug("access_token: %s", access_token)
+        if access_token.get("error"):
+            raise CREDENTIALS_EXCEPTION
+    return await signin_pipeline.signin(
+        kakao_id_token_provider, access_token.get("id_token", "")
     )
 
 
@@ -378,7 +233,6 @@ async def google_auth(request: Request):
     """
     직접 호출할 일은 없지만 로그인에 성공하면 이곳으로 redirect 됩니다.
     """
-    signup_complete = True
     try:
         if not oauth.google:
             raise GoogleModuleError
@@ -395,56 +249,7 @@ async def google_auth(request: Request):
         logging.warning("not user data")
         raise CREDENTIALS_EXCEPTION
 
-    try:
-        user_ = UserInfo(auth_provider=OAuthProvider.GOOGLE, **user_data)
-        user_info = await valid_email_from_db(
-            email=user_.email,
-            auth_provider=OAuthProvider.GOOGLE,
-        )
-        if not user_info:
-            signup_complete = False
-            _okay, user_ = await add_user(user=user_)  # type: ignore
-            user_info = UserInfo(**user_.model_dump())
-    except Exception as user_error:
-        logging.exception("user error: %s", user_error)
-        raise CREDENTIALS_EXCEPTION from user_error
-
-    access_token_ = create_access_token(
-        email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-    )
-    refresh_token_ = create_refresh_token(
-        email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-    )
-    response_model = TokenResponse(
-        access_token=access_token_,
-        refresh_token=refresh_token_,
-        signup_complete=signup_complete,
-    )
-    created_at_ = datetime.now()
-
-    await add_token_log(
-        payload=TokenLog(
-            user_id=user_info.id,
-            event_type=EventType.SIGNIN,
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            grant_type=GrantType.REFRESH_TOKEN,
-            created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-            expired_at=(
-                created_at_
-                + timedelta(
-                    minutes=env.app_refresh_token_expire_minutes,
-                )
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-        )
-    )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        content=ResponseModel[TokenResponse](
-            message=AuthMessage.TOKEN_OKAY,
-            data=response_model,
-        ),
-    )
+    return await signin_pipeline.signin(google_userinfo_provider, user_data)
 
 
 @auth_app.post(
@@ -478,75 +283,7 @@ async def google_signin(body: IDTokenBody):
     ID Token의 무결성을 확인하고 access_token을 발급합니다.
     이 과정에서 사용자가 회원가입되어있지 않으면 DB에 회원정보를 추가합니다.
     """
-    users_id_token = body.id_token
-    signup_complete = True
-
-    try:
-        idinfo = id_token.verify_oauth2_token(
-            id_token=users_id_token,
-            request=requests.Request(),
-            audience=GOOGLE_CLIENT_ID,
-        )
-        if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
-            raise ValueError("Wrong issuer.")
-        email = idinfo["email"]
-
-        user_info = await valid_email_from_db(
-            email=email, auth_provider=OAuthProvider.GOOGLE
-        )
-        user_ = None  # type: ignore
-        if not user_info:
-            signup_complete = False
-            _okay, user_ = await add_user(
-                UserModel(
-                    **idinfo,
-                    auth_provider=OAuthProvider.GOOGLE,
-                ),
-            )
-            user_info = UserInfo(**user_.model_dump())
-
-        access_token_ = create_access_token(
-            email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-        )
-        refresh_token_ = create_refresh_token(
-            email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-        )
-        response_model = TokenResponse(
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            signup_complete=signup_complete,
-        )
-        created_at_ = datetime.now()
-
-        await add_token_log(
-            payload=TokenLog(
-                user_id=user_info.id,
-                event_type=EventType.SIGNIN,
-                access_token=access_token_,
-                refresh_token=refresh_token_,
-                grant_type=GrantType.REFRESH_TOKEN,
-                created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-                expired_at=(
-                    created_at_
-                    + timedelta(
-                        minutes=env.app_refresh_token_expire_minutes,
-                    )
-                ).strftime("%Y-%m-%d %H:%M:%S"),
-            )
-        )
-        return custom_response(
-            status_code=status.HTTP_200_OK,
-            content=ResponseModel[TokenResponse](
-                message=AuthMessage.TOKEN_OKAY,
-                data=response_model,
-            ),
-        )
-    except ValueError as value_error:
-        logging.exception("ValueError: %s", value_error)
-        raise CREDENTIALS_EXCEPTION from value_error
-    except Exception as credentials_error:
-        logging.exception("credentials error: %s", credentials_error)
-        raise CREDENTIALS_EXCEPTION from credentials_error
+    return await signin_pipeline.signin(google_id_token_provider, body.id_token)
 
 
 @auth_app.get(
@@ -617,6 +354,8 @@ async def refresh(body: RefreshBody):
             or payload.get("type") != GrantType.REFRESH_TOKEN.value
         ):
             raise CREDENTIALS_EXCEPTION
+        if await is_token_revoked(token, payload):
+            raise CREDENTIALS_EXCEPTION
         # check if token is not expired
         if datetime.utcfromtimestamp(payload.get("exp")) > datetime.utcnow():
             email = payload.get("email")
@@ -628,24 +367,25 @@ async def refresh(body: RefreshBody):
             if user_info:
                 # create and return token
                 created_at_ = datetime.utcnow()
+                access_token_id = generate_hash()
                 access_token_ = create_access_token(
-                    email=email, auth_provider=auth_provider
+                    email=email, auth_provider=auth_provider, token_id=access_token_id
                 )
 
                 await add_token_log(
                     payload=TokenLog(
                         user_id=user_info.id,
                         event_type=EventType.REFRESH_ACCESS_TOKEN,
-                        access_token=access_token_,
-                        refresh_token=body.refresh_token,
+                        access_token_id=access_token_id,
+                        refresh_token_id=get_token_id(body.refresh_token, payload),
                         grant_type=GrantType.ACCESS_TOKEN,
-                        created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
+                        created_at=created_at_,
                         expired_at=(
                             created_at_
                             + timedelta(
                                 minutes=env.app_access_token_expire_minutes,
                             )
-                        ).strftime("%Y-%m-%d %H:%M:%S"),
+                        ),
                     )
                 )
 
@@ -680,22 +420,26 @@ async def logout(used_token=Depends(bearer_scheme)):
     로그아웃시 사용하던 토큰은 블랙리스트에 추가되어 더이상 사용할 수 없어요.
     """
     used_token_ = used_token.credentials
+    try:
+        payload = decode_token(used_token_)
+    except jwt.PyJWTError as jwt_error:
+        raise CREDENTIALS_EXCEPTION from jwt_error
+    token_id = get_token_id(used_token_, payload)
     auth_manager = AuthManager(cache)
     okay = await auth_manager.add_token_to_blacklist(
-        token=used_token_,
+        token_id=token_id,
         grant_type=GrantType.ACCESS_TOKEN,
+        expires_at=payload.get("exp"),
     )
     if okay:
         await add_token_log(
             payload=TokenLog(
                 user_id=None,
                 event_type=EventType.SIGNOUT,
-                access_token=used_token_,
-                refresh_token=None,
+                access_token_id=token_id,
+                refresh_token_id=None,
                 grant_type=GrantType.ACCESS_TOKEN,
-                created_at=None,
-                expired_at=None,
-                blacklisted_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                expired_at=datetime.utcfromtimestamp(payload["exp"]),
             )
         )
 
@@ -709,6 +453,66 @@ async def logout(used_token=Depends(bearer_scheme)):
     raise CREDENTIALS_EXCEPTION
 
 
+@auth_app.get(
+    "/logout/all",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": AuthMessage.LOGOUT_SUCCESS,
+            "model": ResponseModel[None],
+        },
+    },
+    tags=["auth"],
+)
+async def logout_all(used_token=Depends(bearer_scheme)):
+    """
+    모든 기기에서 로그아웃해요. 지금까지 발급된 사용자의 모든 토큰을 더이상 사용할 수 없어요.
+    """
+    token_payload = await get_token_payload(used_token.credentials)
+    auth_manager = AuthManager(cache)
+    okay = await auth_manager.revoke_user_tokens(
+        email=token_payload.email,
+        auth_provider=token_payload.auth_provider,
+    )
+    if okay:
+        await add_token_log(
+            payload=TokenLog(
+                user_id=None,
+                event_type=EventType.SIGNOUT,
+                access_token_id=get_token_id(used_token.credentials),
+                refresh_token_id=None,
+                grant_type=GrantType.REFRESH_TOKEN,
+            )
+        )
+
+        return custom_response(
+            status_code=status.HTTP_200_OK,
+            content=ResponseModel[None](
+                message=AuthMessage.LOGOUT_SUCCESS,
+                data=None,
+            ),
+        )
+    raise CREDENTIALS_EXCEPTION
+
+
+@auth_app.get("/.well-known/jwks.json", tags=["auth"])
+async def jwks(request: Request):
+    """
+    토큰 서명 검증용 공개키(JWKS)를 반환해요. 다른 서비스에서 토큰을 직접 검증할 때 사용해요.
+    """
+    headers = {
+        "Cache-Control": f"public, max-age={env.app_jwks_max_age_seconds}",
+        "ETag": key_ring.jwks_etag,
+    }
+    if request.headers.get("If-None-Match") == key_ring.jwks_etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=key_ring.jwks,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 auth_app.openapi = custom_openapi
 
 # --- deprecated ---
@@ -732,7 +536,6 @@ async def auth(request: Request):
     """
     직접 호출할 일은 없지만 로그인에 성공하면 이곳으로 redirect 됩니다.
     """
-    signup_complete = True
     try:
         if not oauth.google:
             raise GoogleModuleError
@@ -748,57 +551,7 @@ async def auth(request: Request):
         logging.warning("not user data")
         raise CREDENTIALS_EXCEPTION
 
-    try:
-        user_ = UserModel(auth_provider=OAuthProvider.GOOGLE, **user_data)
-        user_info = await valid_email_from_db(
-            email=user_.email,
-            auth_provider=OAuthProvider.GOOGLE,
-        )
-        if not user_info:
-            signup_complete = False
-            _okay, user_ = await add_user(user=user_)
-            user_info = UserInfo(**user_.model_dump())
-
-    except Exception as user_error:
-        logging.exception("user error: %s", user_error)
-        raise CREDENTIALS_EXCEPTION from user_error
-
-    access_token_ = create_access_token(
-        email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-    )
-    refresh_token_ = create_refresh_token(
-        email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-    )
-    response_model = TokenResponse(
-        access_token=access_token_,
-        refresh_token=refresh_token_,
-        signup_complete=signup_complete,
-    )
-    created_at_ = datetime.utcnow()
-
-    await add_token_log(
-        payload=TokenLog(
-            user_id=user_info.id,
-            event_type=EventType.SIGNIN,
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            grant_type=GrantType.REFRESH_TOKEN,
-            created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-            expired_at=(
-                created_at_
-                + timedelta(
-                    minutes=env.app_refresh_token_expire_minutes,
-                )
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-        )
-    )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        content=ResponseModel[TokenResponse](
-            message=AuthMessage.TOKEN_OKAY,
-            data=response_model,
-        ),
-    )
+    return await signin_pipeline.signin(google_userinfo_provider, user_data)
 
 
 # deprecated: token/signin
@@ -822,79 +575,24 @@ async def signin(body: IDTokenBody):
     ID Token의 무결성을 확인하고 access_token을 발급합니다.
     이 과정에서 사용자가 회원가입되어있지 않으면 DB에 회원정보를 추가합니다.
     """
-    users_id_token = body.id_token
-    signup_complete = True
+    return await signin_pipeline.signin(google_id_token_provider, body.id_token)
 
-    try:
-        idinfo = id_token.verify_oauth2_token(
-            id_token=users_id_token,
-            request=requests.Request(),
-            audience=GOOGLE_CLIENT_ID,
-        )
-        if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
-            raise ValueError("Wrong issuer.")
-        email = idinfo["email"]
 
-        user_info = await valid_email_from_db(
-            email=email,
-            auth_provider=OAuthProvider.GOOGLE,
-        )
-        user_ = None
-        if not user_info:
-            signup_complete = False
-            _okay, user_ = await add_user(
-                UserModel(
-                    auth_provider=OAuthProvider.GOOGLE,
-                    **idinfo,
-                ),
-            )
-            user_info = UserInfo(**user_.model_dump())
-
-        access_token_ = create_access_token(
-            email=user_info.email, auth_provider=OAuthProvider.GOOGLE
-        )
-        refresh_token_ = create_refresh_token(
-            user_info.email, auth_provider=OAuthProvider.GOOGLE
-        )
-        response_model = TokenResponse(
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            signup_complete=signup_complete,
-        )
-        created_at_ = datetime.now()
-
-        await add_token_log(
-            payload=TokenLog(
-                user_id=user_info.id,
-                event_type=EventType.SIGNIN,
-                access_token=access_token_,
-                refresh_token=refresh_token_,
-                grant_type=GrantType.REFRESH_TOKEN,
-                created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-                expired_at=(
-                    created_at_
-                    + timedelta(
-                        minutes=env.app_refresh_token_expire_minutes,
-                    )
-                ).strftime("%Y-%m-%d %H:%M:%S"),
-            )
-        )
-        return custom_response(
-            status_code=status.HTTP_200_OK,
-            content=ResponseModel(
-                message=AuthMessage.TOKEN_OKAY,
-                data=response_model,
-            ),
-        )
-    except ValueError as value_error:
-        logging.exception("ValueError: %s", value_error)
-        raise CREDENTIALS_EXCEPTION from value_error
-    except Exception as credentials_error:
-        logging.exception("credentials error: %s", credentials_error)
-        raise CREDENTIALS_EXCEPTION from credentials_error
+def password_hasher_busy_response():
+    return custom_response(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=ResponseModel(
+            message="요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
+            data=None,
+        ),
+    )
 
 
-@auth_app.post("/basic/signup", status_code=status.HTTP_200_OK)
+@auth_app.post(
+    "/basic/signup",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(SIGNUP_LIMIT))],
+)
 async def basic_signup(body: Annotated[SignupBody, Body(...)]):
     """
     회원가입
@@ -922,15 +620,28 @@ async def basic_signup(body: Annotated[SignupBody, Body(...)]):
                 data=None,
             ),
         )
+    try:
+        hashed_password = await password_hasher.hash(body.password)
+    except PasswordHasherBusyError:
+        return password_hasher_busy_response()
     user_ = UserModel(
         auth_provider=OAuthProvider.BASIC,
         email=body.email,
         service_email=body.email,
-        password=hash_password(body.password),
+        password=hashed_password,
         name=body.name,
         # NOTE: 필요하다면 signup_complete 넣기
     )
-    await add_user(user=user_)
+    user_created, _ = await add_user(user=user_)
+    if not user_created:
+        # NOTE: 동시에 같은 계정으로 가입한 경우
+        return custom_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=ResponseModel(
+                message="이미 있는 계정입니다.",
+                data=None,
+            ),
+        )
 
     return custom_response(
         status_code=status.HTTP_200_OK,
@@ -941,61 +652,12 @@ async def basic_signup(body: Annotated[SignupBody, Body(...)]):
     )
 
 
-@auth_app.post("/basic/signin", status_code=status.HTTP_200_OK)
+@auth_app.post(
+    "/basic/signin",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(SIGNIN_LIMIT))],
+)
 async def basic_signin(
     email: Annotated[str, Form(...)], password: Annotated[str, Form(...)]
 ):
-    user_model = await get_user_by_email(
-        email=email,
-        auth_provider=OAuthProvider.BASIC,
-    )
-    if not user_model:
-        return custom_response(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content=ResponseModel(
-                message="계정이 없습니다.",
-                data=None,
-            ),
-        )
-    if not check_password(password, user_model.password or ""):
-        return custom_response(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content=ResponseModel(
-                message="비밀번호가 틀렸습니다.",
-                data=None,
-            ),
-        )
-    access_token_ = create_access_token(email=email, auth_provider=OAuthProvider.BASIC)
-    refresh_token_ = create_refresh_token(
-        email=email, auth_provider=OAuthProvider.BASIC
-    )
-    response_model = TokenResponse(
-        access_token=access_token_,
-        refresh_token=refresh_token_,
-        signup_complete=True,
-    )
-    created_at_ = datetime.now()
-
-    await add_token_log(
-        payload=TokenLog(
-            user_id=user_model.id,
-            event_type=EventType.SIGNIN,
-            access_token=access_token_,
-            refresh_token=refresh_token_,
-            grant_type=GrantType.REFRESH_TOKEN,
-            created_at=created_at_.strftime("%Y-%m-%d %H:%M:%S"),
-            expired_at=(
-                created_at_
-                + timedelta(
-                    minutes=env.app_refresh_token_expire_minutes,
-                )
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-        )
-    )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        content=ResponseModel(
-            message=AuthMessage.TOKEN_OKAY,
-            data=response_model,
-        ),
-    )
+    return await signin_pipeline.signin(basic_password_provider, (email, password))
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+
+from api.settings import env, kv_string_to_dict
+
+
+class SigningKey:
+    """
+    kid 하나에 해당하는 서명(비공개)/검증(공개) 키
+
+    공개키만 있는 키는 교체 이후에 남아있는 토큰 검증에만 사용합니다.
+    """
+
+    def __init__(self, kid: str, pem: bytes):
+        self.kid = kid
+        try:
+            self.private_key = load_pem_private_key(pem, password=None)
+            self.public_key = self.private_key.public_key()
+        except ValueError:
+            self.private_key = None
+            self.public_key = load_pem_public_key(pem)
+        if isinstance(self.public_key, ec.EllipticCurvePublicKey):
+            # NOTE: ES256은 P-256 곡선만 허용합니다.
+            if not isinstance(self.public_key.curve, ec.SECP256R1):
+                raise ValueError(f"{kid}: ES256 requires a P-256 key")
+            self.algorithm = "ES256"
+            self.jwk = json.loads(ECAlgorithm.to_jwk(self.public_key))
+        elif isinstance(self.public_key, ed25519.Ed25519PublicKey):
+            self.algorithm = "EdDSA"
+            self.jwk = json.loads(OKPAlgorithm.to_jwk(self.public_key))
+        else:
+            raise ValueError(f"{kid}: only EC P-256 and Ed25519 keys are supported")
+        self.jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+
+    @classmethod
+    def from_file(cls, kid: str, path: str) -> "SigningKey":
+        return cls(kid=kid, pem=Path(path).read_bytes())
+
+
+class KeyRing:
+    """
+    토큰 서명/검증에 사용하는 키 모음
+
+    - 서명은 active_kid 키로만 합니다. (kid 헤더 포함)
+    - 검증은 kid 헤더에 맞는 키로 하며, 등록된 모든 키가 유효합니다.
+    - 비대칭 키가 없거나 kid가 없는 이전 토큰은 app_secret(HS256)으로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        keys: list[SigningKey],
+        active_kid: str | None,
+        secret: str,
+        secret_algorithm: str,
+    ):
+        self.keys = {key.kid: key for key in keys}
+        self.secret = secret
+        self.secret_algorithm = secret_algorithm
+        self.active: SigningKey | None = None
+        if active_kid:
+            if active_kid not in self.keys:
+                raise ValueError(f"Unknown signing kid: {active_kid}")
+            self.active = self.keys[active_kid]
+            if self.active.private_key is None:
+                raise ValueError(f"{active_kid}: private key required for signing")
+        self.jwks = json.dumps(
+            {"keys": [key.jwk for key in self.keys.values()]},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.jwks_etag = '"{}"'.format(hashlib.sha256(self.jwks).hexdigest()[:16])
+
+    def encode(self, payload: dict) -> str:
+        if self.active is None:
+            return jwt.encode(payload, self.secret, algorithm=self.secret_algorithm)
+        return jwt.encode(
+            payload,
+            self.active.private_key,
+            algorithm=self.active.algorithm,
+            headers={"kid": self.active.kid},
+        )
+
+    def decode(self, token: str) -> dict:
+        """
+        서명을 검증하고 claim을 반환합니다. 실패하면 jwt.PyJWTError가 발생합니다.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            if not self.secret:
+                raise jwt.InvalidTokenError("Missing kid.")
+            return jwt.decode(token, self.secret, algorithms=[self.secret_algorithm])
+        key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown signing key.")
+        # NOTE: 알고리즘을 키에 고정해서 alg 헤더 변조를 막습니다.
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+
+def load_key_ring() -> KeyRing:
+    """
+    PALM_APP_SIGNING_KEYS="kid1:/path/key1.pem,kid2:/path/key2.pub.pem"
+    PALM_APP_SIGNING_KID="kid1"
+    """
+    keys = []
+    if env.app_signing_keys:
+        for kid, path in kv_string_to_dict(env.app_signing_keys).items():
+            keys.append(SigningKey.from_file(kid=kid, path=path))
+    key_ring = KeyRing(
+        keys=keys,
+        active_kid=env.app_signing_kid,
+        secret=env.app_secret,
+        secret_algorithm=env.app_secret_algo,
+    )
+    logging.info(
+        "jwt keys: %s (signing with %s)",
+        list(key_ring.keys),
+        key_ring.active.kid if key_ring.active else env.app_secret_algo,
+    )
+    return key_ring
+
+
+# NOTE: 키는 시작할 때 한 번만 읽어 메모리에 보관합니다.
+key_ring = load_key_ring()
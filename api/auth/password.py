@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from api.errors import PasswordHasherBusyError
+from api.settings import env
+
+
+def hash_password(password: str, rounds: int = 12) -> str:
+    password_bytes = password.encode("utf-8")
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed_password = bcrypt.hashpw(password_bytes, salt)
+    return hashed_password.decode("utf-8")
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    password_bytes = password.encode("utf-8")
+    hashed_password_bytes = hashed_password.encode("utf-8")
+    return bcrypt.checkpw(password_bytes, hashed_password_bytes)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다.
+
+    실행 중인 작업과 대기 중인 작업의 합이 workers + queue_size를 넘으면
+    기다리지 않고 PasswordHasherBusyError를 발생시킵니다.
+
+    요청이 취소되어도(클라이언트 연결 종료) 스레드의 bcrypt는 계속 실행되므로
+    자리는 작업이 실제로 끝났을 때(done callback) 반환합니다.
+    """
+
+    def __init__(self, workers: int, queue_size: int, rounds: int):
+        self.workers = workers
+        self.limit = workers + queue_size
+        self.rounds = rounds
+        self.executor: ThreadPoolExecutor | None = None
+        self.in_flight = 0
+        # NOTE: done callback은 작업 스레드에서 호출되므로 lock으로 보호합니다.
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="password-hasher",
+            )
+        return self.executor
+
+    async def _run(self, func, *args):
+        with self.lock:
+            if self.in_flight >= self.limit:
+                self.rejected += 1
+                raise PasswordHasherBusyError
+            self.in_flight += 1
+        started_at = time.perf_counter()
+
+        def _release(_future):
+            elapsed = time.perf_counter() - started_at
+            with self.lock:
+                self.in_flight -= 1
+                self.calls += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+            logging.debug("%s took %.1fms", func.__name__, elapsed * 1000)
+
+        try:
+            future = self.get_executor().submit(func, *args)
+        except BaseException:
+            with self.lock:
+                self.in_flight -= 1
+            raise
+        future.add_done_callback(_release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.rounds)
+
+    async def check(self, password: str, hashed_password: str) -> bool:
+        return await self._run(check_password, password, hashed_password)
+
+    def shutdown(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "avg_ms": self.total_seconds / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=env.password_hash_workers,
+    queue_size=env.password_hash_queue_size,
+    rounds=env.password_hash_rounds,
+)
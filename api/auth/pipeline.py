@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Awaitable
+
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+
+from api.auth.password import password_hasher
+from api.auth.verifiers import google_verifier, kakao_verifier
+from api.common import generate_hash
+from api.db.implements.mongo import add_token_log, add_user, get_user_by_email
+from api.errors import PasswordHasherBusyError, SigninError
+from api.jwt import CREDENTIALS_EXCEPTION, create_access_token, create_refresh_token
+from api.settings import env
+from enums.auth import AuthMessage, EventType, GrantType, OAuthProvider
+from responses.common import custom_response
+from schemas import ResponseModel
+from schemas.auth import TokenLog, TokenResponse
+from schemas.users import UserModel
+
+
+class StageTimer:
+    """
+    로그인 요청 하나의 단계별 소요시간
+
+    개발/테스트 환경에서는 Server-Timing 헤더로 응답에 포함됩니다.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = time.perf_counter() - started_at
+
+    async def measure(self, name: str, awaitable: Awaitable) -> Any:
+        with self.stage(name):
+            return await awaitable
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        stages = {**self.stages, "total": self.total()}
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" for name, seconds in stages.items()
+        )
+
+
+class SigninProvider:
+    """
+    로그인 수단별로 자격증명을 검증하고 사용자 정보를 만듭니다.
+
+    create_user가 True이면 처음 로그인한 사용자는 파이프라인에서 가입됩니다.
+    """
+
+    auth_provider: OAuthProvider
+    create_user: bool = True
+
+    async def identify(self, credential: Any) -> UserModel:
+        raise NotImplementedError
+
+
+class GoogleIdTokenProvider(SigninProvider):
+    auth_provider = OAuthProvider.GOOGLE
+
+    async def identify(self, credential: str) -> UserModel:
+        claims = await google_verifier.verify(credential)
+        return UserModel(**claims, auth_provider=self.auth_provider)
+
+
+class GoogleUserInfoProvider(SigninProvider):
+    """
+    웹 로그인에서 authlib이 검증한 userinfo를 그대로 사용합니다.
+    """
+
+    auth_provider = OAuthProvider.GOOGLE
+
+    async def identify(self, credential: dict) -> UserModel:
+        return UserModel(**credential, auth_provider=self.auth_provider)
+
+
+class KakaoIdTokenProvider(SigninProvider):
+    auth_provider = OAuthProvider.KAKAO
+
+    async def identify(self, credential: str) -> UserModel:
+        claims = await kakao_verifier.verify(credential)
+        logging.debug("user_data: %s", claims)
+        return UserModel(
+            auth_provider=self.auth_provider,
+            email=claims.get("email"),
+            name=claims.get("nickname"),
+        )
+
+
+class BasicPasswordProvider(SigninProvider):
+    """
+    이메일/비밀번호 로그인, 가입은 /basic/signup에서만 합니다.
+    """
+
+    auth_provider = OAuthProvider.BASIC
+    create_user = False
+
+    async def identify(self, credential: tuple[str, str]) -> UserModel:
+        email, password = credential
+        # NOTE: 비밀번호 해시는 캐시하지 않으므로 MongoDB에서 직접 조회
+        user_model = await get_user_by_email(
+            email=email,
+            auth_provider=self.auth_provider,
+            cached=False,
+        )
+        if not user_model:
+            raise SigninError(status.HTTP_404_NOT_FOUND, "계정이 없습니다.")
+        try:
+            password_okay = await password_hasher.check(
+                password, user_model.password or ""
+            )
+        except PasswordHasherBusyError as busy_error:
+            raise SigninError(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.",
+            ) from busy_error
+        if not password_okay:
+            raise SigninError(status.HTTP_401_UNAUTHORIZED, "비밀번호가 틀렸습니다.")
+        return user_model
+
+
+class SigninPipeline:
+    """
+    모든 로그인 수단이 공유하는 로그인 처리 과정
+
+    1. verify: 로그인 수단별 자격증명 검증
+    2. user, mint: 사용자 upsert를 요청해두고 기다리는 동안 토큰을 발급
+    3. log: 토큰 로그는 대기열에 넣기만 하고 응답을 기다리게 하지 않음
+    """
+
+    # NOTE: 단계별 최근 소요시간, 백분위 계산용
+    window_size = 1024
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+        self.timings: dict[str, dict[str, deque]] = {}
+
+    def record(self, auth_provider: OAuthProvider, timer: StageTimer):
+        provider = OAuthProvider(auth_provider).value
+        self.calls[provider] = self.calls.get(provider, 0) + 1
+        timings = self.timings.setdefault(provider, {})
+        for name, seconds in {**timer.stages, "total": timer.total()}.items():
+            timings.setdefault(name, deque(maxlen=self.window_size)).append(seconds)
+
+    async def signin(self, provider: SigninProvider, credential: Any) -> ORJSONResponse:
+        timer = StageTimer()
+        try:
+            user_ = await timer.measure("verify", provider.identify(credential))
+        except SigninError as signin_error:
+            return custom_response(
+                status_code=signin_error.status_code,
+                content=ResponseModel(message=signin_error.message, data=None),
+            )
+        except Exception as credentials_error:
+            logging.exception("credentials error: %s", credentials_error)
+            raise CREDENTIALS_EXCEPTION from credentials_error
+
+        upsert = None
+        if provider.create_user:
+            upsert = asyncio.create_task(timer.measure("user", add_user(user=user_)))
+            # NOTE: 발급(동기)을 시작하기 전에 upsert 요청이 먼저 전송되도록 양보
+            await asyncio.sleep(0)
+        # NOTE: 토큰에는 email, auth_provider만 필요하므로 upsert 응답을 기다리지 않음
+        try:
+            with timer.stage("mint"):
+                access_token_id, refresh_token_id = generate_hash(), generate_hash()
+                access_token_ = create_access_token(
+                    email=user_.email,
+                    auth_provider=provider.auth_provider,
+                    token_id=access_token_id,
+                )
+                refresh_token_ = create_refresh_token(
+                    email=user_.email,
+                    auth_provider=provider.auth_provider,
+                    token_id=refresh_token_id,
+                )
+        except BaseException:
+            # NOTE: 발급에 실패하면 요청해둔 upsert가 남지 않도록 정리합니다.
+            if upsert is not None:
+                upsert.cancel()
+                await asyncio.gather(upsert, return_exceptions=True)
+            raise
+        signup_complete = True
+        if upsert is not None:
+            try:
+                user_created, user_ = await upsert
+            except Exception as user_error:
+                logging.exception("user error: %s", user_error)
+                raise CREDENTIALS_EXCEPTION from user_error
+            signup_complete = not user_created
+
+        with timer.stage("log"):
+            created_at_ = datetime.utcnow()
+            await add_token_log(
+                payload=TokenLog(
+                    user_id=user_.id,
+                    event_type=EventType.SIGNIN,
+                    access_token_id=access_token_id,
+                    refresh_token_id=refresh_token_id,
+                    grant_type=GrantType.REFRESH_TOKEN,
+                    created_at=created_at_,
+                    expired_at=(
+                        created_at_
+                        + timedelta(minutes=env.app_refresh_token_expire_minutes)
+                    ),
+                )
+            )
+        self.record(provider.auth_provider, timer)
+        response = custom_response(
+            status_code=status.HTTP_200_OK,
+            content=ResponseModel[TokenResponse](
+                message=AuthMessage.TOKEN_OKAY,
+                data=TokenResponse(
+                    access_token=access_token_,
+                    refresh_token=refresh_token_,
+                    signup_complete=signup_complete,
+                ),
+            ),
+        )
+        # NOTE: 내부 처리 시간이 노출되므로 docs_url처럼 개발/테스트 환경에서만 포함
+        if env.is_internal:
+            response.headers["Server-Timing"] = timer.server_timing()
+        return response
+
+    def stats(self) -> dict:
+        stats = {}
+        for provider, timings in self.timings.items():
+            stats[provider] = {"calls": self.calls[provider]}
+            for name, values in timings.items():
+                ordered = sorted(values)
+                stats[provider][name] = {
+                    "p50_ms": ordered[len(ordered) // 2] * 1000,
+                    "p95_ms": ordered[int(len(ordered) * 0.95)] * 1000,
+                    "max_ms": ordered[-1] * 1000,
+                }
+        return stats
+
+
+google_id_token_provider = GoogleIdTokenProvider()
+google_userinfo_provider = GoogleUserInfoProvider()
+kakao_id_token_provider = KakaoIdTokenProvider()
+basic_password_provider = BasicPasswordProvider()
+
+signin_pipeline = SigninPipeline()
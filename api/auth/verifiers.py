@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import re
+import time
+
+import aiohttp
+import jwt
+
+from api.settings import env
+
+
+class HttpSession:
+    """
+    인증 서버 호출에 공유하는 aiohttp 세션, 커넥션(TLS) 풀을 재사용합니다.
+    """
+
+    def __init__(self):
+        self.session: aiohttp.ClientSession | None = None
+
+    def get(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self.session
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+
+http_session = HttpSession()
+
+
+def parse_max_age(cache_control: str | None, default: int) -> int:
+    """
+    "public, max-age=19146, must-revalidate" -> 19146
+    """
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    if match is None:
+        return default
+    return int(match.group(1))
+
+
+class JWKSCache:
+    """
+    OAuth Provider의 서명 키(JWKS)를 메모리에 보관합니다.
+
+    응답의 Cache-Control max-age가 끝나기 전에 백그라운드에서 갱신하기 때문에
+    토큰 검증 중에는 네트워크 요청이 발생하지 않습니다.
+    """
+
+    # NOTE: 만료 직전이 아니라 조금 일찍 갱신
+    refresh_margin_seconds = 60
+    # NOTE: 알 수 없는 kid로 인한 강제 갱신은 이 간격 안에서 한 번만 허용
+    min_refresh_interval_seconds = 30
+
+    def __init__(self, url: str, default_max_age: int = 3600):
+        self.url = url
+        self.default_max_age = default_max_age
+        self.keys: dict[str, jwt.PyJWK] = {}
+        self.expires_at = 0.0
+        self.refreshed_at = 0.0
+        self.lock = asyncio.Lock()
+        self.refresh_task: asyncio.Task | None = None
+        self.pending_refresh: asyncio.Task | None = None
+
+    def is_fresh(self) -> bool:
+        return bool(self.keys) and self.expires_at > time.monotonic()
+
+    async def refresh(self, force: bool = False):
+        async with self.lock:
+            now = time.monotonic()
+            if not force and self.is_fresh():
+                return
+            if force and now - self.refreshed_at < self.min_refresh_interval_seconds:
+                return
+            async with http_session.get().get(self.url) as response:
+                response.raise_for_status()
+                jwks = await response.json(content_type=None)
+                max_age = parse_max_age(
+                    response.headers.get("Cache-Control"),
+                    self.default_max_age,
+                )
+            self.keys = {
+                key["kid"]: jwt.PyJWK(key)
+                for key in jwks.get("keys", [])
+                if "kid" in key
+            }
+            self.refreshed_at = now
+            self.expires_at = now + max_age
+            logging.info("jwks refreshed: %s (max-age %s)", self.url, max_age)
+
+    async def get_key(self, kid: str | None) -> jwt.PyJWK | None:
+        if not self.is_fresh():
+            await self.refresh()
+        return self.keys.get(kid or "")
+
+    async def _refresh_forever(self):
+        while True:
+            delay = self.expires_at - time.monotonic() - self.refresh_margin_seconds
+            await asyncio.sleep(max(delay, self.min_refresh_interval_seconds))
+            try:
+                await self.refresh(force=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.exception("Error while refreshing jwks %s: %s", self.url, e)
+
+    def refresh_soon(self):
+        """
+        검증을 기다리게 하지 않고 백그라운드에서 JWKS를 갱신합니다.
+        """
+        if self.pending_refresh and not self.pending_refresh.done():
+            return
+
+        async def _refresh():
+            try:
+                await self.refresh(force=True)
+            except Exception as e:
+                logging.exception("Error while refreshing jwks %s: %s", self.url, e)
+
+        self.pending_refresh = asyncio.create_task(_refresh())
+
+    async def start(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            # NOTE: 서비스 시작을 막지 않고 첫 검증 시점에 다시 시도합니다.
+            logging.exception("Error while fetching jwks %s: %s", self.url, e)
+        self.refresh_task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self):
+        if self.refresh_task:
+            self.refresh_task.cancel()
+            self.refresh_task = None
+
+
+class IdTokenVerifier:
+    """
+    OIDC ID Token의 서명, iss, aud, exp를 메모리의 JWKS로 검증합니다.
+    """
+
+    issuers: tuple[str, ...] = ()
+    algorithms: tuple[str, ...] = ("RS256",)
+
+    def __init__(self, jwks: JWKSCache, audience: str):
+        self.jwks = jwks
+        self.audience = audience
+
+    async def get_key(self, token: str) -> jwt.PyJWK | None:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = await self.jwks.get_key(kid)
+        if key is None:
+            # NOTE: 키가 교체되었을 수 있으므로 한 번 더 받아옵니다.
+            await self.jwks.refresh(force=True)
+            key = await self.jwks.get_key(kid)
+        return key
+
+    def decode(self, token: str, key: jwt.PyJWK) -> dict:
+        claims = jwt.decode(
+            token,
+            key.key,
+            algorithms=list(self.algorithms),
+            audience=self.audience,
+            options={"require": ["exp", "iss", "aud"]},
+        )
+        if claims["iss"] not in self.issuers:
+            raise jwt.InvalidIssuerError("Wrong issuer.")
+        return claims
+
+    async def verify(self, token: str) -> dict:
+        """
+        검증된 claim을 반환합니다. 검증에 실패하면 jwt.PyJWTError가 발생합니다.
+        """
+        key = await self.get_key(token)
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown signing key.")
+        return self.decode(token, key)
+
+
+class GoogleIdTokenVerifier(IdTokenVerifier):
+    issuers = ("accounts.google.com", "https://accounts.google.com")
+
+
+class KakaoIdTokenVerifier(IdTokenVerifier):
+    """
+    알 수 없는 kid(키 교체 직후)이거나 JWKS를 가져오지 못한 경우(네트워크 오류, 5xx)에만
+    Kakao tokeninfo API로 검증합니다.
+    """
+
+    issuers = ("https://kauth.kakao.com",)
+
+    def __init__(self, jwks: JWKSCache, audience: str, tokeninfo_url: str):
+        super().__init__(jwks=jwks, audience=audience)
+        self.tokeninfo_url = tokeninfo_url
+
+    async def tokeninfo(self, token: str) -> dict:
+        async with http_session.get().post(
+            self.tokeninfo_url,
+            data={"id_token": token},
+        ) as response:
+            claims = await response.json(content_type=None)
+        logging.debug("tokeninfo: %s", claims)
+        if claims.get("error"):
+            raise jwt.InvalidTokenError(claims.get("error"))
+        if claims.get("iss") not in self.issuers:
+            raise jwt.InvalidIssuerError("Wrong issuer.")
+        return claims
+
+    async def verify(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        try:
+            key = await self.jwks.get_key(kid)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # NOTE: JWKS 장애로 로그인이 막히지 않도록 tokeninfo로 검증합니다.
+            logging.warning("Error while fetching jwks %s: %s", self.jwks.url, e)
+            return await self.tokeninfo(token)
+        if key is not None:
+            return self.decode(token, key)
+        self.jwks.refresh_soon()
+        return await self.tokeninfo(token)
+
+
+google_verifier = GoogleIdTokenVerifier(
+    jwks=JWKSCache(env.google_jwks_url),
+    audience=env.google_client_id,
+)
+kakao_verifier = KakaoIdTokenVerifier(
+    jwks=JWKSCache(env.kakao_jwks_url),
+    audience=env.kakao_client_id,
+    tokeninfo_url=env.kakao_tokeninfo_url,
+)
+
+VERIFIERS: list[IdTokenVerifier] = [google_verifier, kakao_verifier]
+
+
+async def start_verifiers():
+    for verifier in VERIFIERS:
+        await verifier.jwks.start()
+
+
+async def stop_verifiers():
+    for verifier in VERIFIERS:
+        await verifier.jwks.stop()
+    await http_session.close()
@@ -0,0 +1,252 @@
+"""
+성능 확인용 마이크로 벤치마크
+
+python -m api.benchmarks jwt-decode --rps 200
+python -m api.benchmarks user-models
+python -m api.benchmarks foot-prints --foot-prints 10000 --iterations 200  # MongoDB 필요
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+# NOTE: 벤치마크는 외부 서비스 없이 실행할 수 있도록 기본값을 채워둡니다.
+os.environ.setdefault("PALM_MONGO_HOST", "localhost")
+os.environ.setdefault("PALM_APP_SECRET", "benchmark-secret-benchmark-secret")
+
+logging.basicConfig(level=logging.INFO)
+
+
+def _cpu_per_call(func, iterations: int) -> float:
+    started_at = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started_at) / iterations
+
+
+def bench_jwt_decode(args: argparse.Namespace):
+    """
+    서명 검증을 매번 하는 경우와 decode 캐시를 사용하는 경우의 요청당 CPU 시간 비교
+    """
+    from api.auth.keys import key_ring
+    from api.jwt import create_access_token, decode_token, decoded_token_cache
+    from enums.auth import OAuthProvider
+
+    iterations, rps = args.iterations, args.rps
+    token = create_access_token("bench@p.alm", OAuthProvider.GOOGLE)
+
+    def verify():
+        key_ring.decode(token)
+
+    decoded_token_cache.clear()
+    decode_token(token)
+    uncached = _cpu_per_call(verify, iterations)
+    cached = _cpu_per_call(lambda: decode_token(token), iterations)
+    saved = uncached - cached
+    logging.info("key_ring.decode   : %.2f us/call", uncached * 1e6)
+    logging.info("decode_token(hit) : %.2f us/call", cached * 1e6)
+    logging.info(
+        "saved at %s req/s : %.1f ms CPU/s per worker (%.1f s CPU/hour)",
+        rps,
+        saved * rps * 1e3,
+        saved * rps * 3600,
+    )
+
+
+def bench_user_models(args: argparse.Namespace):
+    """
+    Mongo 사용자 문서로 UserModel/UserInfo를 만드는 요청당 CPU 시간 비교
+    (이전: 검증 후 model_dump로 다시 검증, 이후: 검증 없이 생성 후 바로 변환)
+    """
+    from bson import ObjectId
+
+    from schemas.users import UserInfo, UserModel
+
+    now = datetime.now()
+    document = {
+        "_id": ObjectId(),
+        "id": "r90q2bqf",
+        "name": "코코팜",
+        "auth_provider": "google",
+        "email": "bench@p.alm",
+        "service_email": "bench@p.alm",
+        "password": None,
+        "phone_number": None,
+        "is_active": True,
+        "is_superuser": False,
+        "deactivated_at": None,
+        "created_at": now,
+        "updated_at": now,
+        "urls": ["https://www.instagram.com/cocopalm/"],
+        "sex": "O",
+        "profile_image": "https://picsum.photos/200/300",
+        "bio": None,
+        "plan_expired_at": now + timedelta(days=30),
+        "using_plan": "EXPERT",
+        "auto_subscription": False,
+    }
+
+    def validated():
+        user_model = UserModel(**document)
+        return UserInfo(**user_model.model_dump())
+
+    def trusted():
+        return UserModel.from_db(document).to_info()
+
+    assert validated() == trusted()
+    before = _cpu_per_call(validated, args.iterations)
+    after = _cpu_per_call(trusted, args.iterations)
+    logging.info("validate + model_dump + validate : %.2f us/request", before * 1e6)
+    logging.info("from_db + to_info                 : %.2f us/request", after * 1e6)
+    logging.info(
+        "saved at %s req/s : %.1f ms CPU/s per worker",
+        args.rps,
+        (before - after) * args.rps * 1e3,
+    )
+
+
+async def _elapsed_ms(awaitable) -> float:
+    started_at = time.perf_counter()
+    await awaitable
+    return (time.perf_counter() - started_at) * 1000
+
+
+async def _bench_foot_prints(args: argparse.Namespace):
+    import bson
+    from pymongo import ReturnDocument
+
+    from api.db.migrations import build_foot_print_buckets
+    from api.db.persistant import mongo as db
+    from api.settings import env
+
+    # NOTE: 실제 컬렉션을 건드리지 않도록 임시 컬렉션을 사용합니다.
+    embedded = db["bench_orbit_logs_embedded"]
+    bucketed = db["bench_orbit_logs_bucketed"]
+    buckets = db["bench_foot_print_buckets"]
+    for collection in (embedded, bucketed, buckets):
+        await collection.drop()
+    await buckets.create_index(
+        [("from_user_id", 1), ("to_user_id", 1), ("updated_at", -1)]
+    )
+    await buckets.create_index(
+        [("from_user_id", 1), ("to_user_id", 1), ("bucket", 1)], unique=True
+    )
+
+    started_at = datetime.utcnow()
+    foot_prints = [
+        {
+            "id": f"{i:08d}",
+            "title": f"foot print {i}",
+            "image_url": None,
+            "updated_at": started_at + timedelta(seconds=i),
+        }
+        for i in range(args.foot_prints)
+    ]
+    query = {"from_user_id": "bench-from", "to_user_id": "bench-to"}
+    latest_foot_prints = foot_prints[::-1][: env.orbit_latest_foot_prints]
+    await embedded.insert_one({**query, "foot_prints": foot_prints})
+    await bucketed.insert_one(
+        {
+            **query,
+            "foot_print_count": len(foot_prints),
+            "foot_print_seq": 0,
+            "latest_foot_prints": latest_foot_prints,
+        }
+    )
+    await buckets.insert_many(
+        build_foot_print_buckets(
+            foot_prints=foot_prints, bucket_size=env.foot_print_bucket_size, **query
+        )
+    )
+
+    def new_foot_print(i: int) -> dict:
+        return {
+            "id": f"new-{i}",
+            "title": "new",
+            "image_url": None,
+            "updated_at": datetime.utcnow(),
+        }
+
+    async def append_embedded(i: int):
+        await embedded.update_one(query, {"$push": {"foot_prints": new_foot_print(i)}})
+
+    async def append_bucketed(i: int):
+        foot_print = new_foot_print(i)
+        orbit = await bucketed.find_one_and_update(
+            query,
+            {
+                "$push": {
+                    "latest_foot_prints": {
+                        "$each": [foot_print],
+                        "$sort": {"updated_at": -1},
+                        "$slice": env.orbit_latest_foot_prints,
+                    }
+                },
+                "$inc": {"foot_print_count": 1, "foot_print_seq": 1},
+            },
+            projection={"foot_print_seq": True},
+            return_document=ReturnDocument.AFTER,
+        )
+        bucket = (orbit["foot_print_seq"] - 1) // env.foot_print_bucket_size
+        await buckets.update_one(
+            {**query, "bucket": bucket},
+            {
+                "$push": {"foot_prints": foot_print},
+                "$inc": {"slots": 1},
+                "$min": {"first_at": foot_print["updated_at"]},
+                "$max": {"updated_at": foot_print["updated_at"]},
+            },
+            upsert=True,
+        )
+
+    results = {}
+    for name, read, append in (
+        ("embedded", lambda: embedded.find_one(query), append_embedded),
+        ("bucketed", lambda: bucketed.find_one(query), append_bucketed),
+    ):
+        reads = sorted([await _elapsed_ms(read()) for _ in range(args.iterations)])
+        appends = sorted([await _elapsed_ms(append(i)) for i in range(args.iterations)])
+        document = await read()
+        results[name] = {
+            "read_p50_ms": reads[len(reads) // 2],
+            "append_p50_ms": appends[len(appends) // 2],
+            "orbit_doc_kb": len(bson.encode(document)) / 1024,
+        }
+    for name, result in results.items():
+        logging.info(
+            "%s : read %.2f ms, append %.2f ms, orbit document %.1f KB",
+            name,
+            result["read_p50_ms"],
+            result["append_p50_ms"],
+            result["orbit_doc_kb"],
+        )
+    for collection in (embedded, bucketed, buckets):
+        await collection.drop()
+
+
+def bench_foot_prints(args: argparse.Namespace):
+    """
+    foot prints를 orbit_logs에 내장한 경우와 버킷 컬렉션으로 분리한 경우의
+    orbit 문서 조회/활동기록 추가 시간(p50), orbit 문서 크기 비교
+    """
+    asyncio.run(_bench_foot_prints(args))
+
+
+BENCHMARKS = {
+    "jwt-decode": bench_jwt_decode,
+    "foot-prints": bench_foot_prints,
+    "user-models": bench_user_models,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--rps", type=int, default=200)
+    parser.add_argument("--foot-prints", type=int, default=10000)
+    args = parser.parse_args()
+    BENCHMARKS[args.name](args)
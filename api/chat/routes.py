@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Body, status
+from fastapi import APIRouter, Body, Depends, status
 
 from api.chat import services as chat_services
 from api.messages import MESSAGES
+from api.ratelimit import CHAT_ASK_LIMIT, rate_limit
 from responses.common import custom_response
 from schemas import ResponseModel
 from schemas.chat import AskBody, AskResponse
@@ -12,6 +13,7 @@ router = APIRouter(prefix="/chat", tags=["chat"])
 @router.post(
     "/ask",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(rate_limit(CHAT_ASK_LIMIT))],
     responses={
         status.HTTP_200_OK: {
             "description": MESSAGES.CHAT_ASK_SUCCESS,
@@ -1,7 +1,46 @@
+import base64
+from datetime import datetime
 from random import choice
 from string import ascii_lowercase, digits
 
+import orjson
+
 
 def generate_hash(length: int = 16) -> str:
     """Generate a random string of given length."""
     return "".join(choice(ascii_lowercase + digits) for _ in range(length))
+
+
+def encode_cursor(*values) -> str:
+    """
+    페이지네이션 정렬 키를 클라이언트에 전달할 불투명한 커서 문자열로 변환합니다.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list | None:
+    """
+    encode_cursor로 만든 커서를 정렬 키 목록으로 되돌립니다. 잘못된 커서는 None
+    """
+    try:
+        values = orjson.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except ValueError:
+        return None
+    return values if isinstance(values, list) else None
+
+
+def decode_time_cursor(cursor: str | None) -> tuple[bool, tuple[datetime, str] | None]:
+    """
+    next_cursor를 정렬 키 (시간, id)로 변환합니다. 잘못된 커서는 (False, None)
+    """
+    if cursor is None:
+        return True, None
+    values = decode_cursor(cursor)
+    if values is None or len(values) != 2:
+        return False, None
+    try:
+        return True, (datetime.fromisoformat(values[0]), str(values[1]))
+    except (TypeError, ValueError):
+        return False, None
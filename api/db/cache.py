@@ -1,5 +1,11 @@
 # pylint: disable=C0301
+import asyncio
+import hashlib
 import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
 
 from redis.asyncio.client import Redis as RedisClient
 from redis.asyncio.client import StrictRedis
@@ -12,6 +18,10 @@ class Redis:
 
     def __init__(self):
         self.redis_ = None  # type: ignore
+        self.listeners: dict[str, Callable[[str], None]] = {}
+        self.listener_task: asyncio.Task | None = None
+        self.subscribed_callbacks: list[Callable[[], None]] = []
+        self.unsubscribed_callbacks: list[Callable[[], None]] = []
 
     async def init(self):
         redis_ = StrictRedis(
@@ -25,9 +35,15 @@ class Redis:
         logging.info("redis connection initializing")
         self.redis_ = await redis_.initialize()
         logging.info("redis connection initialized")
+        if self.listeners:
+            self.listener_task = asyncio.create_task(self._listen())
 
     async def close(self):
-        await self.redis_.close()
+        if self.listener_task:
+            self.listener_task.cancel()
+            self.listener_task = None
+        if self.redis_:
+            await self.redis_.close()
 
     def get_redis(self):
         return self.redis_
@@ -35,6 +51,137 @@ class Redis:
     def mangle_key(self, namespace, key):
         return f"{env.environment}:{namespace}:{key}"
 
+    def add_listener(self, namespace: str, callback: Callable[[str], None]):
+        """
+        pub/sub 채널을 구독합니다. init() 이전에 등록해야 합니다.
+        """
+        self.listeners[self.mangle_key("pubsub", namespace)] = callback
+
+    def add_subscription_listener(
+        self,
+        on_subscribed: Callable[[], None],
+        on_unsubscribed: Callable[[], None],
+    ):
+        """
+        pub/sub 구독(재구독)과 연결 끊김을 알려줍니다.
+        연결이 끊긴 동안 발행된 메시지는 전달되지 않으므로 구독자가 따로 복구해야 합니다.
+        """
+        self.subscribed_callbacks.append(on_subscribed)
+        self.unsubscribed_callbacks.append(on_unsubscribed)
+
+    @staticmethod
+    def _notify(callbacks: list[Callable[[], None]]):
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logging.exception("redis pubsub callback error: %s", e)
+
+    async def publish(self, namespace: str, message: str):
+        await self.redis_.publish(self.mangle_key("pubsub", namespace), message)
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self.redis_.pubsub() as pubsub:
+                    await pubsub.subscribe(*self.listeners)
+                    self._notify(self.subscribed_callbacks)
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        callback = self.listeners.get(message["channel"])
+                        if callback:
+                            callback(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.exception("redis pubsub error: %s", e)
+            self._notify(self.unsubscribed_callbacks)
+            await asyncio.sleep(1)
+
+
+class TTLCache:
+    """
+    워커(프로세스)별로 사용하는 크기 제한, 만료시간이 있는 LRU 캐시
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self.data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self.data[key]
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        ttl을 지정하면 기본 만료시간보다 짧은 경우에만 적용됩니다.
+        """
+        ttl_ = self.ttl if ttl is None else min(ttl, self.ttl)
+        self.data[key] = (time.monotonic() + ttl_, value)
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        self.data.pop(key, None)
+
+    def clear(self):
+        self.data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class BloomFilter:
+    """
+    false positive만 발생하는 확률적 집합
+
+    filter에 없다고 판단되면 실제로도 없다는 것이 보장됩니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
 
 # NOTE: 커넥션 비용을 줄이기 위해 싱글톤으로 사용
 redis = Redis()
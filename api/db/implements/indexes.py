@@ -0,0 +1,280 @@
+"""
+MongoDB 인덱스 정의
+
+서비스 시작 시(lifespan) ensure_indexes()로 생성하며, 이미 있으면 아무것도 하지 않습니다.
+
+python -m api.db.implements.indexes report   # 없는/사용되지 않는 인덱스
+python -m api.db.implements.indexes explain  # IXSCAN 사용, 메모리 정렬 여부 확인
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+
+from pymongo.errors import OperationFailure
+
+from api.db.implements.mongo import (
+    FOOT_PRINT_BUCKET_SORT,
+    PICTURE_PAGE_SORT,
+    foot_print_bucket_query,
+    orbit_info_pipeline,
+    orbit_query,
+    picture_page_query,
+    user_query,
+)
+from api.db.persistant import mongo as db
+from enums.auth import OAuthProvider
+
+
+class IndexSpec:
+    def __init__(
+        self,
+        collection: str,
+        keys: list[tuple[str, int]],
+        name: str,
+        unique: bool = False,
+        partial_filter: dict | None = None,
+    ):
+        self.collection = collection
+        self.keys = keys
+        self.name = name
+        self.unique = unique
+        self.partial_filter = partial_filter
+
+
+class QuerySpec:
+    """
+    저장소(api.db.implements.mongo)에서 사용하는 쿼리 형태, explain 확인용
+
+    pipeline이 있으면 aggregate로, 없으면 query와 sort로 find를 explain합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        collection: str,
+        query: dict | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        pipeline: list[dict] | None = None,
+    ):
+        self.name = name
+        self.collection = collection
+        self.query = query or {}
+        self.sort = sort
+        self.pipeline = pipeline
+
+    def explain_command(self) -> dict:
+        if self.pipeline is not None:
+            return {
+                "aggregate": self.collection,
+                "pipeline": self.pipeline,
+                "cursor": {},
+            }
+        command = {"find": self.collection, "filter": self.query}
+        if self.sort is not None:
+            command["sort"] = dict(self.sort)
+        return command
+
+
+INDEXES: list[IndexSpec] = [
+    IndexSpec(
+        "users",
+        [("email", 1), ("auth_provider", 1)],
+        name="email_auth_provider_unique",
+        unique=True,
+    ),
+    # NOTE: id 조회와 orbit 목록의 $lookup(name, profile_image)을 모두 처리합니다.
+    IndexSpec(
+        "users",
+        [("id", 1), ("name", 1), ("profile_image", 1)],
+        name="id_name_profile_image",
+    ),
+    # NOTE: from_user_id 단독 조회도 이 인덱스를 사용합니다. (prefix)
+    IndexSpec(
+        "orbit_logs",
+        [("from_user_id", 1), ("to_user_id", 1)],
+        name="from_user_id_to_user_id_unique",
+        unique=True,
+    ),
+    # NOTE: orbit 목록의 keyset 페이지네이션 (최근 업데이트순)
+    IndexSpec(
+        "orbit_logs",
+        [("from_user_id", 1), ("updated_at", -1), ("to_user_id", -1)],
+        name="from_user_id_updated_at_to_user_id",
+    ),
+    IndexSpec(
+        "foot_print_buckets",
+        [("from_user_id", 1), ("to_user_id", 1), ("updated_at", -1)],
+        name="from_user_id_to_user_id_updated_at",
+    ),
+    # NOTE: 버킷 번호(foot_print_seq 기준)별로 버킷은 하나만 생성됩니다.
+    IndexSpec(
+        "foot_print_buckets",
+        [("from_user_id", 1), ("to_user_id", 1), ("bucket", 1)],
+        name="from_user_id_to_user_id_bucket_unique",
+        unique=True,
+        partial_filter={"bucket": {"$exists": True}},
+    ),
+    IndexSpec("picture_meta", [("user_id", 1)], name="user_id_unique", unique=True),
+    IndexSpec("pictures", [("id", 1)], name="id_unique", unique=True),
+    # NOTE: 사진 목록의 keyset 페이지네이션 (최근 업로드순)
+    IndexSpec(
+        "pictures",
+        [("user_id", 1), ("created_at", -1), ("id", -1)],
+        name="user_id_created_at_id",
+    ),
+    IndexSpec(
+        "token_logs", [("user_id", 1), ("created_at", -1)], name="user_id_created_at"
+    ),
+]
+
+# NOTE: 저장소의 조건/정렬 함수로 만들어서 실제 쿼리와 모양이 달라지지 않도록 합니다.
+EXAMPLE_AFTER = (datetime(2024, 8, 17, 19), "k2x9d0q1")
+
+QUERIES: list[QuerySpec] = [
+    QuerySpec(
+        "get_user_by_email", "users", user_query("index@p.alm", OAuthProvider.GOOGLE)
+    ),
+    QuerySpec("keep_user_on_track", "orbit_logs", orbit_query("r90q2bqf", "k2x9d0q1")),
+    QuerySpec(
+        "get_user_orbit_info_page",
+        "orbit_logs",
+        pipeline=orbit_info_pipeline("r90q2bqf", limit=21),
+    ),
+    QuerySpec(
+        "get_user_orbit_info_page (after)",
+        "orbit_logs",
+        pipeline=orbit_info_pipeline("r90q2bqf", after=EXAMPLE_AFTER, limit=21),
+    ),
+    QuerySpec(
+        "get_foot_print_page",
+        "foot_print_buckets",
+        foot_print_bucket_query("r90q2bqf", "k2x9d0q1"),
+        sort=FOOT_PRINT_BUCKET_SORT,
+    ),
+    QuerySpec(
+        "get_foot_print_page (after)",
+        "foot_print_buckets",
+        foot_print_bucket_query("r90q2bqf", "k2x9d0q1", after=EXAMPLE_AFTER),
+        sort=FOOT_PRINT_BUCKET_SORT,
+    ),
+    QuerySpec("get_user_picture_meta", "picture_meta", {"user_id": "r90q2bqf"}),
+    QuerySpec(
+        "get_picture_page",
+        "pictures",
+        picture_page_query("r90q2bqf"),
+        sort=PICTURE_PAGE_SORT,
+    ),
+    QuerySpec(
+        "get_picture_page (after)",
+        "pictures",
+        picture_page_query("r90q2bqf", after=EXAMPLE_AFTER),
+        sort=PICTURE_PAGE_SORT,
+    ),
+    QuerySpec("update_theme", "theme", {"_id": "r90q2bqf"}),
+]
+
+
+async def ensure_indexes():
+    """
+    INDEXES에 정의된 인덱스를 생성합니다. 여러 워커가 동시에 실행해도 안전합니다.
+    """
+    for spec in INDEXES:
+        try:
+            options = {}
+            if spec.partial_filter is not None:
+                options["partialFilterExpression"] = spec.partial_filter
+            await db[spec.collection].create_index(
+                spec.keys,
+                name=spec.name,
+                unique=spec.unique,
+                **options,
+            )
+        except OperationFailure as e:
+            # NOTE: 중복 데이터가 있거나 같은 키의 다른 인덱스가 있는 경우
+            # 서비스는 시작하되 report로 확인할 수 있도록 남겨둡니다.
+            logging.exception(
+                "Error while creating index %s.%s: %s", spec.collection, spec.name, e
+            )
+
+
+async def index_report() -> dict[str, dict[str, list[str]]]:
+    """
+    컬렉션별로 정의했지만 없는(missing), 정의하지 않은(undeclared),
+    서버 시작 이후 한 번도 사용되지 않은(unused) 인덱스를 반환합니다.
+    """
+    report = {}
+    for collection in sorted({spec.collection for spec in INDEXES}):
+        declared = {spec.name for spec in INDEXES if spec.collection == collection}
+        existing = set(await db[collection].index_information())
+        unused = []
+        async for stat in db[collection].aggregate([{"$indexStats": {}}]):
+            if stat["name"] != "_id_" and stat["accesses"]["ops"] == 0:
+                unused.append(stat["name"])
+        report[collection] = {
+            "missing": sorted(declared - existing),
+            "undeclared": sorted(existing - declared - {"_id_"}),
+            "unused": sorted(unused),
+        }
+    return report
+
+
+def find_stage(plan, stage: str) -> bool:
+    """
+    실행계획에 stage(COLLSCAN, SORT 등)가 있는지 확인합니다. (rejectedPlans 제외)
+    """
+    if isinstance(plan, dict):
+        if plan.get("stage") == stage:
+            return True
+        return any(
+            find_stage(value, stage)
+            for key, value in plan.items()
+            if key != "rejectedPlans"
+        )
+    if isinstance(plan, list):
+        return any(find_stage(value, stage) for value in plan)
+    return False
+
+
+async def check_query_plans() -> dict[str, list[str]]:
+    """
+    QUERIES의 실행계획을 확인하고 COLLSCAN, 메모리 정렬(SORT)인 쿼리 이름을 반환합니다.
+    """
+    problems: dict[str, list[str]] = {"COLLSCAN": [], "SORT": []}
+    for query in QUERIES:
+        explain = await db.command(
+            "explain", query.explain_command(), verbosity="queryPlanner"
+        )
+        # NOTE: aggregate는 $cursor 단계 등 응답 구조가 달라 전체에서 찾습니다.
+        for stage, names in problems.items():
+            if find_stage(explain, stage):
+                names.append(query.name)
+    return problems
+
+
+async def main(args: argparse.Namespace) -> int:
+    await ensure_indexes()
+    if args.command == "report":
+        for collection, report in (await index_report()).items():
+            logging.info("%s: %s", collection, report)
+        return 0
+    problems = await check_query_plans()
+    for stage, names in problems.items():
+        for name in names:
+            logging.error("%s: %s", stage, name)
+    failed = {name for names in problems.values() for name in names}
+    logging.info(
+        "%s/%s queries use an index without sorting in memory",
+        len(QUERIES) - len(failed),
+        len(QUERIES),
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("command", choices=["report", "explain"])
+    sys.exit(asyncio.run(main(parser.parse_args())))
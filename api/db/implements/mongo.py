@@ -1,33 +1,73 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterable
 
+from pydantic import BaseModel
 from pymongo import ReturnDocument
+from pymongo.errors import CollectionInvalid, DuplicateKeyError, OperationFailure
 
+from api.db.implements.redis import user_cache
+from api.db.persistant import LazyDatabase
 from api.db.persistant import mongo as db
+from api.db.persistant import mongo_read_only as db_read_only
+from api.settings import env
 from enums.auth import OAuthProvider
 from enums.orbit import DistanceType
 from enums.users import Plan
 from schemas.auth import TokenLog
-from schemas.orbit import FootPrintBody, FootPrintModel, OrbitModel
-from schemas.users import PatchableUserInfo, UserInfo, UserModel
+from schemas.orbit import FootPrintBody, FootPrintModel, OrbitInfo
+from schemas.pictures import PictureModel
+from schemas.users import PatchableUserInfo, UserInfo, UserModel, UserSummary
+
+
+def model_projection(model: type[BaseModel], exclude: Iterable[str] = ()) -> dict:
+    """
+    읽기 모델(UserModel, UserSummary 등)의 필드만 가져오는 projection
+    """
+    excluded = set(exclude)
+    return {
+        "_id": False,
+        **{field: True for field in model.model_fields if field not in excluded},
+    }
+
+
+# NOTE: 캐시/인증 경로에서는 비밀번호 해시 등 캐시하지 않는 필드를 가져오지 않습니다.
+CACHED_USER_PROJECTION = model_projection(UserModel, exclude=user_cache.secret_fields)
+
+
+def user_query(email: str, auth_provider: OAuthProvider) -> dict:
+    """
+    users 컬렉션에서 사용자 한 명을 찾는 조건 (email_auth_provider_unique 인덱스)
+    """
+    return {"email": email, "auth_provider": auth_provider}
 
 
 async def get_user_by_email(
     email: str,
     auth_provider: OAuthProvider,
+    cached: bool = True,
 ) -> UserModel | None:
+    """
+    캐시에는 비밀번호 해시가 없으므로 비밀번호를 확인할 때는 cached=False로
+    항상 MongoDB에서 전체 문서를 조회합니다.
+    cached=True이면 MongoDB에서도 캐시할 필드만 가져옵니다. (password 제외)
+    """
+    if cached:
+        user_model = await user_cache.get(email, auth_provider)
+        if user_model is not None:
+            return user_model
     try:
         user_from_db = await db.users.find_one(
-            {
-                "email": email,
-                "auth_provider": auth_provider,
-            }
+            user_query(email, auth_provider),
+            projection=CACHED_USER_PROJECTION if cached else None,
         )
         if user_from_db is None:
             return None
     except Exception as e:
         raise e
-    user_model = UserModel(**user_from_db)
+    user_model = UserModel.from_db(user_from_db)
+    await user_cache.set(user_model)
     return user_model
 
 
@@ -35,61 +75,89 @@ async def get_user_by_email(
 async def add_user(
     user: UserModel,
 ) -> tuple[bool, UserModel]:
+    """
+    (email, auth_provider)에 해당하는 사용자가 없으면 생성합니다.
+
+    조회와 생성을 한 번의 요청(upsert)으로 처리하고 (생성 여부, 사용자)를 반환합니다.
+    동시에 같은 사용자가 생성되는 경우는 unique index로 하나만 남습니다.
+    """
+    user.service_email = user.email
+    document = user.model_dump()
+    query = user_query(user.email, user.auth_provider)
     try:
-        # user.email is unique
-        user_from_db = await db.users.find_one(
-            {"email": user.email, "auth_provider": user.auth_provider}
+        user_from_db = await db.users.find_one_and_update(
+            query,
+            {"$setOnInsert": document},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
+    except DuplicateKeyError:
+        # NOTE: 다른 요청이 먼저 생성한 경우
+        user_from_db = await db.users.find_one(query)
         if user_from_db is None:
-            user.service_email = user.email
-            await db.users.insert_one(user.model_dump())
-        else:
-            user = UserModel(**user_from_db)
-            logging.debug("User already exists")
-            return False, user
-    except Exception as e:
-        raise e
-    return True, user
+            raise
+    user_created = user_from_db["id"] == document["id"]
+    if not user_created:
+        logging.debug("User already exists")
+    return user_created, UserModel.from_db(user_from_db)
+
+
+# NOTE: 수정 결과는 UserInfo에 필요한 필드만 가져옵니다. (password 등 제외)
+USER_INFO_REQUIRED_FIELDS = ("id", "email", "auth_provider")
+
+
+def user_info_projection(fields: Iterable[str] | None = None) -> dict:
+    """
+    UserInfo를 만들기 위한 projection, fields를 지정하면 해당 필드만 가져옵니다.
+    가져오지 않은 필드는 UserInfo의 기본값으로 채워집니다.
+    """
+    fields_ = set(UserInfo.model_fields if fields is None else fields)
+    fields_.update(USER_INFO_REQUIRED_FIELDS)
+    if "using_plan" in fields_:
+        # NOTE: using_plan 검증에 plan_expired_at이 필요합니다.
+        fields_.add("plan_expired_at")
+    return {"_id": False, **{field: True for field in sorted(fields_)}}
 
 
 # patch user
-async def patch_user_by_email(
+async def patch_user(
     email: str,
     auth_provider: OAuthProvider,
-    user_info: PatchableUserInfo,
+    update: dict,
+    fields: Iterable[str] | None = None,
 ) -> tuple[bool, UserInfo | None]:
+    """
+    한 번의 find_one_and_update로 사용자를 수정하고 수정된 정보를 반환합니다.
+    사용자가 없거나 수정하지 못한 경우 (False, None)을 반환합니다.
+    """
     try:
-        user_from_db = await db.users.find_one(
-            {
-                "email": email,
-                "auth_provider": auth_provider,
-            }
-        )
-        if user_from_db is None:
-            return False, None
         updated_user_info = await db.users.find_one_and_update(
-            {"email": email, "auth_provider": auth_provider},
-            {"$set": user_info.model_dump(exclude_unset=True)},
+            user_query(email, auth_provider),
+            update,
+            projection=user_info_projection(fields),
             return_document=ReturnDocument.AFTER,
         )
-        print(f"updated_user_info: {updated_user_info}")
-        return True, UserInfo(**updated_user_info)
+        if updated_user_info is None:
+            return False, None
+        await user_cache.invalidate(email, auth_provider)
+        return True, UserInfo.from_db(updated_user_info)
     except Exception as e:
         logging.exception("Error while patching user: %s", e)
         return False, None
 
 
-async def get_user_by_ids(
-    user_ids: list[str],
-) -> tuple[bool, list[UserInfo]]:
-    try:
-        users_from_db = await db.users.find({"id": {"$in": user_ids}}).to_list(None)
-        if users_from_db is None:
-            return False, []
-        return True, [UserInfo(**user) for user in users_from_db]
-    except Exception as e:
-        logging.exception("Error while getting users: %s", e)
-        return False, []
+async def patch_user_by_email(
+    email: str,
+    auth_provider: OAuthProvider,
+    user_info: PatchableUserInfo,
+    fields: Iterable[str] | None = None,
+) -> tuple[bool, UserInfo | None]:
+    return await patch_user(
+        email=email,
+        auth_provider=auth_provider,
+        update={"$set": user_info.model_dump(exclude_unset=True)},
+        fields=fields,
+    )
 
 
 async def patch_user_plan(
@@ -97,64 +165,44 @@ async def patch_user_plan(
     auth_provider: OAuthProvider,
     plan: Plan,
     month: int,
+    fields: Iterable[str] | None = None,
 ) -> tuple[bool, UserInfo | None]:
-    try:
-        user_from_db = await db.users.find_one(
-            {
-                "email": email,
-                "auth_provider": auth_provider,
+    plan_expired_at = datetime.now() + timedelta(days=30 * month)
+    return await patch_user(
+        email=email,
+        auth_provider=auth_provider,
+        update={
+            "$set": {
+                "using_plan": plan,
+                "plan_expired_at": plan_expired_at,
             }
-        )
-        if user_from_db is None:
-            return False, None
-
-        plan_expired_at = datetime.now() + timedelta(days=30 * month)
-        updated_user_info = await db.users.find_one_and_update(
-            {"email": email, "auth_provider": auth_provider},
-            {
-                "$set": {
-                    "using_plan": plan,
-                    "plan_expired_at": plan_expired_at,
-                }
-            },
-            return_document=ReturnDocument.AFTER,
-        )
-        return True, UserInfo(**updated_user_info)
-    except Exception as e:
-        logging.exception("Error while patching user: %s", e)
-        return False, None
+        },
+        fields=fields,
+    )
 
 
 async def patch_user_profile_image(
     email: str,
     auth_provider: OAuthProvider,
     profile_image: str,
-):
-    try:
-        user_from_db = await db.users.find_one(
-            {
-                "email": email,
-                "auth_provider": auth_provider,
-            }
-        )
-        if user_from_db is None:
-            return False, None
-        updated_user_info = await db.users.find_one_and_update(
-            {"email": email, "auth_provider": auth_provider},
-            {"$set": {"profile_image": profile_image}},
-            return_document=ReturnDocument.AFTER,
-        )
-        return True, UserInfo(**updated_user_info)
-    except Exception as e:
-        logging.exception("Error while patching user: %s", e)
-        return False, None
+    fields: Iterable[str] | None = None,
+) -> tuple[bool, UserInfo | None]:
+    return await patch_user(
+        email=email,
+        auth_provider=auth_provider,
+        update={"$set": {"profile_image": profile_image}},
+        fields=fields,
+    )
+
+
+PICTURE_COLLECTION = "pictures"
 
 
 async def get_user_picture_meta(
     user_id: str,
 ) -> tuple[bool, dict | None]:
     try:
-        meta_from_db = await db.picture_meta.find_one(
+        meta_from_db = await db_read_only.picture_meta.find_one(
             {
                 "user_id": user_id,
             }
@@ -167,26 +215,94 @@ async def get_user_picture_meta(
         return False, None
 
 
-async def push_user_picture_id(
-    user_id: str,
-    picture_id: str,
-) -> bool:
+async def add_picture(picture: PictureModel) -> bool:
+    """
+    사진 문서를 추가하고 picture_meta의 사진 수(count)를 1 올립니다.
+
+    사진 수를 올리지 못하면 추가한 사진을 지워 사진 수와 사진 목록을 맞춥니다.
+    같은 사진(id)을 다시 추가하면 사진 수를 올리지 않고 성공으로 처리합니다.
+    """
+    try:
+        await db[PICTURE_COLLECTION].insert_one(picture.model_dump())
+    except DuplicateKeyError:
+        logging.debug("Picture already exists: %s", picture.id)
+        return True
+    except Exception as e:
+        logging.exception("Error while adding picture: %s", e)
+        return False
     try:
         await db.picture_meta.update_one(
-            {"user_id": user_id},
+            {"user_id": picture.user_id},
             {
-                "$push": {"ids": picture_id},
-                "$setOnInsert": {"user_id": user_id},
-                "$set": {"modified_at": datetime.now()},
+                "$inc": {"count": 1},
+                "$setOnInsert": {"user_id": picture.user_id},
+                "$set": {"modified_at": picture.created_at},
             },
             upsert=True,
         )
     except Exception as e:
-        logging.exception("Error while pushing user picture id: %s", e)
+        logging.exception("Error while counting picture: %s", e)
+        try:
+            await db[PICTURE_COLLECTION].delete_one({"id": picture.id})
+        except Exception as delete_error:
+            logging.exception("Error while removing picture: %s", delete_error)
         return False
     return True
 
 
+# NOTE: 사진 목록의 정렬 키 (created_at, id), 최근 업로드순
+PictureKey = tuple[datetime, str]
+
+
+PICTURE_PAGE_SORT = [("created_at", -1), ("id", -1)]
+
+
+def picture_page_query(user_id: str, after: PictureKey | None = None) -> dict:
+    """
+    after 이후(더 오래된) 사진을 찾는 조건, PICTURE_PAGE_SORT로 정렬합니다.
+    """
+    query: dict = {"user_id": user_id}
+    if after is not None:
+        created_at, picture_id = after
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": picture_id}},
+        ]
+    return query
+
+
+async def get_picture_page(
+    user_id: str,
+    limit: int,
+    after: PictureKey | None = None,
+) -> tuple[list[PictureModel], PictureKey | None]:
+    """
+    사진 한 페이지와 다음 페이지의 시작 키(없으면 None)를 반환합니다.
+    """
+    try:
+        pictures_from_db = (
+            await db_read_only[PICTURE_COLLECTION]
+            .find(picture_page_query(user_id, after), projection={"_id": False})
+            .sort(PICTURE_PAGE_SORT)
+            .limit(limit + 1)
+            .to_list(None)
+        )
+    except Exception as e:
+        logging.exception("Error while getting pictures: %s", e)
+        return [], None
+    pictures = [PictureModel.from_db(picture) for picture in pictures_from_db[:limit]]
+    if len(pictures_from_db) <= limit:
+        return pictures, None
+    return pictures, (pictures[-1].created_at, pictures[-1].id)
+
+
+def orbit_query(from_user_id: str, to_user_id: str) -> dict:
+    """
+    orbit_logs(또는 foot_print_buckets)에서 궤도 하나를 찾는 조건
+    """
+    return {"from_user_id": from_user_id, "to_user_id": to_user_id}
+
+
 async def keep_user_on_track(
     from_user_id: str,
     to_user_id: str,
@@ -195,10 +311,7 @@ async def keep_user_on_track(
     try:
         # 만약 이미 로그가 존재한다면 업데이트
         await db.orbit_logs.find_one_and_update(
-            {
-                "from_user_id": from_user_id,
-                "to_user_id": to_user_id,
-            },
+            orbit_query(from_user_id, to_user_id),
             {
                 "$set": {
                     "distance": distance,
@@ -217,32 +330,132 @@ async def kick_user_off_track(
     from_user_id: str,
     to_user_id: str,
 ) -> bool:
+    """
+    궤도에서 사용자를 제거하고 해당 궤도의 활동기록 버킷도 함께 삭제합니다.
+
+    버킷을 남겨두면 다시 등록했을 때 foot_print_seq가 1부터 시작해서
+    이전 버킷(0번)에 이어 쓰게 되고, 이전 활동기록이 다시 조회됩니다.
+    """
+    query = orbit_query(from_user_id, to_user_id)
     try:
-        await db.orbit_logs.delete_one(
-            {
-                "from_user_id": from_user_id,
-                "to_user_id": to_user_id,
-            }
-        )
+        await db.orbit_logs.delete_one(query)
+        await db[FOOT_PRINT_BUCKET_COLLECTION].delete_many(query)
     except Exception as e:
         logging.exception("Error while kicking user off track: %s", e)
         return False
     return True
 
 
-async def get_user_orbit_models(
+# NOTE: orbit 목록의 정렬 키 (updated_at, to_user_id), 최신순
+OrbitKey = tuple[datetime, str]
+
+
+def orbit_info_pipeline(
     user_id: str,
-) -> list[OrbitModel]:
-    try:
-        orbit_logs = await db.orbit_logs.find(
-            {
-                "from_user_id": user_id,
+    after: OrbitKey | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    """
+    orbit_logs와 친구의 사용자 정보(name, profile_image)를 한 번에 조회하는 aggregation
+
+    after 이후(더 오래된) 항목부터 limit개를 반환하며,
+    사용자 정보가 없는(탈퇴 등) 친구는 found가 False입니다.
+    """
+    match: dict = {"from_user_id": user_id}
+    if after is not None:
+        updated_at, to_user_id = after
+        match["$or"] = [
+            {"updated_at": {"$lt": updated_at}},
+            {"updated_at": updated_at, "to_user_id": {"$lt": to_user_id}},
+        ]
+    pipeline: list[dict] = [
+        {"$match": match},
+        {"$sort": {"updated_at": -1, "to_user_id": -1}},
+    ]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline += [
+        {
+            "$lookup": {
+                "from": "users",
+                "localField": "to_user_id",
+                "foreignField": "id",
+                # NOTE: users의 (id, name, profile_image) 인덱스만으로 처리됩니다.
+                "pipeline": [
+                    {"$project": model_projection(UserSummary, exclude=["id"])}
+                ],
+                "as": "to_user",
             }
-        ).to_list(None)
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "found": {"$gt": [{"$size": "$to_user"}, 0]},
+                "distance": 1,
+                "user_id": "$to_user_id",
+                "updated_at": 1,
+                "foot_prints": {"$ifNull": ["$latest_foot_prints", []]},
+                "foot_print_count": {"$ifNull": ["$foot_print_count", 0]},
+                "friend_name": {"$ifNull": [{"$first": "$to_user.name"}, "김앤솔"]},
+                "user_profile_image": {
+                    "$ifNull": [
+                        {"$first": "$to_user.profile_image"},
+                        f"{env.aws_cf_url}/pictures/person.png",
+                    ]
+                },
+            }
+        },
+    ]
+    return pipeline
+
+
+async def iter_user_orbit_info(
+    user_id: str,
+    after: OrbitKey | None = None,
+    limit: int | None = None,
+) -> AsyncIterator[tuple[OrbitKey, OrbitInfo | None]]:
+    """
+    (정렬 키, OrbitInfo)를 motor cursor에서 받는 대로 반환합니다.
+    사용자 정보가 없는 친구는 다음 커서를 만들 수 있도록 OrbitInfo 없이 키만 반환합니다.
+    """
+    cursor = db_read_only.orbit_logs.aggregate(
+        orbit_info_pipeline(user_id, after=after, limit=limit),
+        batchSize=env.orbit_page_batch_size,
+    )
+    async for orbit_log in cursor:
+        key = (orbit_log["updated_at"], orbit_log["user_id"])
+        if not orbit_log.pop("found"):
+            yield key, None
+            continue
+        yield key, OrbitInfo.from_db(orbit_log)
+
+
+async def get_user_orbit_info_page(
+    user_id: str,
+    limit: int,
+    after: OrbitKey | None = None,
+) -> tuple[list[OrbitInfo], OrbitKey | None]:
+    """
+    orbit 목록 한 페이지와 다음 페이지의 시작 키(없으면 None)를 반환합니다.
+    """
+    orbit_info_list: list[OrbitInfo] = []
+    last_key: OrbitKey | None = None
+    count = 0
+    try:
+        # NOTE: 다음 페이지가 있는지 확인하기 위해 하나 더 조회
+        async for key, orbit_info in iter_user_orbit_info(user_id, after, limit + 1):
+            count += 1
+            if count > limit:
+                return orbit_info_list, last_key
+            last_key = key
+            if orbit_info is not None:
+                orbit_info_list.append(orbit_info)
     except Exception as e:
         logging.exception("Error while getting user orbit logs: %s", e)
-        return []
-    return [OrbitModel(**orbit_log) for orbit_log in orbit_logs]
+    return orbit_info_list, None
+
+
+FOOT_PRINT_BUCKET_COLLECTION = "foot_print_buckets"
 
 
 async def add_foot_print(
@@ -250,46 +463,148 @@ async def add_foot_print(
     to_user_id: str,
     foot_print: FootPrintBody,
 ) -> bool:
-    try:
-        await db.orbit_logs.find_one_and_update(
-            {
-                "from_user_id": from_user_id,
-                "to_user_id": to_user_id,
-            },
-            {
-                # insert foot print
-                "$push": {
-                    "foot_prints": FootPrintModel(
-                        **foot_print.model_dump()
-                    ).model_dump(),
-                },
+    """
+    활동기록을 foot_print_buckets에 추가하고, orbit_logs에는 개수와 최근 활동기록만
+    갱신합니다.
+
+    버킷 번호는 orbit_logs의 foot_print_seq(삭제되어도 줄어들지 않음)로 정하므로
+    동시에 추가되어도 버킷 하나에는 foot_print_bucket_size개까지만 들어갑니다.
+    궤도에 등록되지 않은 사용자이면 저장하지 않고 False를 반환합니다.
+    """
+    foot_print_ = FootPrintModel(**foot_print.model_dump()).model_dump()
+    orbit_log = await db.orbit_logs.find_one_and_update(
+        orbit_query(from_user_id, to_user_id),
+        {
+            "$push": {
+                "latest_foot_prints": {
+                    "$each": [foot_print_],
+                    "$sort": {"updated_at": -1},
+                    "$slice": env.orbit_latest_foot_prints,
+                }
             },
-            upsert=True,
-        )
-    except Exception as e:
-        logging.exception("Error while adding foot print: %s", e)
+            "$inc": {"foot_print_count": 1, "foot_print_seq": 1},
+        },
+        projection={"_id": False, "foot_print_seq": True},
+        return_document=ReturnDocument.AFTER,
+    )
+    if orbit_log is None:
+        # NOTE: 궤도에 등록되지 않은 사용자에게는 활동기록을 남기지 않습니다.
         return False
+    bucket_query = {
+        **orbit_query(from_user_id, to_user_id),
+        "bucket": (orbit_log["foot_print_seq"] - 1) // env.foot_print_bucket_size,
+    }
+    bucket_update = {
+        "$push": {"foot_prints": foot_print_},
+        "$inc": {"slots": 1},
+        "$min": {"first_at": foot_print_["updated_at"]},
+        "$max": {"updated_at": foot_print_["updated_at"]},
+    }
+    try:
+        await db[FOOT_PRINT_BUCKET_COLLECTION].update_one(
+            bucket_query, bucket_update, upsert=True
+        )
+    except DuplicateKeyError:
+        # NOTE: 같은 버킷을 동시에 만든 경우, 먼저 만들어진 버킷에 추가합니다.
+        await db[FOOT_PRINT_BUCKET_COLLECTION].update_one(bucket_query, bucket_update)
     return True
 
 
+# NOTE: 활동기록 목록의 정렬 키 (updated_at, id), 최신순
+FootPrintKey = tuple[datetime, str]
+
+
+def foot_print_key(foot_print: dict) -> FootPrintKey:
+    return (foot_print["updated_at"], foot_print["id"])
+
+
+FOOT_PRINT_BUCKET_SORT = [("updated_at", -1)]
+
+
+def foot_print_bucket_query(
+    from_user_id: str,
+    to_user_id: str,
+    after: FootPrintKey | None = None,
+) -> dict:
+    """
+    after보다 오래된 활동기록이 있을 수 있는 버킷을 찾는 조건,
+    FOOT_PRINT_BUCKET_SORT로 정렬합니다.
+    """
+    query = orbit_query(from_user_id, to_user_id)
+    if after is not None:
+        # NOTE: after보다 오래된 활동기록이 없는 버킷은 건너뜁니다.
+        query["first_at"] = {"$lte": after[0]}
+    return query
+
+
+async def find_newest_foot_prints(
+    database: LazyDatabase,
+    from_user_id: str,
+    to_user_id: str,
+    count: int,
+    after: FootPrintKey | None = None,
+) -> list[dict]:
+    """
+    최근 활동기록 count개를 최신순으로 반환합니다. (after가 있으면 after보다 오래된 것만)
+
+    동시에 추가된 버킷끼리는 시간 범위가 겹칠 수 있으므로, 다음 버킷의
+    updated_at(버킷 안의 가장 최근 시간)이 지금까지 모은 count번째보다 오래되었을
+    때만 읽기를 멈춥니다.
+    """
+    foot_prints: list[dict] = []
+    cursor = (
+        database[FOOT_PRINT_BUCKET_COLLECTION]
+        .find(
+            foot_print_bucket_query(from_user_id, to_user_id, after),
+            projection={"_id": False, "updated_at": True, "foot_prints": True},
+        )
+        .sort(FOOT_PRINT_BUCKET_SORT)
+    )
+    async for bucket in cursor:
+        if (
+            len(foot_prints) >= count
+            and bucket["updated_at"] < foot_prints[count - 1]["updated_at"]
+        ):
+            break
+        foot_prints.extend(
+            foot_print
+            for foot_print in bucket["foot_prints"]
+            if after is None or foot_print_key(foot_print) < after
+        )
+        foot_prints.sort(key=foot_print_key, reverse=True)
+        del foot_prints[count:]
+    return foot_prints
+
+
+async def get_latest_foot_prints(
+    from_user_id: str,
+    to_user_id: str,
+    limit: int,
+) -> list[dict]:
+    return await find_newest_foot_prints(db, from_user_id, to_user_id, limit)
+
+
 async def remove_foot_print(
     from_user_id: str,
     to_user_id: str,
     foot_print_id: str,
 ) -> bool:
     try:
-        await db.orbit_logs.find_one_and_update(
-            {
-                "from_user_id": from_user_id,
-                "to_user_id": to_user_id,
-            },
+        result = await db[FOOT_PRINT_BUCKET_COLLECTION].update_one(
+            {**orbit_query(from_user_id, to_user_id), "foot_prints.id": foot_print_id},
+            {"$pull": {"foot_prints": {"id": foot_print_id}}},
+        )
+        if result.modified_count == 0:
+            return False
+        # NOTE: 최근 활동기록이 삭제되었을 수 있으므로 버킷에서 다시 채웁니다.
+        latest_foot_prints = await get_latest_foot_prints(
+            from_user_id, to_user_id, env.orbit_latest_foot_prints
+        )
+        await db.orbit_logs.update_one(
+            orbit_query(from_user_id, to_user_id),
             {
-                # remove foot print
-                "$pull": {
-                    "foot_prints": {
-                        "id": foot_print_id,
-                    }
-                },
+                "$set": {"latest_foot_prints": latest_foot_prints},
+                "$inc": {"foot_print_count": -1},
             },
         )
     except Exception as e:
@@ -298,12 +613,166 @@ async def remove_foot_print(
     return True
 
 
-async def add_token_log(payload: TokenLog):
+async def get_foot_print_page(
+    from_user_id: str,
+    to_user_id: str,
+    limit: int,
+    after: FootPrintKey | None = None,
+) -> tuple[list[FootPrintModel], FootPrintKey | None]:
+    """
+    활동기록 한 페이지와 다음 페이지의 시작 키(없으면 None)를 반환합니다.
+    """
     try:
-        await db.token_logs.insert_one(payload.model_dump())
+        # NOTE: 다음 페이지가 있는지 확인하기 위해 하나 더 조회
+        foot_prints_from_db = await find_newest_foot_prints(
+            db_read_only, from_user_id, to_user_id, limit + 1, after
+        )
     except Exception as e:
-        raise e
-    return True
+        logging.exception("Error while getting foot prints: %s", e)
+        return [], None
+    foot_prints = [
+        FootPrintModel.from_db(foot_print) for foot_print in foot_prints_from_db
+    ]
+    if len(foot_prints) <= limit:
+        return foot_prints, None
+    last = foot_prints[limit - 1]
+    return foot_prints[:limit], (last.updated_at, last.id)
+
+
+TOKEN_LOG_COLLECTION = "token_logs"
+LEGACY_TOKEN_LOG_COLLECTION = "token_logs_legacy"
+
+
+async def ensure_token_log_collection():
+    """
+    token_logs를 TTL이 있는 time-series 컬렉션으로 준비합니다.
+
+    기존에 일반 컬렉션으로 만들어진 token_logs가 있다면 token_logs_legacy로
+    이름을 바꿔두고, 데이터는 api.db.migrations의 token-logs로 옮깁니다.
+    여러 워커가 동시에 실행해도 안전합니다.
+    """
+    ttl = env.token_log_ttl_days * 24 * 60 * 60
+    infos = await (
+        await db.list_collections(filter={"name": TOKEN_LOG_COLLECTION})
+    ).to_list(None)
+    info = infos[0] if infos else None
+    if info is not None and info.get("type") == "timeseries":
+        if info["options"].get("expireAfterSeconds") != ttl:
+            await db.command("collMod", TOKEN_LOG_COLLECTION, expireAfterSeconds=ttl)
+        return
+    if info is not None:
+        try:
+            await db[TOKEN_LOG_COLLECTION].rename(LEGACY_TOKEN_LOG_COLLECTION)
+            logging.info("token_logs renamed to %s", LEGACY_TOKEN_LOG_COLLECTION)
+        except OperationFailure as e:
+            logging.warning("token_logs rename skipped: %s", e)
+    try:
+        await db.create_collection(
+            TOKEN_LOG_COLLECTION,
+            timeseries={
+                "timeField": "created_at",
+                "metaField": "user_id",
+                "granularity": "minutes",
+            },
+            expireAfterSeconds=ttl,
+        )
+    except (CollectionInvalid, OperationFailure) as e:
+        logging.info("token_logs already created: %s", e)
+
+
+class TokenLogWriter:
+    """
+    token_logs 저장을 응답 이후로 미루는 write-behind 로거
+
+    워커별 큐에 쌓아두었다가 batch_size개가 모이거나 flush_seconds가 지나면
+    insert_many로 한 번에 저장합니다. MongoDB가 느려 큐가 가득 차면
+    기다리지 않고 버린 뒤 dropped를 증가시킵니다.
+    """
+
+    def __init__(self, queue_size: int, batch_size: int, flush_seconds: float):
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.task: asyncio.Task | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def put(self, payload: TokenLog) -> bool:
+        try:
+            self.queue.put_nowait(payload.model_dump())
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        return True
+
+    async def _collect(self) -> list[dict]:
+        loop = asyncio.get_running_loop()
+        documents = [await self.queue.get()]
+        deadline = loop.time() + self.flush_seconds
+        while len(documents) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                documents.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return documents
+
+    async def _flush(self, documents: list[dict]):
+        try:
+            await db[TOKEN_LOG_COLLECTION].insert_many(documents, ordered=False)
+            self.written += len(documents)
+        except Exception as e:
+            self.failed += len(documents)
+            logging.exception("Error while writing token logs: %s", e)
+        finally:
+            for _ in documents:
+                self.queue.task_done()
+
+    async def _run(self):
+        while True:
+            documents = await self._collect()
+            await self._flush(documents)
+
+    async def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10):
+        """
+        큐에 남은 로그를 모두 저장한 뒤 종료합니다.
+        """
+        if self.task is None:
+            return
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logging.warning("token logs left unwritten: %s", self.queue.qsize())
+        self.task.cancel()
+        self.task = None
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+token_log_writer = TokenLogWriter(
+    queue_size=env.token_log_queue_size,
+    batch_size=env.token_log_batch_size,
+    flush_seconds=env.token_log_flush_seconds,
+)
+
+
+async def add_token_log(payload: TokenLog) -> bool:
+    """
+    토큰 로그를 큐에 넣고 바로 반환합니다. 실제 저장은 TokenLogWriter가 합니다.
+    """
+    return token_log_writer.put(payload)
 
 
 async def ping():
@@ -1,43 +1,336 @@
+import asyncio
 import logging
+import time
 from datetime import timedelta
 
-from api.db.cache import Redis
+import orjson
+
+from api.db.cache import BloomFilter, Redis, TTLCache
+from api.db.cache import redis as cache
 from api.errors import BlacklistTokenError
 from api.settings import env
+from enums.auth import OAuthProvider
 from schemas.auth import GrantType
+from schemas.users import UserModel
 
 
 class AuthManager:
+    """
+    토큰 폐기(블랙리스트) 관리
+
+    토큰 문자열 대신 jti를 키로 사용하고, 사용자의 모든 토큰을 한 번에 폐기할 때는
+    사용자 단위 키에 폐기 시점을 기록합니다.
+    """
+
     def __init__(self, redis: Redis):
         self.core = redis
 
-    async def add_token_to_blacklist(self, token, grant_type: GrantType) -> bool:
-        key = self.core.mangle_key("blacklist", token)
+    @staticmethod
+    def subject_id(email: str, auth_provider: OAuthProvider | str) -> str:
+        auth_provider_ = getattr(auth_provider, "value", auth_provider)
+        return f"user:{auth_provider_}:{email}"
+
+    async def _add_to_blacklist(self, token_id: str, value: str, ex: timedelta | int):
+        key = self.core.mangle_key("blacklist", token_id)
+        blacklist_filter.add(token_id)
+        redis = self.core.get_redis()
+        await redis.set(name=key, value=value, ex=ex)
+        try:
+            await self.core.publish(BlacklistFilter.namespace, token_id)
+        except Exception as e:
+            logging.exception("Error while publishing blacklisted token: %s", e)
+
+    async def add_token_to_blacklist(
+        self,
+        token_id: str,
+        grant_type: GrantType,
+        expires_at: int | None = None,
+    ) -> bool:
+        """
+        expires_at(토큰의 exp)을 전달하면 토큰이 만료될 때까지만 보관합니다.
+        """
         if grant_type == GrantType.ACCESS_TOKEN:
-            try:
-                redis = self.core.get_redis()
-                await redis.set(
-                    name=key,
-                    value="access_token",
-                    ex=timedelta(minutes=env.app_access_token_expire_minutes),
-                )
-            except BlacklistTokenError as e:
-                logging.exception(e)
-                return False
+            ex = timedelta(minutes=env.app_access_token_expire_minutes)
         else:
-            try:
-                redis = self.core.get_redis()
-                await redis.set(
-                    name=key,
-                    value="refresh_token",
-                    ex=timedelta(minutes=env.app_refresh_token_expire_minutes),
-                )
-            except BlacklistTokenError as e:
-                logging.exception(e)
-                return False
+            ex = timedelta(minutes=env.app_refresh_token_expire_minutes)
+        if expires_at is not None:
+            ex = max(1, expires_at - int(time.time()))
+        try:
+            await self._add_to_blacklist(token_id, grant_type.value, ex)
+        except BlacklistTokenError as e:
+            logging.exception(e)
+            return False
+        return True
+
+    async def revoke_user_tokens(
+        self, email: str, auth_provider: OAuthProvider
+    ) -> bool:
+        """
+        지금까지 발급된 사용자의 모든 토큰을 폐기합니다.
+        """
+        try:
+            await self._add_to_blacklist(
+                self.subject_id(email, auth_provider),
+                str(int(time.time() * 1000)),
+                timedelta(minutes=env.app_refresh_token_expire_minutes),
+            )
+        except BlacklistTokenError as e:
+            logging.exception(e)
+            return False
+        return True
+
+    @staticmethod
+    def revoked_at_ms(value: str) -> int:
+        """
+        사용자 단위 폐기 시점 (ms), 이전에 초 단위로 저장된 값도 ms로 변환합니다.
+        """
+        revoked_at = int(value)
+        if revoked_at < 10**12:
+            return revoked_at * 1000
+        return revoked_at
+
+    async def is_token_in_blacklist(
+        self,
+        token_id: str,
+        subject: str | None = None,
+        issued_at_ms: int = 0,
+    ) -> bool:
+        candidates = [
+            candidate
+            for candidate in (token_id, subject)
+            if candidate and blacklist_filter.might_contain(candidate)
+        ]
+        if not candidates:
+            return False
+        redis = self.core.get_redis()
+        values = await redis.mget(
+            [self.core.mangle_key("blacklist", candidate) for candidate in candidates]
+        )
+        for candidate, value in zip(candidates, values):
+            if value is None:
+                continue
+            if candidate != subject:
+                return True
+            # NOTE: 사용자 단위 폐기 시점 이전에 발급된 토큰만 폐기
+            if issued_at_ms < self.revoked_at_ms(value):
+                return True
+        return False
+
+
+class UserCache:
+    """
+    get_user_by_email 조회 결과를 위한 2단계 캐시
+
+    워커별 LRU -> Redis -> MongoDB 순서로 조회하고,
+    사용자 정보가 수정되면 pub/sub으로 모든 워커의 LRU에서 제거합니다.
+    비밀번호 해시 등 secret_fields는 캐시에 저장하지 않습니다. (None으로 조회됨)
+    """
+
+    namespace = "user"
+    secret_fields = {"password"}
+
+    def __init__(self, redis: Redis):
+        self.core = redis
+        self.local = TTLCache(
+            maxsize=env.user_cache_size,
+            ttl=env.user_cache_ttl_seconds,
+        )
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.core.add_listener(self.namespace, self.local.pop)
+
+    @staticmethod
+    def make_key(email: str, auth_provider: OAuthProvider) -> str:
+        return f"{OAuthProvider(auth_provider).value}:{email}"
+
+    async def get(self, email: str, auth_provider: OAuthProvider) -> UserModel | None:
+        key = self.make_key(email, auth_provider)
+        user_model = self.local.get(key)
+        if user_model is not None:
+            return user_model
+        redis = self.core.get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(self.core.mangle_key(self.namespace, key))
+        except Exception as e:
+            logging.exception("Error while reading user cache: %s", e)
+            return None
+        if raw is None:
+            self.redis_misses += 1
+            return None
+        self.redis_hits += 1
+        # NOTE: 캐시에는 검증된 모델만 저장하므로 검증 없이 만듭니다.
+        user_model = UserModel.from_cache(orjson.loads(raw))
+        self.local.set(key, user_model)
+        return user_model
+
+    async def set(self, user_model: UserModel):
+        key = self.make_key(user_model.email, user_model.auth_provider)
+        user_model = user_model.model_copy(
+            update={field: None for field in self.secret_fields}
+        )
+        self.local.set(key, user_model)
+        redis = self.core.get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                name=self.core.mangle_key(self.namespace, key),
+                value=user_model.model_dump_json(exclude=self.secret_fields),
+                ex=env.user_cache_redis_ttl_seconds,
+            )
+        except Exception as e:
+            logging.exception("Error while writing user cache: %s", e)
+
+    async def invalidate(self, email: str, auth_provider: OAuthProvider):
+        key = self.make_key(email, auth_provider)
+        self.local.pop(key)
+        redis = self.core.get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(self.core.mangle_key(self.namespace, key))
+            await self.core.publish(self.namespace, key)
+        except Exception as e:
+            logging.exception("Error while invalidating user cache: %s", e)
+
+    def stats(self) -> dict:
+        return {
+            **self.local.stats(),
+            "redis_hits": self.redis_hits,
+            "redis_misses": self.redis_misses,
+        }
+
+
+# NOTE: 워커마다 하나의 LRU를 공유하기 위해 싱글톤으로 사용
+user_cache = UserCache(cache)
+
+
+class BlacklistFilter:
+    """
+    블랙리스트에 등록된 토큰 ID(jti, 사용자 단위 키)의 워커별 Bloom filter
+
+    filter에 없는 토큰은 블랙리스트가 아님이 확실하므로 Redis를 조회하지 않습니다.
+    새로 등록된 토큰은 pub/sub으로 전달받고, 만료된 토큰을 덜어내기 위해
+    주기적으로 Redis의 블랙리스트 키를 스캔해서 filter를 다시 만듭니다.
+
+    pub/sub 연결이 끊기면 그동안의 메시지를 놓칠 수 있으므로 filter를 버리고
+    (모든 토큰을 Redis에서 확인) 다시 구독되면 바로 filter를 새로 만듭니다.
+    """
+
+    namespace = "blacklist"
+
+    def __init__(self, redis: Redis):
+        self.core = redis
+        # NOTE: 첫 rebuild 전에는 모든 토큰을 Redis에서 확인합니다.
+        self.filter: BloomFilter | None = None
+        # NOTE: 진행 중인 rebuild마다 스캔하는 동안 전달받은 토큰을 따로 모아둡니다.
+        self.pending: list[list[str]] = []
+        # NOTE: 주기적 rebuild와 재구독 rebuild가 동시에 filter를 바꾸지 않도록
+        self.rebuild_lock = asyncio.Lock()
+        self.rebuild_task: asyncio.Task | None = None
+        self.resubscribe_task: asyncio.Task | None = None
+        # NOTE: pub/sub을 구독 중일 때 만든 filter만 사용합니다.
+        # 연결이 끊길 때마다 generation이 증가하고, 그 전에 시작한 rebuild 결과는 버립니다.
+        self.subscribed = False
+        self.generation = 0
+        self.checks = 0
+        self.filter_hits = 0
+        self.core.add_listener(self.namespace, self.add)
+        self.core.add_subscription_listener(self.on_subscribed, self.on_unsubscribed)
+
+    def on_subscribed(self):
+        self.subscribed = True
+        if self.resubscribe_task is None or self.resubscribe_task.done():
+            self.resubscribe_task = asyncio.create_task(self._rebuild_once())
+
+    def on_unsubscribed(self):
+        logging.warning("blacklist filter disabled until pub/sub is resubscribed")
+        self.subscribed = False
+        self.generation += 1
+        self.filter = None
+
+    def add(self, token_id: str):
+        if self.filter is not None:
+            self.filter.add(token_id)
+        for pending in self.pending:
+            pending.append(token_id)
+
+    def might_contain(self, token_id: str) -> bool:
+        self.checks += 1
+        if self.filter is not None and token_id not in self.filter:
+            return False
+        self.filter_hits += 1
         return True
 
-    async def is_token_in_blacklist(self, token) -> bool:
-        key = self.core.mangle_key("blacklist", token)
+    async def rebuild(self):
+        async with self.rebuild_lock:
+            await self._rebuild()
+
+    async def _rebuild(self):
         redis = self.core.get_redis()
-        return await redis.exists(key)
+        prefix = self.core.mangle_key(self.namespace, "")
+        generation = self.generation
+        pending: list[str] = []
+        self.pending.append(pending)
+        try:
+            token_ids = [
+                key[len(prefix) :]
+                async for key in redis.scan_iter(match=f"{prefix}*", count=1000)
+            ]
+            token_ids.extend(pending)
+            new_filter = BloomFilter(
+                capacity=max(env.blacklist_filter_capacity, len(token_ids) * 2),
+                error_rate=env.blacklist_filter_error_rate,
+            )
+            for token_id in token_ids:
+                new_filter.add(token_id)
+            if generation != self.generation or not self.subscribed:
+                logging.info("blacklist filter rebuild discarded (pub/sub not ready)")
+                return
+            self.filter = new_filter
+        finally:
+            self.pending.remove(pending)
+        logging.info("blacklist filter rebuilt: %s tokens", new_filter.count)
+
+    async def _rebuild_once(self):
+        try:
+            await self.rebuild()
+        except Exception as e:
+            # NOTE: 실패하면 다음 주기적 rebuild까지 filter 없이 Redis에서 확인합니다.
+            logging.exception("Error while rebuilding blacklist filter: %s", e)
+
+    async def _rebuild_forever(self):
+        while True:
+            try:
+                await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # NOTE: 실패하면 기존 filter를 그대로 사용합니다.
+                logging.exception("Error while rebuilding blacklist filter: %s", e)
+            await asyncio.sleep(env.blacklist_filter_rebuild_seconds)
+
+    async def start(self):
+        self.rebuild_task = asyncio.create_task(self._rebuild_forever())
+
+    async def stop(self):
+        if self.rebuild_task:
+            self.rebuild_task.cancel()
+            self.rebuild_task = None
+        if self.resubscribe_task:
+            self.resubscribe_task.cancel()
+            self.resubscribe_task = None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.filter is not None,
+            "subscribed": self.subscribed,
+            "tokens": self.filter.count if self.filter else 0,
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+        }
+
+
+blacklist_filter = BlacklistFilter(cache)
@@ -0,0 +1,297 @@
+"""
+데이터 마이그레이션
+
+python -m api.db.migrations token-logs
+python -m api.db.migrations foot-prints
+python -m api.db.migrations pictures
+"""
+
+import argparse
+import asyncio
+import logging
+import mimetypes
+from datetime import datetime, timedelta
+
+from enums.auth import EVENT_TYPE_MAP, GRANT_TYPE_MAP, EventType, GrantType
+
+logging.basicConfig(level=logging.INFO)
+
+BATCH_SIZE = 1000
+
+
+def _to_datetime(value) -> datetime | None:
+    """
+    "%Y-%m-%d %H:%M:%S" 문자열로 저장된 이전 시간 값을 datetime으로 변환합니다.
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _to_code(value, enum, code_map: dict) -> int | None:
+    if isinstance(value, int):
+        return value
+    try:
+        return code_map[enum(value)]
+    except ValueError:
+        return None
+
+
+def _to_token_id(document: dict, field: str) -> str | None:
+    import jwt
+
+    from api.jwt import get_token_id
+
+    if document.get(f"{field}_id"):
+        return document[f"{field}_id"]
+    if document.get(field):
+        # NOTE: 전체 토큰 대신 jti(없으면 해시)만 남깁니다.
+        try:
+            return get_token_id(document[field])
+        except jwt.PyJWTError:
+            # NOTE: 형식이 잘못된 토큰 하나로 마이그레이션이 중단되지 않도록 해시를 사용
+            return get_token_id(document[field], payload={})
+    return None
+
+
+def convert_token_log(document: dict) -> dict | None:
+    """
+    token_logs_legacy 문서를 time-series 문서로 변환합니다.
+    시간 정보가 없어 변환할 수 없는 문서는 None을 반환합니다.
+    """
+    created_at = _to_datetime(document.get("created_at"))
+    blacklisted_at = _to_datetime(document.get("blacklisted_at"))
+    # NOTE: blacklisted_at은 이벤트 발생 시점(created_at)으로 합쳐졌습니다.
+    created_at = created_at or blacklisted_at
+    if created_at is None:
+        return None
+    return {
+        "user_id": document.get("user_id"),
+        "event_type": _to_code(document.get("event_type"), EventType, EVENT_TYPE_MAP),
+        "grant_type": _to_code(document.get("grant_type"), GrantType, GRANT_TYPE_MAP),
+        "access_token_id": _to_token_id(document, "access_token"),
+        "refresh_token_id": _to_token_id(document, "refresh_token"),
+        "created_at": created_at,
+        "expired_at": _to_datetime(document.get("expired_at")),
+    }
+
+
+async def migrate_token_logs(args: argparse.Namespace):
+    """
+    token_logs_legacy 컬렉션을 time-series token_logs 컬렉션으로 옮깁니다.
+    TTL 기간이 지난 로그는 옮기지 않고, 완료 후 legacy 컬렉션을 삭제합니다.
+    """
+    from api.db.implements.mongo import (
+        LEGACY_TOKEN_LOG_COLLECTION,
+        TOKEN_LOG_COLLECTION,
+        ensure_token_log_collection,
+    )
+    from api.db.persistant import mongo as db
+    from api.settings import env
+
+    await ensure_token_log_collection()
+    expired_before = datetime.utcnow() - timedelta(days=env.token_log_ttl_days)
+    migrated, skipped = 0, 0
+    batch: list[dict] = []
+    async for document in db[LEGACY_TOKEN_LOG_COLLECTION].find({}):
+        converted = convert_token_log(document)
+        if converted is None or converted["created_at"] < expired_before:
+            skipped += 1
+            continue
+        batch.append(converted)
+        if len(batch) >= args.batch_size:
+            await db[TOKEN_LOG_COLLECTION].insert_many(batch, ordered=False)
+            migrated += len(batch)
+            batch = []
+    if batch:
+        await db[TOKEN_LOG_COLLECTION].insert_many(batch, ordered=False)
+        migrated += len(batch)
+    logging.info("token_logs migrated: %s, skipped: %s", migrated, skipped)
+    if not args.keep_legacy:
+        await db.drop_collection(LEGACY_TOKEN_LOG_COLLECTION)
+        logging.info("%s dropped", LEGACY_TOKEN_LOG_COLLECTION)
+
+
+def build_foot_print_buckets(
+    from_user_id: str,
+    to_user_id: str,
+    foot_prints: list[dict],
+    bucket_size: int,
+) -> list[dict]:
+    """
+    orbit_logs에 내장된 foot_prints 배열을 시간순으로 나눠 버킷 문서로 만듭니다.
+
+    이전 활동기록 버킷은 음수 번호(-N ~ -1)를 사용하므로 foot_print_seq로 번호를
+    정하는 새 버킷(0부터)과 겹치지 않고, 다시 만들어도 같은 번호가 됩니다.
+    """
+    foot_prints = sorted(foot_prints, key=lambda foot_print: foot_print["updated_at"])
+    chunks = [
+        foot_prints[i : i + bucket_size]
+        for i in range(0, len(foot_prints), bucket_size)
+    ]
+    return [
+        {
+            "from_user_id": from_user_id,
+            "to_user_id": to_user_id,
+            "bucket": i - len(chunks),
+            "slots": len(chunk),
+            "first_at": chunk[0]["updated_at"],
+            "updated_at": chunk[-1]["updated_at"],
+            "foot_prints": chunk,
+        }
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+async def migrate_foot_prints(args: argparse.Namespace):
+    """
+    orbit_logs.foot_prints 배열을 foot_print_buckets 컬렉션으로 옮기고
+    orbit_logs에는 개수(foot_print_count)와 최근 활동기록만 남깁니다.
+
+    - 옮긴 궤도는 foot_prints_migrated로 표시하고 다시 옮기지 않습니다.
+      (--keep-legacy로 배열을 남겨도 두 번 옮기지 않습니다)
+    - 버킷은 번호로 덮어쓰므로 중간에 중단된 뒤 다시 실행해도 중복되지 않습니다.
+    - 배포 후 이미 추가된 활동기록(버킷, 개수, 최근 활동기록)은 그대로 두고 합칩니다.
+    """
+    from pymongo import ReplaceOne
+
+    from api.db.implements.indexes import ensure_indexes
+    from api.db.implements.mongo import FOOT_PRINT_BUCKET_COLLECTION
+    from api.db.persistant import mongo as db
+    from api.settings import env
+
+    await ensure_indexes()
+    migrated, foot_print_count = 0, 0
+    async for orbit_log in db.orbit_logs.find(
+        {"foot_prints": {"$exists": True}, "foot_prints_migrated": {"$ne": True}}
+    ):
+        foot_prints = [
+            foot_print
+            for foot_print in orbit_log["foot_prints"]
+            if foot_print.get("updated_at") is not None
+        ]
+        query = {
+            "from_user_id": orbit_log["from_user_id"],
+            "to_user_id": orbit_log["to_user_id"],
+        }
+        buckets = build_foot_print_buckets(
+            bucket_size=env.foot_print_bucket_size,
+            foot_prints=foot_prints,
+            **query,
+        )
+        if buckets:
+            await db[FOOT_PRINT_BUCKET_COLLECTION].bulk_write(
+                [
+                    ReplaceOne(
+                        {**query, "bucket": bucket["bucket"]}, bucket, upsert=True
+                    )
+                    for bucket in buckets
+                ],
+                ordered=False,
+            )
+        update: dict = {
+            "$push": {
+                "latest_foot_prints": {
+                    "$each": foot_prints,
+                    "$sort": {"updated_at": -1},
+                    "$slice": env.orbit_latest_foot_prints,
+                }
+            },
+            "$inc": {"foot_print_count": len(foot_prints)},
+            "$set": {"foot_prints_migrated": True},
+        }
+        if not args.keep_legacy:
+            update["$unset"] = {"foot_prints": ""}
+        # NOTE: 개수, 최근 활동기록, 완료 표시를 한 번에 갱신합니다.
+        result = await db.orbit_logs.update_one(
+            {"_id": orbit_log["_id"], "foot_prints_migrated": {"$ne": True}}, update
+        )
+        if result.modified_count:
+            migrated += 1
+            foot_print_count += len(foot_prints)
+    logging.info("orbit_logs migrated: %s, foot prints: %s", migrated, foot_print_count)
+
+
+def build_pictures(picture_meta: dict) -> list[dict]:
+    """
+    picture_meta.ids 배열을 pictures 문서 목록으로 변환합니다.
+
+    이전 배열에는 업로드 시간이 없으므로 마지막 사진을 modified_at으로 두고
+    배열 순서대로 1ms씩 앞당겨 업로드 순서만 유지합니다.
+    """
+    ids = picture_meta.get("ids") or []
+    modified_at = _to_datetime(picture_meta.get("modified_at")) or datetime.utcnow()
+    return [
+        {
+            "id": picture_id,
+            "user_id": picture_meta["user_id"],
+            "created_at": modified_at - timedelta(milliseconds=len(ids) - 1 - i),
+            "size": None,
+            "content_type": mimetypes.guess_type(picture_id)[0],
+            "variants": ["original"],
+        }
+        for i, picture_id in enumerate(ids)
+    ]
+
+
+async def migrate_pictures(args: argparse.Namespace):
+    """
+    picture_meta.ids 배열을 사진별 pictures 문서로 옮기고
+    picture_meta에는 사진 수(count)만 남깁니다.
+
+    이미 옮긴 사진은 다시 추가하지 않으므로 여러 번 실행해도 안전합니다.
+    사진 수는 새로 추가된 사진 수만큼 $inc로 더하므로, 실행 중에 add_picture가
+    올린 사진 수와 겹치거나 덮어쓰지 않습니다.
+    """
+    from pymongo import UpdateOne
+
+    from api.db.implements.indexes import ensure_indexes
+    from api.db.implements.mongo import PICTURE_COLLECTION
+    from api.db.persistant import mongo as db
+
+    await ensure_indexes()
+    migrated, picture_count = 0, 0
+    async for picture_meta in db.picture_meta.find({"ids": {"$exists": True}}):
+        pictures = build_pictures(picture_meta)
+        for i in range(0, len(pictures), args.batch_size):
+            result = await db[PICTURE_COLLECTION].bulk_write(
+                [
+                    UpdateOne(
+                        {"id": picture["id"]}, {"$setOnInsert": picture}, upsert=True
+                    )
+                    for picture in pictures[i : i + args.batch_size]
+                ],
+                ordered=False,
+            )
+            # NOTE: 이번 배치에서 실제로 추가된 사진만 더합니다. (다시 실행하면 0)
+            if result.upserted_count:
+                await db.picture_meta.update_one(
+                    {"_id": picture_meta["_id"]},
+                    {"$inc": {"count": result.upserted_count}},
+                )
+                picture_count += result.upserted_count
+        if not args.keep_legacy:
+            await db.picture_meta.update_one(
+                {"_id": picture_meta["_id"]}, {"$unset": {"ids": ""}}
+            )
+        migrated += 1
+    logging.info("picture_meta migrated: %s, pictures: %s", migrated, picture_count)
+
+
+MIGRATIONS = {
+    "token-logs": migrate_token_logs,
+    "foot-prints": migrate_foot_prints,
+    "pictures": migrate_pictures,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("name", choices=MIGRATIONS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--keep-legacy", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(MIGRATIONS[args.name](args))
@@ -0,0 +1,341 @@
+import bisect
+import logging
+import os
+import threading
+import time
+
+import bson
+import orjson
+from pymongo import monitoring
+
+from api.settings import env
+
+
+class PoolStats:
+    __slots__ = ("opened", "checked_out", "waiting", "max_waiting", "timeouts")
+
+    def __init__(self):
+        self.opened = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.timeouts = 0
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    서버(주소)별 커넥션 풀 사용량 (워커 하나 기준)
+
+    pymongo의 백그라운드 스레드에서도 호출되므로 lock으로 보호합니다.
+    utilization이 자주 1에 가깝거나 waiting/timeouts가 늘어나면
+    mongo_max_pool_size x 워커 수(nproc)를 다시 계산해야 합니다.
+    """
+
+    def __init__(self, max_pool_size: int):
+        self.max_pool_size = max_pool_size
+        self.pools: dict[str, PoolStats] = {}
+        self.lock = threading.Lock()
+        self.wait_seconds_max = 0.0
+        self.wait_started: dict[int, float] = {}
+
+    def _pool(self, address) -> PoolStats:
+        key = "{}:{}".format(*address)
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = PoolStats()
+        return pool
+
+    def pool_created(self, event):
+        with self.lock:
+            self._pool(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self.lock:
+            self.pools.pop("{}:{}".format(*event.address), None)
+
+    def connection_created(self, event):
+        with self.lock:
+            self._pool(event.address).opened += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self.lock:
+            self._pool(event.address).opened -= 1
+
+    def connection_check_out_started(self, event):
+        with self.lock:
+            pool = self._pool(event.address)
+            pool.waiting += 1
+            pool.max_waiting = max(pool.max_waiting, pool.waiting)
+            self.wait_started[threading.get_ident()] = time.perf_counter()
+
+    def _check_out_finished(self, pool: PoolStats):
+        pool.waiting -= 1
+        started_at = self.wait_started.pop(threading.get_ident(), None)
+        if started_at is not None:
+            self.wait_seconds_max = max(
+                self.wait_seconds_max, time.perf_counter() - started_at
+            )
+
+    def connection_check_out_failed(self, event):
+        with self.lock:
+            pool = self._pool(event.address)
+            self._check_out_finished(pool)
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                pool.timeouts += 1
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            pool = self._pool(event.address)
+            self._check_out_finished(pool)
+            pool.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self.lock:
+            self._pool(event.address).checked_out -= 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            pools = {
+                address: {
+                    "opened": pool.opened,
+                    "checked_out": pool.checked_out,
+                    "waiting": pool.waiting,
+                    "max_waiting": pool.max_waiting,
+                    "timeouts": pool.timeouts,
+                    "utilization": (
+                        pool.checked_out / self.max_pool_size
+                        if self.max_pool_size
+                        else None
+                    ),
+                }
+                for address, pool in self.pools.items()
+            }
+        return {
+            "pid": os.getpid(),
+            "nproc": os.cpu_count(),
+            "max_pool_size": self.max_pool_size,
+            "check_out_wait_max_ms": self.wait_seconds_max * 1000,
+            "pools": pools,
+        }
+
+
+pool_monitor = PoolMonitor(max_pool_size=env.mongo_max_pool_size)
+
+
+# NOTE: 히스토그램 구간 (ms), 마지막 구간은 그 이상 전부
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# NOTE: 연결 확인/인증 명령은 집계하지 않습니다.
+IGNORED_COMMANDS = {
+    "hello",
+    "ismaster",
+    "isMaster",
+    "ping",
+    "saslStart",
+    "saslContinue",
+    "endSessions",
+    "buildInfo",
+}
+QUERY_FIELDS = {
+    "find": "filter",
+    "findAndModify": "query",
+    "count": "query",
+    "distinct": "query",
+}
+MAX_SHAPES = 20
+
+
+def redact(value):
+    """
+    쿼리의 키와 연산자만 남기고 값은 "?"로 바꿉니다.
+    """
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        return [redact(item) for item in value]
+    return "?"
+
+
+def query_shape(command_name: str, command: dict) -> str:
+    if command_name in QUERY_FIELDS:
+        shape = redact(command.get(QUERY_FIELDS[command_name]) or {})
+    elif command_name == "aggregate":
+        # NOTE: $match만 조건 모양을 남기고 나머지 단계는 이름만 남깁니다.
+        shape = [
+            (
+                {"$match": redact(stage["$match"])}
+                if "$match" in stage
+                else next(iter(stage))
+            )
+            for stage in command.get("pipeline", [])
+        ]
+    elif command_name in ("update", "delete"):
+        statements = command.get(f"{command_name}s") or [{}]
+        shape = redact(statements[0].get("q") or {})
+    else:
+        return ""
+    return orjson.dumps(shape).decode("utf-8")
+
+
+class CommandStats:
+    __slots__ = (
+        "count",
+        "failures",
+        "total_ms",
+        "max_ms",
+        "bytes",
+        "buckets",
+        "shapes",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.shapes: dict[str, int] = {}
+
+    def record(self, duration_ms: float, reply_bytes: int, shape: str):
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.bytes += reply_bytes
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        if shape in self.shapes or len(self.shapes) < MAX_SHAPES:
+            self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def percentile_ms(self, ratio: float) -> float | None:
+        """
+        히스토그램에서 구한 백분위 상한 (마지막 구간이면 최대값)
+        """
+        rank = self.count * ratio
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return (
+                    LATENCY_BUCKETS_MS[i]
+                    if i < len(LATENCY_BUCKETS_MS)
+                    else self.max_ms
+                )
+        return None
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms_le": self.percentile_ms(0.5),
+            "p95_ms_le": self.percentile_ms(0.95),
+            "max_ms": self.max_ms,
+            "bytes_returned": self.bytes,
+            "histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+                },
+                "inf": self.buckets[-1],
+            },
+            "shapes": dict(
+                sorted(self.shapes.items(), key=lambda item: item[1], reverse=True)
+            ),
+        }
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    컬렉션.명령별 소요시간 히스토그램, 반환 크기, 쿼리 모양 (워커 하나 기준)
+
+    mongo_slow_query_ms 이상 걸린 명령은 값을 지운 쿼리 모양과 함께 로그로 남깁니다.
+    """
+
+    def __init__(self, slow_query_ms: float, reply_bytes: bool):
+        self.slow_query_ms = slow_query_ms
+        self.reply_bytes = reply_bytes
+        self.lock = threading.Lock()
+        self.pending: dict[tuple, tuple[str, str]] = {}
+        self.commands: dict[str, CommandStats] = {}
+
+    def _key(self, event) -> tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        command = event.command
+        collection = command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = command.get("collection")
+        if not isinstance(collection, str):
+            collection = "-"
+        try:
+            shape = query_shape(event.command_name, command)
+        except Exception:
+            shape = ""
+        with self.lock:
+            self.pending[self._key(event)] = (
+                f"{collection}.{event.command_name}",
+                shape,
+            )
+
+    def succeeded(self, event):
+        with self.lock:
+            pending = self.pending.pop(self._key(event), None)
+        if pending is None:
+            return
+        name, shape = pending
+        duration_ms = event.duration_micros / 1000
+        reply_bytes = len(bson.encode(event.reply)) if self.reply_bytes else 0
+        with self.lock:
+            self.commands.setdefault(name, CommandStats()).record(
+                duration_ms, reply_bytes, shape
+            )
+        if duration_ms >= self.slow_query_ms:
+            logging.warning(
+                "slow mongo command %s %.1fms (%s bytes): %s",
+                name,
+                duration_ms,
+                reply_bytes,
+                shape,
+            )
+
+    def failed(self, event):
+        with self.lock:
+            pending = self.pending.pop(self._key(event), None)
+            if pending is None:
+                return
+            name, shape = pending
+            self.commands.setdefault(name, CommandStats()).failures += 1
+        logging.warning(
+            "mongo command %s failed after %.1fms: %s",
+            name,
+            event.duration_micros / 1000,
+            shape,
+        )
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                name: stats.to_dict()
+                for name, stats in sorted(
+                    self.commands.items(),
+                    key=lambda item: item[1].total_ms,
+                    reverse=True,
+                )
+            }
+
+
+command_monitor = CommandMonitor(
+    slow_query_ms=env.mongo_slow_query_ms,
+    reply_bytes=env.mongo_monitor_reply_bytes,
+)
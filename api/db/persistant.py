@@ -1,41 +1,137 @@
 import asyncio
 import logging
+import os
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
 
+from api.db.monitoring import command_monitor, pool_monitor
 from api.enums import Environment
 from api.settings import env
 
-# pylint: disable=C0301
+
+def read_preference(name: str, max_staleness: int = -1):
+    """
+    "primary", "secondaryPreferred" 등 이름으로 read preference를 만듭니다.
+    """
+    return make_read_preference(read_pref_mode_from_name(name), None, max_staleness)
+
+
+def client_options() -> dict:
+    """
+    Settings의 mongo_* 값으로 만든 AsyncIOMotorClient 옵션
+    """
+    options = {
+        "maxPoolSize": env.mongo_max_pool_size,
+        "minPoolSize": env.mongo_min_pool_size,
+        "maxIdleTimeMS": env.mongo_max_idle_time_ms,
+        "waitQueueTimeoutMS": env.mongo_wait_queue_timeout_ms,
+        "serverSelectionTimeoutMS": env.mongo_server_selection_timeout_ms,
+        "connectTimeoutMS": env.mongo_connect_timeout_ms,
+        "socketTimeoutMS": env.mongo_socket_timeout_ms,
+        "read_preference": read_preference(env.mongo_read_preference),
+        "event_listeners": [pool_monitor, command_monitor],
+    }
+    if env.mongo_compressors:
+        options["compressors"] = env.mongo_compressors
+    if env.mongo_auth_source:
+        options["authSource"] = env.mongo_auth_source
+    return options
 
 
 def get_mongo_client() -> AsyncIOMotorClient:
     """
-    MongoDB 클라이언트를 반환합니다.
+    MongoDB 클라이언트를 반환합니다. 실행 중인 event loop 안에서 호출해야 합니다.
     """
     logging.info("Environment -> %s", env.environment)
+    # NOTE: 비밀번호가 로그에 남지 않도록 접속 정보는 URL에 넣지 않고 옵션으로 전달
+    credentials = {}
+    if env.mongo_username:
+        credentials = {
+            "username": env.mongo_username,
+            "password": env.mongo_password,
+        }
     if env.environment in [Environment.DEVELOPMENT, Environment.PRODUCTION]:
         # NOTE: MongoDB Atlas에 연결하기위한 정보
         # 사용하는 환경에 알맞게 수정해주세요.
-        MONGO_URL = f"mongodb+srv://{env.mongo_username}:{env.mongo_password}@{env.mongo_host}/?retryWrites=true&w=majority"
-        logging.info("MONGO URL -> %s", MONGO_URL)
-        return AsyncIOMotorClient(MONGO_URL)
+        MONGO_URL = f"mongodb+srv://{env.mongo_host}/?retryWrites=true&w=majority"
     else:
         MONGO_URL = (
             f"mongodb://{env.mongo_host}:{env.mongo_port}/?retryWrites=true&w=majority"
         )
-        if not env.mongo_username:
-            return AsyncIOMotorClient(MONGO_URL)
-        else:
-            return AsyncIOMotorClient(
-                MONGO_URL,
-                username=env.mongo_username,
-                password=env.mongo_password,
-            )
+    logging.info("MONGO URL -> %s (user: %s)", MONGO_URL, env.mongo_username)
+    return AsyncIOMotorClient(MONGO_URL, **credentials, **client_options())
+
+
+class Mongo:
+    """
+    워커(프로세스)별 MongoDB 클라이언트
+
+    서비스에서는 lifespan에서 init()/close()를 호출합니다.
+    init() 없이 사용하면(마이그레이션, 스크립트 등) 처음 사용할 때 만들어지고,
+    fork된 프로세스에서는 부모의 클라이언트 대신 새로 만듭니다.
+    """
+
+    def __init__(self):
+        self.client: AsyncIOMotorClient | None = None
+        self.pid: int | None = None
+
+    def get_client(self) -> AsyncIOMotorClient:
+        if self.client is None or self.pid != os.getpid():
+            self.client = get_mongo_client()
+            self.pid = os.getpid()
+        return self.client
+
+    def get_database(self, read_only: bool = False) -> AsyncIOMotorDatabase:
+        if not read_only:
+            return self.get_client()[env.mongo_db]
+        return self.get_client().get_database(
+            env.mongo_db,
+            read_preference=read_preference(
+                env.mongo_read_only_preference,
+                env.mongo_read_only_max_staleness_seconds,
+            ),
+        )
+
+    async def init(self):
+        logging.info("mongo connection initializing")
+        database = self.get_database()
+        await database.command("ping")
+        # NOTE: 첫 요청들이 커넥션을 만드느라 기다리지 않도록 미리 열어둡니다.
+        prewarm = min(env.mongo_prewarm_connections, env.mongo_max_pool_size)
+        await asyncio.gather(*(database.command("ping") for _ in range(prewarm)))
+        logging.info("mongo connection initialized (pid: %s)", self.pid)
+
+    def close(self):
+        if self.client is not None and self.pid == os.getpid():
+            self.client.close()
+        self.client = None
+        self.pid = None
+
+
+class LazyDatabase:
+    """
+    import 시점에는 클라이언트를 만들지 않고, 사용할 때 Mongo에서 database를 찾습니다.
+
+    라우트마다 Depends로 database를 넘기는 대신 저장소(api.db.implements)가
+    이 프록시를 사용합니다. 클라이언트는 lifespan의 init()에서 워커별로 만들어지고,
+    fork된 프로세스에서는 처음 사용할 때 새로 만들어집니다.
+    """
+
+    def __init__(self, connection: Mongo, read_only: bool = False):
+        self.connection = connection
+        self.read_only = read_only
+
+    def __getattr__(self, name: str):
+        return getattr(self.connection.get_database(self.read_only), name)
+
+    def __getitem__(self, name: str):
+        return self.connection.get_database(self.read_only)[name]
 
 
-# NOTE: 커넥션 비용을 줄이기 위해 싱글톤으로 사용
-g_client = get_mongo_client()
-g_client.get_io_loop = asyncio.get_running_loop
+# NOTE: 커넥션 비용을 줄이기 위해 워커별 싱글톤으로 사용
+mongo_connection = Mongo()
 
-mongo = g_client[env.mongo_db]
+mongo = LazyDatabase(mongo_connection)
+# NOTE: 복제 지연을 허용하는 읽기 전용 조회용 (mongo_read_only_preference)
+mongo_read_only = LazyDatabase(mongo_connection, read_only=True)
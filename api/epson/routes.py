@@ -2,11 +2,12 @@ import logging
 import os
 from datetime import datetime
 
-from fastapi import APIRouter, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, UploadFile, status
 
 from api.common import generate_hash
 from api.epson import Epson
 from api.messages import MESSAGES
+from api.ratelimit import PRINT_LIMIT, rate_limit
 from api.settings import env
 from responses.common import custom_response
 from schemas import ResponseModel
@@ -17,6 +18,7 @@ router = APIRouter(prefix="/epson", tags=["epson"])
 @router.post(
     "/print",
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limit(PRINT_LIMIT))],
     responses={
         status.HTTP_202_ACCEPTED: {
             "description": MESSAGES.PRINT_ACCEPTED,
@@ -16,6 +16,12 @@ class KakaoModuleError(Exception):
     """
 
 
+class PasswordHasherBusyError(Exception):
+    """
+    비밀번호 해시 작업 대기열이 가득 찼을 때 발생하는 오류
+    """
+
+
 class UserAlreadyExistsError(Exception):
     """
     유저가 이미 존재할 때 발생하는 오류
@@ -32,3 +38,14 @@ class RemoveColoringHashFromUserError(Exception):
     """
     유저 정보에서 해시 아이디 삭제 실패 오류
     """
+
+
+class SigninError(Exception):
+    """
+    로그인 요청을 거절할 때 발생하는 오류 (계정 없음, 비밀번호 불일치 등)
+    """
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
@@ -1,15 +1,21 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, OAuth2PasswordBearer
+from pydantic import ValidationError
 
+from api.auth.keys import key_ring
+from api.common import generate_hash
+from api.db.cache import TTLCache
 from api.db.cache import redis as cache
 from api.db.implements.mongo import get_user_by_email
 from api.db.implements.redis import AuthManager
 from api.settings import env
 from enums.auth import GrantType, OAuthProvider
-from schemas.auth import TokenPayload
+from schemas.auth import AuthContext, TokenPayload
 from schemas.users import UserInfo
 
 # Token url
@@ -28,58 +34,99 @@ CREDENTIALS_EXCEPTION = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+# NOTE: 같은 토큰의 서명 검증을 반복하지 않도록 검증된 claim을 워커별로 캐시
+# 폐기 여부는 캐시와 관계없이 매 요청마다 확인합니다. (get_token_payload)
+decoded_token_cache = TTLCache(
+    maxsize=env.jwt_decode_cache_size,
+    ttl=env.jwt_decode_cache_ttl_seconds,
+)
+
 
 # Create token internal function
-def _create_access_token(*, data: dict, expires_delta: timedelta | None = None):
+def _create_access_token(
+    *,
+    data: dict,
+    expires_delta: timedelta | None = None,
+    token_id: str | None = None,
+):
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire, "type": GrantType.ACCESS_TOKEN})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        env.app_secret,
-        algorithm=env.app_secret_algo,
+    to_encode.update(
+        {
+            "exp": expire,
+            "iat": datetime.utcnow(),
+            # NOTE: 같은 초에 발급/폐기된 토큰을 구분하기 위한 ms 단위 발급 시점
+            "iat_ms": int(time.time() * 1000),
+            "jti": token_id or generate_hash(),
+            "type": GrantType.ACCESS_TOKEN,
+        }
     )
+    encoded_jwt = key_ring.encode(to_encode)
     return encoded_jwt
 
 
-def _create_refresh_token(*, data: dict, expires_delta: timedelta | None = None):
+def _create_refresh_token(
+    *,
+    data: dict,
+    expires_delta: timedelta | None = None,
+    token_id: str | None = None,
+):
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(days=30)
-    to_encode.update({"exp": expire, "type": GrantType.REFRESH_TOKEN})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        env.app_secret,
-        algorithm=env.app_secret_algo,
+    to_encode.update(
+        {
+            "exp": expire,
+            "iat": datetime.utcnow(),
+            # NOTE: 같은 초에 발급/폐기된 토큰을 구분하기 위한 ms 단위 발급 시점
+            "iat_ms": int(time.time() * 1000),
+            "jti": token_id or generate_hash(),
+            "type": GrantType.REFRESH_TOKEN,
+        }
     )
+    encoded_jwt = key_ring.encode(to_encode)
     return encoded_jwt
 
 
-def create_access_token(email: str, auth_provider: OAuthProvider) -> str:
+def create_access_token(
+    email: str,
+    auth_provider: OAuthProvider,
+    token_id: str | None = None,
+) -> str:
     """
     Create access token for an email
+
+    token_id를 지정하면 jti로 사용합니다. (토큰 로그에 남길 ID를 다시 디코딩하지 않도록)
     """
     access_token_expires = timedelta(minutes=env.app_access_token_expire_minutes)
     access_token = _create_access_token(
         data={"email": email, "auth_provider": auth_provider},
         expires_delta=access_token_expires,
+        token_id=token_id,
     )
     return access_token
 
 
-def create_refresh_token(email: str, auth_provider: OAuthProvider) -> str:
+def create_refresh_token(
+    email: str,
+    auth_provider: OAuthProvider,
+    token_id: str | None = None,
+) -> str:
     """
     Create refresh token for an email
+
+    token_id를 지정하면 jti로 사용합니다. (토큰 로그에 남길 ID를 다시 디코딩하지 않도록)
     """
     refresh_token_expires = timedelta(minutes=env.app_refresh_token_expire_minutes)
     refresh_token = _create_refresh_token(
         data={"email": email, "auth_provider": auth_provider},
         expires_delta=refresh_token_expires,
+        token_id=token_id,
     )
     return refresh_token
 
@@ -94,56 +141,117 @@ async def valid_email_from_db(
     )
     if not user_model:
         return None
-    return UserInfo(**user_model.model_dump())
+    return user_model.to_info()
 
 
-async def get_current_user_email(token: str = Depends(oauth2_scheme)) -> TokenPayload:
+def get_token_id(token: str, payload: dict | None = None) -> str:
+    """
+    토큰의 jti를 반환합니다.
+
+    jti가 없는 이전 토큰은 토큰 문자열의 짧은 해시를 대신 사용합니다.
+    """
+    if payload is None:
+        payload = jwt.decode(token, options={"verify_signature": False})
+    token_id = payload.get("jti")
+    if token_id:
+        return token_id
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+async def is_token_revoked(token: str, payload: dict) -> bool:
+    """
+    토큰 자체 혹은 토큰 사용자의 모든 토큰이 폐기되었는지 확인합니다.
+    """
     auth_manager = AuthManager(cache)
-    if await auth_manager.is_token_in_blacklist(token):
-        raise CREDENTIALS_EXCEPTION
+    return await auth_manager.is_token_in_blacklist(
+        token_id=get_token_id(token, payload),
+        subject=AuthManager.subject_id(
+            email=payload.get("email", ""),
+            auth_provider=payload.get("auth_provider", ""),
+        ),
+        issued_at_ms=payload.get("iat_ms") or payload.get("iat", 0) * 1000,
+    )
+
+
+async def get_token_payload(token: str) -> TokenPayload:
+    """
+    토큰의 서명과 블랙리스트 여부를 확인하고 payload를 반환합니다.
+    """
     try:
         payload = decode_token(token)
-        email: str = payload.get("email")
-        if email is None:
-            raise CREDENTIALS_EXCEPTION
-        auth_provider: OAuthProvider = payload.get("auth_provider")
-        if auth_provider is None:
-            raise CREDENTIALS_EXCEPTION
-    except jwt.PyJWTError as jwt_error:
+        token_payload = TokenPayload(
+            email=payload.get("email"),
+            auth_provider=payload.get("auth_provider"),
+        )
+    except (jwt.PyJWTError, ValidationError) as jwt_error:
         raise CREDENTIALS_EXCEPTION from jwt_error
-    if await valid_email_from_db(email, auth_provider):
-        return TokenPayload(email=email, auth_provider=auth_provider)
+    if await is_token_revoked(token, payload):
+        raise CREDENTIALS_EXCEPTION
+    return token_payload
+
+
+async def get_current_user_email(token: str = Depends(oauth2_scheme)) -> TokenPayload:
+    token_payload = await get_token_payload(token)
+    if await valid_email_from_db(token_payload.email, token_payload.auth_provider):
+        return token_payload
     raise CREDENTIALS_EXCEPTION
 
 
-async def get_current_user_email_bearer(
+async def get_auth_context(
+    request: Request,
     token=Depends(bearer_scheme),
-) -> TokenPayload:
-    token_payload: TokenPayload = await get_current_user_email(token.credentials)
-    if token_payload is None:
-        raise CREDENTIALS_EXCEPTION
-    return token_payload
-
+) -> AuthContext:
+    """
+    요청당 한 번만 토큰을 검증하고 사용자 정보를 조회합니다.
 
-async def get_current_user_bearer(token=Depends(bearer_scheme)) -> UserInfo:
-    token_payload: TokenPayload = await get_current_user_email(token.credentials)
-    if token_payload.email is None:
-        raise CREDENTIALS_EXCEPTION
-    if token_payload.auth_provider is None:
-        raise CREDENTIALS_EXCEPTION
-    user_info = await get_user_by_email(
+    조회 결과는 request.state에 저장되어 같은 요청 안의 다른 dependency와
+    handler에서 다시 DB를 조회하지 않고 재사용합니다.
+    """
+    auth_context: AuthContext | None = getattr(request.state, "auth_context", None)
+    if auth_context is not None:
+        return auth_context
+    token_payload = await get_token_payload(token.credentials)
+    user_model = await get_user_by_email(
         token_payload.email, token_payload.auth_provider
     )
-    if user_info is None:
+    if user_model is None:
         raise CREDENTIALS_EXCEPTION
-    return UserInfo(**user_info.model_dump())
+    auth_context = AuthContext(payload=token_payload, user=user_model)
+    request.state.auth_context = auth_context
+    return auth_context
+
+
+async def get_current_user_email_bearer(
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> TokenPayload:
+    return auth_context.payload
 
 
-async def get_current_user_id_bearer(token: str = Depends(bearer_scheme)) -> str:
-    user_info = await get_current_user_bearer(token)
-    user_id = user_info.id
-    return user_id
+async def get_current_user_bearer(
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> UserInfo:
+    return auth_context.user.to_info()
+
+
+async def get_current_user_id_bearer(
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> str:
+    return auth_context.user.id
 
 
 def decode_token(token):
-    return jwt.decode(token, env.app_secret, algorithms=[env.app_secret_algo])
+    """
+    토큰의 서명을 검증하고 claim을 반환합니다.
+
+    검증된 claim은 토큰의 exp를 넘기지 않는 범위에서 캐시됩니다.
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    payload = decoded_token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+    payload = key_ring.decode(token)
+    exp = payload.get("exp")
+    ttl = exp - time.time() if exp is not None else None
+    if ttl is None or ttl > 0:
+        decoded_token_cache.set(key, payload, ttl=ttl)
+    return dict(payload)
@@ -1,16 +1,25 @@
 import logging
+import secrets
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse, ORJSONResponse
 
 from api.auth.app import auth_app
+from api.auth.password import password_hasher
+from api.auth.pipeline import signin_pipeline
+from api.auth.verifiers import start_verifiers, stop_verifiers
 from api.db.cache import redis
-from api.enums import Environment
+from api.db.implements.indexes import ensure_indexes
+from api.db.implements.mongo import ensure_token_log_collection, token_log_writer
+from api.db.implements.redis import blacklist_filter, user_cache
+from api.db.monitoring import command_monitor, pool_monitor
+from api.db.persistant import mongo_connection
+from api.ratelimit import rate_limiter
 from api.routes import router
 from api.settings import SERVICE_INFO, env, get_description, read_index_html
 
@@ -22,10 +31,21 @@ logging.basicConfig(level=logging.INFO)
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     try:
+        await mongo_connection.init()
         await redis.init()
+        await blacklist_filter.start()
+        await start_verifiers()
+        await ensure_token_log_collection()
+        await ensure_indexes()
+        await token_log_writer.start()
         yield
     finally:
-        pass
+        await token_log_writer.stop()
+        await stop_verifiers()
+        await blacklist_filter.stop()
+        await redis.close()
+        mongo_connection.close()
+        password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -34,15 +54,7 @@ app = FastAPI(
     title=SERVICE_INFO["title"],
     version=SERVICE_INFO["version"],
     description=get_description(BASE_PATH),
-    docs_url=(
-        "/docs"
-        if env.environment
-        in [
-            Environment.DEVELOPMENT,
-            Environment.TEST,
-        ]
-        else None
-    ),
+    docs_url="/docs" if env.is_internal else None,
 )
 app.mount("/auth", auth_app)
 app.include_router(router=router)
@@ -58,6 +70,18 @@ if env.enable_cors:
     logging.info("CORS enabled")
 
 
+@app.middleware("http")
+async def add_rate_limit_headers(request: Request, call_next):
+    """
+    rate_limit dependency가 남긴 RateLimit-* 헤더를 응답에 추가합니다.
+    """
+    response = await call_next(request)
+    headers = getattr(request.state, "rate_limit_headers", None)
+    if headers:
+        response.headers.update(headers)
+    return response
+
+
 @app.get(
     "/",
     include_in_schema=False,
@@ -79,6 +103,42 @@ async def get_status():
     }
 
 
+def verify_metrics_token(authorization: str | None = Header(default=None)):
+    """
+    개발/테스트 환경이 아니면 Authorization: Bearer <metrics_token>이 필요합니다.
+    metrics_token을 설정하지 않은 환경에서는 외부에서 조회할 수 없습니다.
+    """
+    if env.is_internal:
+        return
+    if not env.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    expected = f"Bearer {env.metrics_token}".encode("utf-8")
+    if not secrets.compare_digest((authorization or "").encode("utf-8"), expected):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@app.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def get_metrics():
+    return {
+        "user_cache": user_cache.stats(),
+        "blacklist_filter": blacklist_filter.stats(),
+        "password_hasher": password_hasher.stats(),
+        "token_log_writer": token_log_writer.stats(),
+        "signin_pipeline": signin_pipeline.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "mongo_pool": pool_monitor.stats(),
+        "mongo_commands": command_monitor.stats(),
+    }
+
+
 def custom_openapi():
     if not app.openapi_schema:
         app.openapi_schema = get_openapi(
@@ -12,6 +12,7 @@ class MESSAGES:
     PICTURE_UPLOADING = "사진정보 업로드 중"
     PICTURE_WRONG_FORMAT = "사진정보 형식이 잘못되었습니다."
     PICTURE_UPLOAD_FAIL = "사진정보 업로드 실패"
+    GOT_PICTURES = "사진 정보를 조회합니다."
     FORBIDDEN = "권한이 없습니다."
     USER_NOT_FOUND = "사용자 정보가 존재하지 않습니다."
     PLAN_TRANSACTION_FAIL = "유효한 트랜잭션 ID를 입력해주세요."
@@ -25,6 +26,12 @@ class MESSAGES:
     USER_ON_TRACK = "궤도에 사용자가 등록되었습니다."
     USER_GOT_OFF_TRACK = "궤도에서 사용자가 이탈했습니다."
     GOT_ORBIT_LOGS = "궤도 로그 조회 성공"
+    INVALID_CURSOR = "잘못된 커서입니다."
     FOOT_PRINT_CREATED = "활동기록 생성 완료"
+    FOOT_PRINT_ERROR_WHILE_ADDING = (
+        "활동기록을 추가하지 못했습니다. 관리자에게 문의하세요."
+    )
+    USER_NOT_ON_TRACK = "궤도에 등록되지 않은 사용자입니다."
+    GOT_FOOT_PRINTS = "활동기록 조회 성공"
     FOOT_PRINT_NOT_FOUND = "활동기록이 존재하지 않습니다."
     FOOT_PRINT_REMOVE_SUCCESS = "활동기록 삭제 성공"
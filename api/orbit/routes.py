@@ -1,15 +1,18 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import Field
 
+from api.common import decode_time_cursor
 from api.jwt import get_current_user_bearer
 from api.messages import MESSAGES
 from api.orbit import services
+from api.settings import env
 from enums.orbit import DistanceType
 from responses.common import custom_response
 from schemas import ResponseModel
-from schemas.orbit import FootPrintBody, OrbitInfo
+from schemas.orbit import FootPrintBody, FootPrintPage, OrbitInfoPage
 from schemas.users import UserInfo
 
 router = APIRouter(prefix="/orbit", tags=["orbit"])
@@ -78,27 +81,53 @@ async def kick_user_off_track(
     responses={
         status.HTTP_200_OK: {
             "description": MESSAGES.GOT_ORBIT_LOGS,
-            "model": ResponseModel[list[OrbitInfo]].inject(
+            "model": ResponseModel[OrbitInfoPage].inject(
                 message=MESSAGES.GOT_ORBIT_LOGS,
-                data=list[OrbitInfo],
+                data=OrbitInfoPage,
             ),
+            "content": {"application/x-ndjson": {}},
         },
     },
 )
 async def get_user_orbit_info_list(
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=env.orbit_page_max_size, description="한 번에 조회할 개수"),
+    ] = None,
+    cursor: Annotated[str | None, Query(description="이전 응답의 next_cursor")] = None,
+    stream: Annotated[
+        bool, Query(description="NDJSON으로 한 줄씩 받기 (limit이 없으면 전체)")
+    ] = False,
     user_info: UserInfo = Depends(get_current_user_bearer),
 ):
     """
-    로그인한 사용자가 프로필 이미지를 수정할 때 사용해요
+    로그인한 사용자의 궤도 목록을 최근 업데이트순으로 조회해요
     """
-    user_id = user_info.id
-    orbit_info_list = await services.get_user_orbit_info(user_id)
+    okay, after = decode_time_cursor(cursor)
+    if not okay:
+        return custom_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=ResponseModel[None](
+                message=MESSAGES.INVALID_CURSOR,
+                data=None,
+            ),
+        )
+    if stream:
+        return StreamingResponse(
+            services.stream_user_orbit_info(user_info.id, limit=limit, after=after),
+            media_type="application/x-ndjson",
+        )
+    orbit_info_page = await services.get_user_orbit_info_page(
+        user_info.id,
+        limit=limit or env.orbit_page_size,
+        after=after,
+    )
 
     return custom_response(
         status_code=status.HTTP_200_OK,
-        content=ResponseModel[list[OrbitInfo]](
+        content=ResponseModel[OrbitInfoPage](
             message=MESSAGES.GOT_ORBIT_LOGS,
-            data=orbit_info_list,
+            data=orbit_info_page,
         ),
     )
 
@@ -110,6 +139,9 @@ async def get_user_orbit_info_list(
         status.HTTP_200_OK: {
             "description": MESSAGES.FOOT_PRINT_CREATED,
         },
+        status.HTTP_404_NOT_FOUND: {
+            "description": MESSAGES.USER_NOT_ON_TRACK,
+        },
     },
 )
 async def create_foot_print(
@@ -121,7 +153,23 @@ async def create_foot_print(
     로그인한 사용자가 프로필 이미지를 수정할 때 사용해요
     """
     from_user_id = user_info.id
-    _ = await services.add_foot_print(from_user_id, to_user_id, foot_print)
+    okay, stored = await services.add_foot_print(from_user_id, to_user_id, foot_print)
+    if not okay:
+        return custom_response(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=ResponseModel[None](
+                message=MESSAGES.FOOT_PRINT_ERROR_WHILE_ADDING,
+                data=None,
+            ),
+        )
+    if not stored:
+        return custom_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=ResponseModel[None](
+                message=MESSAGES.USER_NOT_ON_TRACK,
+                data=None,
+            ),
+        )
 
     return custom_response(
         status_code=status.HTTP_200_OK,
@@ -132,6 +180,56 @@ async def create_foot_print(
     )
 
 
+@router.get(
+    "/{to_user_id}/foot-prints",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": MESSAGES.GOT_FOOT_PRINTS,
+            "model": ResponseModel[FootPrintPage].inject(
+                message=MESSAGES.GOT_FOOT_PRINTS,
+                data=FootPrintPage,
+            ),
+        },
+    },
+)
+async def get_foot_print_list(
+    to_user_id: str,
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=env.orbit_page_max_size, description="한 번에 조회할 개수"),
+    ] = None,
+    cursor: Annotated[str | None, Query(description="이전 응답의 next_cursor")] = None,
+    user_info: UserInfo = Depends(get_current_user_bearer),
+):
+    """
+    궤도에 있는 사용자와의 활동기록을 최신순으로 조회해요
+    """
+    okay, after = decode_time_cursor(cursor)
+    if not okay:
+        return custom_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=ResponseModel[None](
+                message=MESSAGES.INVALID_CURSOR,
+                data=None,
+            ),
+        )
+    foot_print_page = await services.get_foot_print_page(
+        from_user_id=user_info.id,
+        to_user_id=to_user_id,
+        limit=limit or env.foot_print_page_size,
+        after=after,
+    )
+
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        content=ResponseModel[FootPrintPage](
+            message=MESSAGES.GOT_FOOT_PRINTS,
+            data=foot_print_page,
+        ),
+    )
+
+
 @router.delete(
     "/{to_user_id}/foot-print/{foot_print_id}",
     status_code=status.HTTP_200_OK,
@@ -1,9 +1,13 @@
 import logging
+from typing import AsyncIterator
 
+import orjson
+
+from api.common import encode_cursor
 from api.db.implements import mongo
-from api.settings import env
+from api.db.implements.mongo import FootPrintKey, OrbitKey
 from enums.orbit import DistanceType
-from schemas.orbit import FootPrintBody, OrbitInfo
+from schemas.orbit import FootPrintBody, FootPrintPage, OrbitInfoPage
 
 
 async def keep_user_on_track(
@@ -40,48 +44,72 @@ async def kick_user_off_track(
     return True
 
 
-async def get_user_orbit_info(
+async def get_user_orbit_info_page(
+    user_id: str,
+    limit: int,
+    after: OrbitKey | None = None,
+) -> OrbitInfoPage:
+    orbit_info_list, last_key = await mongo.get_user_orbit_info_page(
+        user_id=user_id,
+        limit=limit,
+        after=after,
+    )
+    return OrbitInfoPage(
+        items=orbit_info_list,
+        next_cursor=encode_cursor(*last_key) if last_key else None,
+    )
+
+
+async def stream_user_orbit_info(
     user_id: str,
-) -> list[OrbitInfo]:
+    limit: int | None = None,
+    after: OrbitKey | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    orbit 목록을 NDJSON으로 한 줄씩 반환합니다.
+    limit개를 넘으면 마지막 줄에 {"next_cursor": ...}를 추가합니다.
+    """
+    last_key: OrbitKey | None = None
+    count = 0
     try:
-        orbit_models = await mongo.get_user_orbit_models(
-            user_id=user_id,
-        )
+        async for key, orbit_info in mongo.iter_user_orbit_info(
+            user_id,
+            after=after,
+            limit=None if limit is None else limit + 1,
+        ):
+            count += 1
+            if limit is not None and count > limit:
+                next_cursor = encode_cursor(*last_key) if last_key else None
+                yield orjson.dumps({"next_cursor": next_cursor}) + b"\n"
+                return
+            last_key = key
+            if orbit_info is not None:
+                yield orbit_info.model_dump_json().encode("utf-8") + b"\n"
     except Exception as e:
-        logging.exception("Error while getting user orbit logs: %s", e)
-        return []
-    orbit_user_ids = [model.to_user_id for model in orbit_models]
-    _, orbit_users = await mongo.get_user_by_ids(orbit_user_ids)
-    orbit_info = [
-        OrbitInfo(
-            distance=model.distance,
-            user_id=model.to_user_id,
-            friend_name=orbit_users[i].name or "김앤솔",
-            user_profile_image=orbit_users[i].profile_image
-            or f"{env.aws_cf_url}/pictures/person.png",
-            foot_prints=model.foot_prints,
-        )
-        for i, model in enumerate(orbit_models)
-    ]
-    return orbit_info
+        # NOTE: 응답이 이미 시작되었으므로 로그만 남깁니다.
+        logging.exception("Error while streaming user orbit logs: %s", e)
 
 
 async def add_foot_print(
     from_user_id: str,
     to_user_id: str,
     foot_print: FootPrintBody,
-) -> bool:
+) -> tuple[bool, bool]:
+    """
+    (성공 여부, 저장 여부)를 반환합니다. 궤도에 없는 사용자이면 저장되지 않습니다.
+    """
     try:
-        await mongo.add_foot_print(
+        stored = await mongo.add_foot_print(
             from_user_id=from_user_id,
             to_user_id=to_user_id,
             foot_print=foot_print,
         )
-        logging.info("User %s added foot print to %s", from_user_id, to_user_id)
+        if stored:
+            logging.info("User %s added foot print to %s", from_user_id, to_user_id)
     except Exception as e:
         logging.exception("Error while adding foot print: %s", e)
-        return False
-    return True
+        return False, False
+    return True, stored
 
 
 async def remove_foot_print(
@@ -100,3 +128,21 @@ async def remove_foot_print(
         logging.exception("Error while removing foot print: %s", e)
         return False
     return True
+
+
+async def get_foot_print_page(
+    from_user_id: str,
+    to_user_id: str,
+    limit: int,
+    after: FootPrintKey | None = None,
+) -> FootPrintPage:
+    foot_prints, last_key = await mongo.get_foot_print_page(
+        from_user_id=from_user_id,
+        to_user_id=to_user_id,
+        limit=limit,
+        after=after,
+    )
+    return FootPrintPage(
+        items=foot_prints,
+        next_cursor=encode_cursor(*last_key) if last_key else None,
+    )
@@ -3,11 +3,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, Path, status
 
-from api.jwt import get_current_user_email_bearer
+from api.jwt import get_auth_context
 from api.messages import MESSAGES
 from api.plan import services as plan_services
 from responses.common import custom_response
 from schemas import ResponseModel
+from schemas.auth import AuthContext
 from schemas.plan import Plan, PlanInfo, SubscriptionResult
 
 router = APIRouter(prefix="/plan", tags=["plan"])
@@ -29,7 +30,7 @@ router = APIRouter(prefix="/plan", tags=["plan"])
 async def subscribe_plan(
     plan: Annotated[Plan, Path(description="구독할 요금제", example="BASIC")],
     payload: Annotated[PlanInfo, Body(description="구독 정보")],
-    token_payload=Depends(get_current_user_email_bearer),
+    auth_context: AuthContext = Depends(get_auth_context),
 ):
     """
     구독 활성화를 위해 호출해야하는 엔드포인트입니다.
@@ -48,7 +49,7 @@ async def subscribe_plan(
     """
     transaction_id = payload.transaction_id
     okay, status_code, user_info = await plan_services.activate_plan(
-        payload=token_payload,
+        auth_context=auth_context,
         month=payload.month,
         plan=plan,
         _transaction_id=transaction_id or "dummy",
@@ -155,9 +156,9 @@ async def subscribe_plan(
     status_code=status.HTTP_200_OK,
 )
 async def do_unsubscribe(
-    token_payload=Depends(get_current_user_email_bearer),
+    auth_context: AuthContext = Depends(get_auth_context),
 ):
-    okay = await plan_services.unsubscribe_plan(payload=token_payload)
+    okay = await plan_services.unsubscribe_plan(auth_context=auth_context)
     if not okay:
         return custom_response(
             status_code=status.HTTP_400_BAD_REQUEST,
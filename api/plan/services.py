@@ -1,11 +1,11 @@
-from api.db.implements.mongo import get_user_by_email, patch_user_plan
-from api.jwt import TokenPayload
+from api.db.implements.mongo import patch_user_plan
 from enums.users import PLAN_MAP, Plan
+from schemas.auth import AuthContext
 from schemas.users import UserInfo
 
 
 async def activate_plan(
-    payload: TokenPayload,
+    auth_context: AuthContext,
     plan: Plan,
     month: int,
     _transaction_id: str,
@@ -24,14 +24,8 @@ async def activate_plan(
     # TODO: check transaction_id from redis
     # return False, 3
 
-    user_info = await get_user_by_email(
-        email=payload.email,
-        auth_provider=payload.auth_provider,
-    )
-    if not user_info:
-        return False, 2, None
-
-    using_plan = user_info.using_plan
+    payload = auth_context.payload
+    using_plan = auth_context.user.using_plan
     # if PLAN_MAP[using_plan] > PLAN_MAP[plan]:
     #     return False, 4, None
     if PLAN_MAP[using_plan] == PLAN_MAP[plan]:
@@ -49,22 +43,19 @@ async def activate_plan(
 
 
 async def unsubscribe_plan(
-    payload: TokenPayload,
+    auth_context: AuthContext,
 ) -> bool:
     """
     구독 해지
     """
-    user_info = await get_user_by_email(
-        email=payload.email,
-        auth_provider=payload.auth_provider,
-    )
-    if not user_info:
-        return False
+    payload = auth_context.payload
     okay, user_info = await patch_user_plan(
         email=payload.email,
         auth_provider=payload.auth_provider,
         plan=Plan.BASIC,
         month=0,
+        # NOTE: 결과는 성공 여부만 사용합니다.
+        fields=("using_plan",),
     )
     if not okay:
         return False
@@ -0,0 +1,272 @@
+import ipaddress
+import logging
+import math
+import time
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Request, status
+
+from api.db.cache import TTLCache
+from api.db.cache import redis as cache
+from api.jwt import get_auth_context
+from api.settings import env
+from schemas.auth import AuthContext
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+# NOTE: 토큰 버킷을 Redis에서 원자적으로 갱신합니다. (시간은 Redis 서버 기준)
+# KEYS[1] = 버킷 키, ARGV = capacity, 초당 충전량, cost
+# return = {허용 여부, 남은 토큰, 재시도까지 ms, 가득 찰 때까지 ms}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = redis.call("TIME")
+now = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) * 1000 / rate)
+end
+local reset = math.ceil((capacity - tokens) * 1000 / rate)
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", now)
+redis.call("PEXPIRE", KEYS[1], reset + 1000)
+return {allowed, math.floor(tokens), retry_after, reset}
+"""
+
+
+class RateLimitPolicy:
+    """
+    "10/60" -> 60초 동안 10번, 처음에는 10번까지 연속으로 허용 (토큰 버킷)
+
+    scope가 "ip"이면 클라이언트 IP, "user"이면 로그인한 사용자별로 제한합니다.
+    """
+
+    def __init__(self, name: str, rule: str, scope: str = "ip", cost: int = 1):
+        capacity, period = rule.split("/")
+        self.name = name
+        self.capacity = int(capacity)
+        self.period = float(period)
+        self.rate = self.capacity / self.period
+        self.scope = scope
+        self.cost = cost
+
+    def headers(self, remaining: int, reset_ms: int) -> dict[str, str]:
+        return {
+            "RateLimit-Limit": str(self.capacity),
+            "RateLimit-Remaining": str(max(remaining, 0)),
+            "RateLimit-Reset": str(math.ceil(reset_ms / 1000)),
+            "RateLimit-Policy": f"{self.capacity};w={int(self.period)}",
+        }
+
+
+class LocalBucket:
+    """
+    워커 안에서만 쓰는 같은 크기의 토큰 버킷
+
+    워커 하나가 받은 요청만으로 버킷이 비었다면 전체 한도도 넘은 것이므로
+    Redis에 묻지 않고 바로 거절할 수 있습니다.
+    """
+
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, capacity: int):
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def take(self, policy: RateLimitPolicy) -> tuple[bool, int]:
+        now = time.monotonic()
+        self.tokens = min(
+            policy.capacity, self.tokens + (now - self.updated_at) * policy.rate
+        )
+        self.updated_at = now
+        if self.tokens < policy.cost:
+            retry_after_ms = math.ceil((policy.cost - self.tokens) / policy.rate * 1000)
+            return False, retry_after_ms
+        self.tokens -= policy.cost
+        return True, 0
+
+
+class RateLimiter:
+    namespace = "ratelimit"
+
+    def __init__(self, local_size: int):
+        self.local = TTLCache(maxsize=local_size, ttl=3600)
+        self.script = None
+        self.allowed = 0
+        self.rejected = 0
+        self.shed = 0
+        self.errors = 0
+        # NOTE: 클라이언트 IP를 알 수 없어 IP 기준 제한을 건너뛴 요청 수
+        self.unresolved = 0
+
+    def _local_bucket(self, policy: RateLimitPolicy, key: str) -> LocalBucket:
+        local_key = (policy.name, key)
+        bucket = self.local.get(local_key)
+        if bucket is None:
+            bucket = LocalBucket(policy.capacity)
+            self.local.set(local_key, bucket, ttl=policy.period)
+        return bucket
+
+    async def _take(
+        self, policy: RateLimitPolicy, key: str
+    ) -> tuple[bool, int, int, int]:
+        redis = cache.get_redis()
+        if redis is None:
+            return True, policy.capacity, 0, 0
+        if self.script is None:
+            self.script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        allowed, remaining, retry_after_ms, reset_ms = await self.script(
+            keys=[cache.mangle_key(self.namespace, f"{policy.name}:{key}")],
+            args=[policy.capacity, policy.rate, policy.cost],
+        )
+        return bool(allowed), int(remaining), int(retry_after_ms), int(reset_ms)
+
+    async def hit(self, request: Request, policy: RateLimitPolicy, key: str):
+        """
+        요청을 허용하면 RateLimit-* 헤더를 request.state에 남기고,
+        한도를 넘으면 429 오류를 발생시킵니다.
+        """
+        if not env.rate_limit_enabled:
+            return
+        local_okay, retry_after_ms = self._local_bucket(policy, key).take(policy)
+        if not local_okay:
+            self.shed += 1
+            raise self.too_many_requests(policy, retry_after_ms, retry_after_ms)
+        try:
+            allowed, remaining, retry_after_ms, reset_ms = await self._take(policy, key)
+        except Exception as e:
+            # NOTE: Redis 장애 시에는 워커 내 제한만 적용합니다.
+            self.errors += 1
+            logging.exception("Error while checking rate limit: %s", e)
+            return
+        if not allowed:
+            self.rejected += 1
+            raise self.too_many_requests(policy, retry_after_ms, reset_ms)
+        self.allowed += 1
+        request.state.rate_limit_headers = policy.headers(remaining, reset_ms)
+
+    def too_many_requests(
+        self, policy: RateLimitPolicy, retry_after_ms: int, reset_ms: int
+    ) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={
+                "Retry-After": str(max(1, math.ceil(retry_after_ms / 1000))),
+                **policy.headers(0, reset_ms),
+            },
+        )
+
+    def stats(self) -> dict:
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "shed": self.shed,
+            "errors": self.errors,
+            "ip_unresolved": self.unresolved,
+            "local_buckets": len(self.local.data),
+        }
+
+
+rate_limiter = RateLimiter(local_size=env.rate_limit_local_size)
+
+if env.rate_limit_enabled and not env.rate_limit_ip_header:
+    logging.warning(
+        "rate_limit_ip_header is not set, IP-scoped rate limits are not applied"
+    )
+
+
+def parse_trusted_proxies(value: str) -> list[IPNetwork]:
+    """
+    "172.16.0.0/12,10.0.0.1" -> 프록시 주소 대역 목록
+    """
+    return [
+        ipaddress.ip_network(network.strip(), strict=False)
+        for network in value.split(",")
+        if network.strip()
+    ]
+
+
+TRUSTED_PROXIES = parse_trusted_proxies(env.rate_limit_trusted_proxies)
+
+
+def is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXIES)
+
+
+def get_client_ip(request: Request) -> str | None:
+    """
+    rate_limit_ip_header(예: Fly-Client-IP, X-Forwarded-For)로 클라이언트 IP를 찾습니다.
+
+    - 헤더는 rate_limit_trusted_proxies에서 온 요청일 때만 사용합니다.
+    - 신뢰하지 않는 주소에서 직접 들어온 요청은 접속한 주소를 사용합니다.
+    - X-Forwarded-For처럼 여러 주소가 있으면 오른쪽부터 신뢰하는 프록시가 아닌
+      첫 주소를 사용합니다. (왼쪽은 클라이언트가 조작할 수 있음)
+
+    알 수 없으면 None을 반환하고, IP 기준 제한은 적용하지 않습니다.
+    헤더 없이 접속 주소를 쓰면 프록시 뒤에서는 모든 요청이 버킷 하나를 나눠씁니다.
+    """
+    if not env.rate_limit_ip_header or request.client is None:
+        return None
+    peer = request.client.host
+    if not is_trusted_proxy(peer):
+        return peer
+    forwarded = request.headers.get(env.rate_limit_ip_header)
+    if not forwarded:
+        return None
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else None
+
+
+def rate_limit(policy: RateLimitPolicy) -> Callable:
+    """
+    라우트에 dependency로 선언합니다.
+
+    @router.post("/ask", dependencies=[Depends(rate_limit(CHAT_ASK_LIMIT))])
+    """
+    if policy.scope == "user":
+
+        async def limit_by_user(
+            request: Request,
+            auth_context: AuthContext = Depends(get_auth_context),
+        ):
+            await rate_limiter.hit(request, policy, auth_context.user.id)
+
+        return limit_by_user
+
+    async def limit_by_ip(request: Request):
+        client_ip = get_client_ip(request)
+        if client_ip is None:
+            rate_limiter.unresolved += 1
+            return
+        await rate_limiter.hit(request, policy, client_ip)
+
+    return limit_by_ip
+
+
+SIGNIN_LIMIT = RateLimitPolicy("signin", env.rate_limit_signin)
+SIGNUP_LIMIT = RateLimitPolicy("signup", env.rate_limit_signup)
+CHAT_ASK_LIMIT = RateLimitPolicy("chat_ask", env.rate_limit_chat_ask)
+PRINT_LIMIT = RateLimitPolicy("print", env.rate_limit_print)
+PICTURE_UPLOAD_LIMIT = RateLimitPolicy(
+    "picture_upload", env.rate_limit_picture_upload, scope="user"
+)
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, File, UploadFile, status
 
 from api.common import generate_hash
-from api.db.implements.mongo import get_user_by_email
-from api.jwt import get_current_user_email_bearer
+from api.jwt import get_current_user_bearer
 from api.messages import MESSAGES
+from api.ratelimit import PICTURE_UPLOAD_LIMIT, rate_limit
 from api.resources import services as resource_services
 from responses.common import custom_response
 from schemas import ResponseModel
 from schemas.resources import ObjectStorageResponse
+from schemas.users import UserInfo
 
 router = APIRouter(prefix="/picture")
 
@@ -15,6 +16,7 @@ router = APIRouter(prefix="/picture")
 @router.post(
     "",
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limit(PICTURE_UPLOAD_LIMIT))],
     responses={
         status.HTTP_202_ACCEPTED: {
             "description": MESSAGES.PICTURE_UPLOADING,
@@ -27,23 +29,11 @@ router = APIRouter(prefix="/picture")
 )
 async def upload_picture(
     file: UploadFile = File(...),
-    token_payload=Depends(get_current_user_email_bearer),
+    user_info: UserInfo = Depends(get_current_user_bearer),
 ):
     """
     사진 업로드할 때 사용해요
     """
-    user_info = await get_user_by_email(
-        email=token_payload.email,
-        auth_provider=token_payload.auth_provider,
-    )
-    if not user_info:
-        return custom_response(
-            status_code=status.HTTP_403_FORBIDDEN,
-            content=ResponseModel[None](
-                message=MESSAGES.FORBIDDEN,
-                data=None,
-            ),
-        )
     if not file.content_type:
         return custom_response(
             status_code=status.HTTP_400_BAD_REQUEST,
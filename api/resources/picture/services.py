@@ -1,20 +1,50 @@
 import logging
 
-from api.db.persistant import mongo as db
-from schemas.pictures import PictureMetaModel
+from api.common import encode_cursor
+from api.db.implements import mongo
+from api.db.implements.mongo import PictureKey
+from api.settings import env
+from schemas.pictures import PictureInfo, PictureMetaModel, PicturePage
 
 
 async def get_user_picture_meta(user_id: str) -> tuple[bool, PictureMetaModel | None]:
-    print("user_id = ", user_id)
+    okay, meta_from_db = await mongo.get_user_picture_meta(user_id)
+    if not okay or meta_from_db is None:
+        return False, None
     try:
-        meta_from_db = await db.picture_meta.find_one(
-            {
-                "user_id": user_id,
-            }
-        )
-        if meta_from_db is None:
-            return False, None
-        return True, PictureMetaModel(**meta_from_db)
+        return True, PictureMetaModel.from_db(meta_from_db)
     except Exception as e:
         logging.exception("Error while getting user picture meta: %s", e)
         return False, None
+
+
+async def get_user_picture_page(
+    user_id: str,
+    limit: int,
+    after: PictureKey | None = None,
+) -> PicturePage:
+    """
+    사진 한 페이지와 전체 사진 수를 반환합니다.
+
+    전체 수는 picture_meta.count를 읽기만 하므로 사진이 많아도 비용이 같습니다.
+    """
+    _, picture_meta = await get_user_picture_meta(user_id)
+    pictures, last_key = await mongo.get_picture_page(
+        user_id=user_id,
+        limit=limit,
+        after=after,
+    )
+    return PicturePage(
+        items=[
+            PictureInfo(
+                id=picture.id,
+                url=f"{env.aws_cf_url}/pictures/{user_id}/{picture.id}",
+                created_at=picture.created_at,
+                size=picture.size,
+                content_type=picture.content_type,
+            )
+            for picture in pictures
+        ],
+        total=picture_meta.count if picture_meta else 0,
+        next_cursor=encode_cursor(*last_key) if last_key else None,
+    )
@@ -1,12 +1,14 @@
 import logging
+from datetime import datetime
 
 from async_lru import alru_cache  # lru_cache for async
 from fastapi import UploadFile
 
-from api.db.implements.mongo import push_user_picture_id
-from api.db.persistant import mongo
+from api.db.implements.mongo import add_picture
+from api.db.persistant import mongo, mongo_read_only
 from api.db.storage import BucketManager
 from api.settings import env
+from schemas.pictures import PictureModel
 from schemas.resources import ObjectStorageResponse, Theme, ThemeInput
 
 
@@ -15,7 +17,7 @@ async def get_theme_resources() -> list[Theme]:
     """
     촬영테마 정보를 가져올 때 사용해요
     """
-    theme_resources = await mongo.theme.find().to_list(None)
+    theme_resources = await mongo_read_only.theme.find().to_list(None)
     return [Theme(**theme) for theme in theme_resources]
 
 
@@ -67,7 +69,15 @@ async def upload_picture(
     except Exception as e:
         logging.exception("upload_picture: %s", e)
         return False, None
-    okay = await push_user_picture_id(user_id, filename)
+    okay = await add_picture(
+        PictureModel(
+            id=filename,
+            user_id=user_id,
+            created_at=datetime.now(),
+            size=file.size,
+            content_type=file.content_type,
+        )
+    )
     if not okay:
         # remove uploaded file
         return False, None
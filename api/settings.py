@@ -55,11 +55,37 @@ class Settings(BaseSettings):
     mongo_username: str | None = None
     mongo_password: str | None = None
     mongo_auth_source: str | None = None
+    mongo_max_pool_size: int = 100  # 워커별 커넥션 수
+    mongo_min_pool_size: int = 0
+    mongo_prewarm_connections: int = 4  # 시작할 때 미리 열어둘 커넥션 수
+    mongo_max_idle_time_ms: int | None = None
+    mongo_wait_queue_timeout_ms: int | None = None  # 풀이 가득 찼을 때 대기 시간
+    mongo_server_selection_timeout_ms: int = 30_000
+    mongo_connect_timeout_ms: int = 20_000
+    mongo_socket_timeout_ms: int | None = None
+    # NOTE: zlib은 표준 라이브러리라 추가 의존성이 없습니다.
+    # zstd(zstandard), snappy(python-snappy)는 패키지를 설치한 뒤 지정합니다.
+    mongo_compressors: str = "zlib"
+    mongo_read_preference: str = "primary"
+    # NOTE: 테마, orbit 목록, 사진 목록처럼 조금 늦게 반영되어도 되는 조회에 사용합니다.
+    # 기본값 primary에서는 방금 쓴 데이터가 바로 조회됩니다. secondaryPreferred 등은
+    # 복제 지연으로 방금 올린 사진이 목록에 없을 수 있으므로 배포 환경에서 선택합니다.
+    mongo_read_only_preference: str = "primary"
+    mongo_read_only_max_staleness_seconds: int = -1  # -1이면 제한 없음, 최소 90
+    mongo_slow_query_ms: float = 100.0  # 이보다 오래 걸린 명령은 로그로 남깁니다.
+    # NOTE: 응답마다 BSON으로 한 번 더 인코딩하므로 조사할 때만 켭니다.
+    mongo_monitor_reply_bytes: bool = False  # 응답 크기 집계
     redis_host: str = ""
     redis_port: int = 6379
     redis_username: str | None = None
     redis_password: str | None = None
     redis_db: int = 0
+    user_cache_size: int = 1024
+    user_cache_ttl_seconds: int = 30
+    user_cache_redis_ttl_seconds: int = 300
+    blacklist_filter_capacity: int = 100_000
+    blacklist_filter_error_rate: float = 0.001
+    blacklist_filter_rebuild_seconds: int = 300
     storage_access_key: str | None = None
     storage_secret_key: str | None = None
     storage_bucket_name: str = ""
@@ -68,19 +94,61 @@ class Settings(BaseSettings):
     app_refresh_token_expire_minutes: int = 60 * 24 * 30 * 6  # 6 months
     app_secret: str = ""
     app_secret_algo: str = "HS256"
+    app_signing_keys: str = ""  # "kid1:/path/key1.pem,kid2:/path/key2.pem"
+    app_signing_kid: str | None = None  # 서명에 사용할 kid (없으면 app_secret)
+    app_jwks_max_age_seconds: int = 3600
+    # NOTE: 개발/테스트 환경이 아니면 /metrics는 이 토큰(Bearer)으로만 조회됩니다.
+    metrics_token: str = ""
+    jwt_decode_cache_size: int = 4096
+    jwt_decode_cache_ttl_seconds: int = 300
+    password_hash_workers: int = 2
+    password_hash_queue_size: int = 16
+    password_hash_rounds: int = 12
+    token_log_queue_size: int = 10_000
+    token_log_batch_size: int = 100
+    token_log_flush_seconds: float = 1.0
+    token_log_ttl_days: int = 90
+    rate_limit_enabled: bool = True
+    # NOTE: 프록시가 전달하는 클라이언트 IP 헤더, 없으면 IP 기준 제한을 적용하지 않습니다.
+    rate_limit_ip_header: str | None = None
+    rate_limit_trusted_proxies: str = ""  # 헤더를 믿을 프록시 주소 (CIDR, 쉼표 구분)
+    rate_limit_local_size: int = 10_000
+    rate_limit_signin: str = "10/60"  # 60초 동안 10번
+    rate_limit_signup: str = "5/600"
+    rate_limit_chat_ask: str = "20/3600"
+    rate_limit_print: str = "5/600"
+    rate_limit_picture_upload: str = "30/3600"
+    orbit_page_size: int = 50
+    orbit_page_max_size: int = 200
+    orbit_page_batch_size: int = 100
+    orbit_latest_foot_prints: int = 3  # orbit 목록에 포함할 최근 활동기록 수
+    foot_print_bucket_size: int = 100
+    foot_print_page_size: int = 20
+    picture_page_size: int = 30
+    picture_page_max_size: int = 100
     app_version: str = "0.0.1"
     google_mail_app_password: str = ""  # Google 앱 비밀번호
     frontend_url: str = ""
     google_client_id: str = ""
     google_client_secret: str = ""
+    google_jwks_url: str = "https://www.googleapis.com/oauth2/v3/certs"
     kakao_client_id: str = ""
     kakao_client_secret: str = ""
+    kakao_jwks_url: str = "https://kauth.kakao.com/.well-known/jwks.json"
+    kakao_tokeninfo_url: str = "https://kauth.kakao.com/oauth/tokeninfo"
     aws_cf_url: str = ""
     groq_api_key: str = ""
     epson_client_id: str = ""
     epson_client_secret: str = ""
     epson_email_id: str = ""
 
+    @property
+    def is_internal(self) -> bool:
+        """
+        문서(/docs), 지표(/metrics) 등 내부용 기능을 노출하는 환경인지 여부
+        """
+        return self.environment in [Environment.DEVELOPMENT, Environment.TEST]
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -1,18 +1,16 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
 
-from api.db.implements.mongo import (
-    get_user_by_email,
-    patch_user_by_email,
-    patch_user_profile_image,
-)
-from api.jwt import get_current_user_email_bearer
-from api.resources.picture.services import get_user_picture_meta
+from api.common import decode_time_cursor
+from api.db.implements.mongo import patch_user_by_email, patch_user_profile_image
+from api.jwt import get_current_user_bearer, get_current_user_email_bearer
+from api.messages import MESSAGES
+from api.resources.picture.services import get_user_picture_page
 from api.settings import env
 from responses.common import custom_response
 from schemas import ResponseModel
-from schemas.pictures import PictureMetaInfo
+from schemas.pictures import PicturePage
 from schemas.users import PatchableUserInfo, UserInfo, UserProfileImage
 
 router = APIRouter(prefix="/users", tags=["user"])
@@ -26,35 +24,19 @@ router = APIRouter(prefix="/users", tags=["user"])
             "description": "사용자 정보 조회 성공",
             "model": ResponseModel[UserInfo],
         },
-        status.HTTP_404_NOT_FOUND: {
-            "description": "사용자 정보가 존재하지 않음",
-            "model": ResponseModel[None],
-        },
     },
 )
 async def get_my_profile(
-    token_payload=Depends(get_current_user_email_bearer),
+    user_info: UserInfo = Depends(get_current_user_bearer),
 ):
     """
     로그인한 사용자가 내 정보를 가져올 때 사용해요
     """
-    user_info = await get_user_by_email(
-        email=token_payload.email,
-        auth_provider=token_payload.auth_provider,
-    )
-    if user_info:
-        return custom_response(
-            status_code=status.HTTP_200_OK,
-            content=ResponseModel[UserInfo](
-                message="사용자 정보를 조회합니다.",
-                data=UserInfo(**user_info.model_dump()),
-            ),
-        )
     return custom_response(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content=ResponseModel[None](
-            message="사용자 정보를 찾을 수 없습니다.",
-            data=None,
+        status_code=status.HTTP_200_OK,
+        content=ResponseModel[UserInfo](
+            message="사용자 정보를 조회합니다.",
+            data=user_info,
         ),
     )
 
@@ -167,54 +149,43 @@ async def update_my_profile_image(
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {
-            "description": "내 사진 조회 성공",
-            "model": ResponseModel[PictureMetaInfo].inject(
-                message="내 사진 조회 성공",
-                data=PictureMetaInfo,
+            "description": MESSAGES.GOT_PICTURES,
+            "model": ResponseModel[PicturePage].inject(
+                message=MESSAGES.GOT_PICTURES,
+                data=PicturePage,
             ),
         },
     },
 )
 async def get_my_pictures(
-    token_payload=Depends(get_current_user_email_bearer),
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=env.picture_page_max_size, description="한 번에 조회할 개수"),
+    ] = None,
+    cursor: Annotated[str | None, Query(description="이전 응답의 next_cursor")] = None,
+    user_info: UserInfo = Depends(get_current_user_bearer),
 ):
     """
-    로그인한 사용자가 내 사진을 조회할 때 사용해요
+    로그인한 사용자가 내 사진을 최근 업로드순으로 조회할 때 사용해요
     """
-    user_info = await get_user_by_email(
-        email=token_payload.email,
-        auth_provider=token_payload.auth_provider,
-    )
-    user_id = user_info.id if user_info else None
-    if not user_id:
-        return custom_response(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content=ResponseModel[None](
-                message="사용자 정보를 찾을 수 없습니다.",
-                data=None,
-            ),
-        )
-    okay, picture_meta = await get_user_picture_meta(user_id=user_id)
-    if not okay or not picture_meta:
+    okay, after = decode_time_cursor(cursor)
+    if not okay:
         return custom_response(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status.HTTP_400_BAD_REQUEST,
             content=ResponseModel[None](
-                message="사진 정보를 찾을 수 없습니다.",
+                message=MESSAGES.INVALID_CURSOR,
                 data=None,
             ),
         )
-    picture_info = PictureMetaInfo(
-        user_id=picture_meta.user_id,
-        modified_at=picture_meta.modified_at,
-        urls=[
-            f"{env.aws_cf_url}/pictures/{user_id}/{picture_id}"
-            for picture_id in picture_meta.ids
-        ],
+    picture_page = await get_user_picture_page(
+        user_info.id,
+        limit=limit or env.picture_page_size,
+        after=after,
     )
     return custom_response(
         status_code=status.HTTP_200_OK,
-        content=ResponseModel[PictureMetaInfo](
-            message="사진 정보를 조회합니다.",
-            data=picture_info,
+        content=ResponseModel[PicturePage](
+            message=MESSAGES.GOT_PICTURES,
+            data=picture_page,
         ),
     )
@@ -25,6 +25,20 @@ class EventType(str, Enum):
     REFRESH_ACCESS_TOKEN = "refresh_access_token"
 
 
+# NOTE: token_logs에는 문자열 대신 짧은 코드로 저장합니다.
+GRANT_TYPE_MAP = {
+    GrantType.ACCESS_TOKEN: 1,
+    GrantType.REFRESH_TOKEN: 2,
+}
+
+EVENT_TYPE_MAP = {
+    EventType.SIGNIN: 1,
+    EventType.SIGNOUT: 2,
+    EventType.BLACKLIST: 3,
+    EventType.REFRESH_ACCESS_TOKEN: 4,
+}
+
+
 class OAuthProvider(str, Enum):
     GOOGLE = "google"
     KAKAO = "kakao"
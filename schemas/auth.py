@@ -1,9 +1,16 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
-from enums.auth import EventType, GrantType, OAuthProvider, RefreshGrantType
-from schemas.users import AuthFields, UserFields
+from enums.auth import (
+    EVENT_TYPE_MAP,
+    GRANT_TYPE_MAP,
+    EventType,
+    GrantType,
+    OAuthProvider,
+    RefreshGrantType,
+)
+from schemas.users import AuthFields, UserFields, UserModel
 
 
 class RefreshBody(BaseModel):
@@ -34,6 +41,15 @@ class TokenPayload(BaseModel):
     )
 
 
+class AuthContext(BaseModel):
+    """
+    인증된 요청의 토큰 정보와 사용자 정보, 요청마다 한 번만 조회합니다.
+    """
+
+    payload: TokenPayload
+    user: UserModel
+
+
 # pylint: disable=C0301
 class RefreshTokenResponse(BaseModel):
     refresh_token: str | None = Field(
@@ -89,14 +105,28 @@ class TokenBlacklist(BaseModel):
 
 
 class TokenLog(BaseModel):
+    """
+    token_logs time-series 컬렉션 문서
+
+    created_at이 timeField, user_id가 metaField이며
+    event_type, grant_type은 코드(EVENT_TYPE_MAP, GRANT_TYPE_MAP)로 저장됩니다.
+    """
+
     user_id: str | None = AuthFields.user_id
     event_type: EventType = AuthFields.event_type
     grant_type: GrantType = AuthFields.grant_type
-    access_token: str | None = AuthFields.access_token
-    refresh_token: str | None = AuthFields.refresh_token
-    created_at: str | None = AuthFields.created_at
-    expired_at: str | None = AuthFields.expires_in
-    blacklisted_at: str | None = AuthFields.blacklisted_at
+    access_token_id: str | None = AuthFields.access_token_id
+    refresh_token_id: str | None = AuthFields.refresh_token_id
+    created_at: datetime = AuthFields.created_at
+    expired_at: datetime | None = AuthFields.expires_in
+
+    @field_serializer("event_type")
+    def serialize_event_type(self, value: EventType) -> int:
+        return EVENT_TYPE_MAP[value]
+
+    @field_serializer("grant_type")
+    def serialize_grant_type(self, value: GrantType) -> int:
+        return GRANT_TYPE_MAP[value]
 
 
 class SignupBody(BaseModel):
@@ -45,6 +45,11 @@ class OrbitFields:
         },
         description="친구 이름",
     )
+    foot_print_count: int = Field(
+        default=0,
+        json_schema_extra={"example": 12},
+        description="활동기록 수",
+    )
     foot_print_id: str = Field(
         json_schema_extra={
             "example": "...",
@@ -75,15 +80,24 @@ class FootPrintModel(BaseModel):
     )
     updated_at: datetime = OrbitFields.updated_at
 
+    @classmethod
+    def from_db(cls, document: dict) -> "FootPrintModel":
+        return cls.model_construct(**document)
+
 
 class OrbitModel(BaseModel):
+    """
+    orbit_logs 문서, 활동기록 전체는 foot_print_buckets에 저장됩니다.
+    """
+
     distance: DistanceType = OrbitFields.distance
     from_user_id: str = OrbitFields.from_user_id
     to_user_id: str = OrbitFields.to_user_id
     updated_at: datetime = OrbitFields.updated_at
-    foot_prints: list[FootPrintModel] = Field(
+    foot_print_count: int = OrbitFields.foot_print_count
+    latest_foot_prints: list[FootPrintModel] = Field(
         default_factory=list,
-        description="Foot prints",
+        description="최근 활동기록",
     )
 
 
@@ -93,7 +107,47 @@ class OrbitInfo(BaseModel):
     user_profile_image: str = OrbitFields.user_profile_image
     friend_name: str = OrbitFields.friend_name
     updated_at: datetime = OrbitFields.updated_at
+    foot_print_count: int = OrbitFields.foot_print_count
     foot_prints: list[FootPrintModel] = Field(
         default_factory=list,
-        description="Foot prints",
+        description="최근 활동기록 (전체는 /orbit/{to_user_id}/foot-prints)",
+    )
+
+    @classmethod
+    def from_db(cls, document: dict) -> "OrbitInfo":
+        """
+        orbit 목록 aggregation 결과로 검증 없이 모델을 만듭니다.
+        """
+        return cls.model_construct(
+            **{
+                **document,
+                "distance": DistanceType(document["distance"]),
+                "foot_prints": [
+                    FootPrintModel.from_db(foot_print)
+                    for foot_print in document.get("foot_prints", [])
+                ],
+            }
+        )
+
+
+class OrbitInfoPage(BaseModel):
+    items: list[OrbitInfo] = Field(
+        default_factory=list,
+        description="궤도 목록 (최근 업데이트순)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        json_schema_extra={"example": "WyIyMDI0LTA2LTE1VDEzOjU2OjM5LjQ4NyIsInIwcSJd"},
+        description="다음 페이지 커서, 마지막 페이지이면 null",
+    )
+
+
+class FootPrintPage(BaseModel):
+    items: list[FootPrintModel] = Field(
+        default_factory=list,
+        description="활동기록 목록 (최신순)",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 커서, 마지막 페이지이면 null",
     )
@@ -4,15 +4,33 @@ from pydantic import BaseModel, Field
 
 
 class PictureFields:
-    picture_ids = Field(
-        default=[],
-        description="업로드된 사진 ID 목록",
-        json_schema_extra={"example": ["6qerhu4sd1vt1bh3"]},
+    picture_id = Field(
+        description="사진 ID (저장소 파일 이름)",
+        json_schema_extra={"example": "a1b2c3d4e5f6g7h8i9j0a1b2c3d4e5f6.jpeg"},
     )
-    picture_urls = Field(
-        default=[],
-        description="업로드된 사진 URL 목록",
-        json_schema_extra={"example": ["https://www.example.com/6qerhu4sd1vt1bh3"]},
+    picture_count = Field(
+        default=0,
+        description="업로드된 사진 수",
+        json_schema_extra={"example": 12},
+    )
+    created_at = Field(
+        description="업로드 시간",
+        json_schema_extra={"example": "2024-08-17 19:00:00.000000"},
+    )
+    size = Field(
+        default=None,
+        description="파일 크기 (byte), 이전에 업로드된 사진은 없을 수 있음",
+        json_schema_extra={"example": 524288},
+    )
+    content_type = Field(
+        default=None,
+        description="파일 형식",
+        json_schema_extra={"example": "image/jpeg"},
+    )
+    variants = Field(
+        default=["original"],
+        description="저장된 사진 크기 종류",
+        json_schema_extra={"example": ["original"]},
     )
 
 
@@ -22,20 +40,57 @@ class PictureMetaModel(BaseModel):
         description="사용자 ID",
         json_schema_extra={"example": "6qerhu4sd1vt1bh3"},
     )
-    ids: list[str] = PictureFields.picture_ids
+    count: int = PictureFields.picture_count
     modified_at: datetime = Field(
         description="최근 수정 시간",
         json_schema_extra={"example": "2024-08-17 19:00:00.000000"},
     )
 
+    @classmethod
+    def from_db(cls, document: dict) -> "PictureMetaModel":
+        return cls.model_construct(**document)
 
-class PictureMetaInfo(BaseModel):
+
+class PictureModel(BaseModel):
+    """
+    pictures 컬렉션의 사진 한 장
+    """
+
+    id: str = PictureFields.picture_id
     user_id: str = Field(
         description="사용자 ID",
         json_schema_extra={"example": "6qerhu4sd1vt1bh3"},
     )
-    urls: list[str] = PictureFields.picture_urls
-    modified_at: datetime = Field(
-        description="최근 수정 시간",
-        json_schema_extra={"example": "2024-08-17 19:00:00.000000"},
+    created_at: datetime = PictureFields.created_at
+    size: int | None = PictureFields.size
+    content_type: str | None = PictureFields.content_type
+    variants: list[str] = PictureFields.variants
+
+    @classmethod
+    def from_db(cls, document: dict) -> "PictureModel":
+        return cls.model_construct(**document)
+
+
+class PictureInfo(BaseModel):
+    id: str = PictureFields.picture_id
+    url: str = Field(
+        description="사진 URL",
+        json_schema_extra={
+            "example": "https://www.example.com/pictures/6qerhu4sd1vt1bh3/a1b2.jpeg"
+        },
+    )
+    created_at: datetime = PictureFields.created_at
+    size: int | None = PictureFields.size
+    content_type: str | None = PictureFields.content_type
+
+
+class PicturePage(BaseModel):
+    items: list[PictureInfo] = Field(
+        default_factory=list,
+        description="사진 목록 (최근 업로드순)",
+    )
+    total: int = PictureFields.picture_count
+    next_cursor: str | None = Field(
+        default=None,
+        description="다음 페이지 커서, 마지막 페이지이면 null",
     )
@@ -146,31 +146,24 @@ class AuthFields:
         examples=[GrantType.ACCESS_TOKEN, GrantType.REFRESH_TOKEN],
     )
     created_at = Field(
-        default=None,
-        description="토큰 발급 시점",
+        default_factory=datetime.utcnow,
+        description="이벤트 발생 시점 (UTC)",
         json_schema_extra={"example": "2024-04-04 19:00:00.000000"},
     )
     expires_in = Field(
         default=None,
-        description="토큰 만료 예정 시간",
+        description="토큰 만료 예정 시간 (UTC)",
         json_schema_extra={"example": "2024-06-04 19:00:00.000000"},
     )
-    blacklisted_at = Field(
-        default=None,
-        description="토큰이 블랙리스트에 등록된 시점",
-        json_schema_extra={"example": "2024-04-04 19:00:00.000000"},
-    )
-    refresh_token = Field(
+    refresh_token_id = Field(
         default=None,
-        description="refresh token",
-        json_schema_extra={"example": "FAKE__ciOiJIUzI1Ni__FAKE"},
+        description="refresh token ID (jti)",
+        json_schema_extra={"example": "k2x9d0q1m3v8b7c6"},
     )
-    access_token = Field(
+    access_token_id = Field(
         default=None,
-        description="access token",
-        json_schema_extra={
-            "example": "FAKE__ciOiJIUzI1NiIsI....XkdZRDnSTYiOz22f__FAKE",
-        },
+        description="access token ID (jti)",
+        json_schema_extra={"example": "a8v3n1z0c5x7m2q4"},
     )
     event_type = Field(
         description="이벤트 타입",
@@ -183,6 +176,41 @@ class AuthFields:
     )
 
 
+def effective_plan(
+    using_plan: Plan | str | None,
+    plan_expired_at: datetime | None,
+) -> Plan:
+    """
+    잘못 입력되었거나 만료된 플랜은 BASIC으로 처리합니다.
+    """
+    if using_plan is None:
+        return Plan.BASIC
+    if using_plan not in Plan.__members__:
+        logging.error("Plan이 잘못 입력되었습니다.: %s", using_plan)
+        return Plan.BASIC
+    if plan_expired_at is None:
+        return Plan.BASIC
+    if plan_expired_at < datetime.now():
+        return Plan.BASIC
+    return Plan(using_plan)
+
+
+def trusted_user_fields(document: dict) -> dict:
+    """
+    DB 문서를 검증 없이 모델로 만들 때 변환이 필요한 필드 (enum, 플랜 만료)
+    """
+    fields = {
+        "using_plan": effective_plan(
+            document.get("using_plan"), document.get("plan_expired_at")
+        )
+    }
+    if document.get("auth_provider") is not None:
+        fields["auth_provider"] = OAuthProvider(document["auth_provider"])
+    if document.get("sex") is not None:
+        fields["sex"] = Sex(document["sex"])
+    return fields
+
+
 class UserModel(BaseModel):
     id: str = UserFields.user_id
     name: str | None = UserFields.name
@@ -204,6 +232,32 @@ class UserModel(BaseModel):
     using_plan: Plan = UserFields.using_plan
     auto_subscription: bool = UserFields.auto_subscription
 
+    @classmethod
+    def from_db(cls, document: dict) -> "UserModel":
+        """
+        저장할 때 이미 검증된 DB 문서로 검증 없이 모델을 만듭니다.
+        """
+        return cls.model_construct(**{**document, **trusted_user_fields(document)})
+
+    @classmethod
+    def from_cache(cls, document: dict) -> "UserModel":
+        """
+        model_dump_json으로 캐시에 저장한 문서로 검증 없이 모델을 만듭니다.
+        JSON에서 문자열이 된 시간 필드만 datetime으로 되돌립니다.
+        """
+        for field in ("created_at", "updated_at", "deactivated_at", "plan_expired_at"):
+            if isinstance(document.get(field), str):
+                document[field] = datetime.fromisoformat(document[field])
+        return cls.from_db(document)
+
+    def to_info(self) -> "UserInfo":
+        """
+        model_dump 후 다시 검증하지 않고 UserInfo 필드만 옮깁니다.
+        """
+        return UserInfo.model_construct(
+            **{field: getattr(self, field) for field in UserInfo.model_fields}
+        )
+
     @field_validator("id", mode="before")
     def validate_id(cls, v):
         if v is None:
@@ -219,8 +273,8 @@ class UserModel(BaseModel):
         if v is None:
             return v
         try:
-            # is v datetime?
-            datetime.strptime(str(v), "%Y-%m-%d %H:%M:%S.%f")
+            # datetime 혹은 캐시에서 읽어온 ISO 8601 문자열
+            datetime.fromisoformat(str(v))
         except ValueError as incorrect_date_format:
             raise ValueError(
                 "Incorrect data format, should be YYYY-MM-DD HH:MM:SS.mmmmmm"
@@ -228,21 +282,8 @@ class UserModel(BaseModel):
         return v
 
     @field_validator("using_plan", mode="before")
-    def validate_using_plan(cls, value, values, **kwargs):
-        print(f"{values = }")
-        print(f"{kwargs = }")
-
-        if value is None:
-            return Plan.BASIC
-        if value not in Plan.__members__:
-            logging.exception("Plan이 잘못 입력되었습니다.: %s", value)
-            return Plan.BASIC
-        plan_expired_at = values.data.get("plan_expired_at", None)
-        if plan_expired_at is None:
-            return Plan.BASIC
-        if plan_expired_at < datetime.now():
-            return Plan.BASIC
-        return value
+    def validate_using_plan(cls, value, values):
+        return effective_plan(value, values.data.get("plan_expired_at", None))
 
 
 class UserInfo(BaseModel):
@@ -265,22 +306,30 @@ class UserInfo(BaseModel):
     using_plan: Plan = UserFields.using_plan
     auto_subscription: bool = UserFields.auto_subscription
 
+    @classmethod
+    def from_db(cls, document: dict) -> "UserInfo":
+        """
+        저장할 때 이미 검증된 DB 문서로 검증 없이 모델을 만듭니다.
+        """
+        return cls.model_construct(**{**document, **trusted_user_fields(document)})
+
     @field_validator("using_plan", mode="before")
-    def validate_using_plan(cls, value, values, **kwargs):
-        print(f"{values = }")
-        print(f"{kwargs = }")
-
-        if value is None:
-            return Plan.BASIC
-        if value not in Plan.__members__:
-            logging.exception("Plan이 잘못 입력되었습니다.: %s", value)
-            return Plan.BASIC
-        plan_expired_at = values.data.get("plan_expired_at", None)
-        if plan_expired_at is None:
-            return Plan.BASIC
-        if plan_expired_at < datetime.now():
-            return Plan.BASIC
-        return value
+    def validate_using_plan(cls, value, values):
+        return effective_plan(value, values.data.get("plan_expired_at", None))
+
+
+class UserSummary(BaseModel):
+    """
+    친구 목록 등 다른 사용자를 보여줄 때 필요한 최소한의 사용자 정보
+    """
+
+    id: str = UserFields.user_id
+    name: str | None = UserFields.name
+    profile_image: str | None = UserFields.profile_image
+
+    @classmethod
+    def from_db(cls, document: dict) -> "UserSummary":
+        return cls.model_construct(**document)
 
 
 class PatchableUserInfo(BaseModel):
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+# NOTE: api.settings를 import하기 전에 외부 서비스 없이 사용할 기본값을 채워둡니다.
+os.environ.setdefault("PALM_MONGO_HOST", "localhost")
+os.environ.setdefault("PALM_MONGO_DB", "palm_test")
+os.environ.setdefault("PALM_APP_SECRET", "test-secret-test-secret-test-secret")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def set(self, name: str, value: str, ex=None):
+        self.values[name] = value
+
+    async def get(self, name: str) -> str | None:
+        return self.values.get(name)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def publish(self, channel: str, message: str):
+        pass
+
+    async def scan_iter(self, match: str, count: int):
+        for key in list(self.values):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    from api.db.cache import redis as cache
+
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "redis_", fake)
+    return fake
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+from api.auth.keys import key_ring
+from api.db.cache import redis as cache
+from api.db.implements.redis import AuthManager, BlacklistFilter
+from api.jwt import create_access_token, is_token_revoked
+from enums.auth import OAuthProvider
+
+EMAIL = "revoke@p.alm"
+
+
+def freeze_time(monkeypatch, seconds: float):
+    monkeypatch.setattr(time, "time", lambda: seconds)
+
+
+async def revoke_and_issue(monkeypatch, revoked_at: float, issued_at: float) -> bool:
+    freeze_time(monkeypatch, revoked_at)
+    await AuthManager(cache).revoke_user_tokens(EMAIL, OAuthProvider.GOOGLE)
+    freeze_time(monkeypatch, issued_at)
+    token = create_access_token(EMAIL, OAuthProvider.GOOGLE)
+    return await is_token_revoked(token, key_ring.decode(token))
+
+
+@pytest.mark.asyncio
+async def test_token_issued_in_same_second_after_revoke_is_valid(
+    monkeypatch, fake_redis
+):
+    now = int(time.time())
+    assert not await revoke_and_issue(monkeypatch, now + 0.2, now + 0.7)
+
+
+@pytest.mark.asyncio
+async def test_token_issued_before_revoke_is_revoked(monkeypatch, fake_redis):
+    now = int(time.time())
+    assert await revoke_and_issue(monkeypatch, now + 0.7, now + 0.2)
+
+
+@pytest.mark.asyncio
+async def test_token_issued_after_revoke_in_seconds_is_valid(fake_redis):
+    # NOTE: 이전에 초 단위로 저장된 폐기 시점
+    now = int(time.time())
+    subject = AuthManager.subject_id(EMAIL, OAuthProvider.GOOGLE)
+    fake_redis.values[cache.mangle_key("blacklist", subject)] = str(now - 1)
+    token = create_access_token(EMAIL, OAuthProvider.GOOGLE)
+    assert not await is_token_revoked(token, key_ring.decode(token))
+
+
+@pytest.mark.asyncio
+async def test_blacklist_filter_is_dropped_while_pubsub_is_down(fake_redis):
+    blacklist_filter = BlacklistFilter(cache)
+    blacklist_filter.on_subscribed()
+    await blacklist_filter.resubscribe_task
+    assert not blacklist_filter.might_contain("missed-jti")
+
+    blacklist_filter.on_unsubscribed()
+    # NOTE: 연결이 끊긴 동안 등록된 토큰은 pub/sub으로 전달되지 않습니다.
+    fake_redis.values[cache.mangle_key("blacklist", "missed-jti")] = "access_token"
+    assert blacklist_filter.might_contain("missed-jti")
+    await blacklist_filter.rebuild()
+    assert blacklist_filter.filter is None
+
+    blacklist_filter.on_subscribed()
+    await blacklist_filter.resubscribe_task
+    assert blacklist_filter.filter is not None
+    assert blacklist_filter.might_contain("missed-jti")
+
+
+@pytest.mark.asyncio
+async def test_overlapping_blacklist_filter_rebuilds(monkeypatch, fake_redis):
+    blacklist_filter = BlacklistFilter(cache)
+    blacklist_filter.subscribed = True
+    scan_iter = fake_redis.scan_iter
+
+    async def slow_scan_iter(match: str, count: int):
+        await asyncio.sleep(0.01)
+        async for key in scan_iter(match, count):
+            yield key
+
+    monkeypatch.setattr(fake_redis, "scan_iter", slow_scan_iter)
+    periodic = asyncio.create_task(blacklist_filter.rebuild())
+    resubscribed = asyncio.create_task(blacklist_filter.rebuild())
+    await asyncio.sleep(0)
+    # NOTE: 스캔 도중 등록되어 pub/sub으로 전달받은 토큰도 새 filter에 남아야 합니다.
+    fake_redis.values[cache.mangle_key("blacklist", "revoked-while-scanning")] = "1"
+    blacklist_filter.add("revoked-while-scanning")
+    await asyncio.gather(periodic, resubscribed)
+    assert blacklist_filter.filter is not None
+    assert blacklist_filter.might_contain("revoked-while-scanning")
+    assert blacklist_filter.pending == []
@@ -0,0 +1,26 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api.enums import Environment
+from api.main import app
+from api.settings import env
+
+
+@pytest.fixture
+def client():
+    # NOTE: lifespan(외부 서비스 연결)을 실행하지 않도록 with 없이 사용합니다.
+    return TestClient(app)
+
+
+def test_metrics_is_open_in_internal_environments(client):
+    assert client.get("/metrics").status_code == 200
+
+
+def test_metrics_requires_token_in_production(monkeypatch, client):
+    monkeypatch.setattr(env, "environment", Environment.PRODUCTION)
+    monkeypatch.setattr(env, "metrics_token", "metrics-secret")
+    assert client.get("/metrics").status_code == 401
+    response = client.get(
+        "/metrics", headers={"Authorization": "Bearer metrics-secret"}
+    )
+    assert response.status_code == 200
@@ -0,0 +1,12 @@
+from api.db.migrations import convert_token_log
+from api.jwt import get_token_id
+
+
+def test_malformed_legacy_token_falls_back_to_hash_id():
+    document = {
+        "created_at": "2024-08-17 19:00:00.000000",
+        "access_token": "not-a-jwt",
+    }
+    converted = convert_token_log(document)
+    assert converted is not None
+    assert converted["access_token_id"] == get_token_id("not-a-jwt", payload={})
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+import pytest
+
+from api.auth.password import PasswordHasher
+from api.errors import PasswordHasherBusyError
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_keeps_its_slot_until_work_finishes():
+    hasher = PasswordHasher(workers=1, queue_size=0, rounds=4)
+    release = threading.Event()
+
+    def slow(_):
+        release.wait(timeout=5)
+        return True
+
+    task = asyncio.create_task(hasher._run(slow, None))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    # NOTE: 스레드에서는 아직 실행 중이므로 새 작업을 받지 않아야 합니다.
+    assert hasher.in_flight == 1
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.check("password", "hash")
+    release.set()
+    for _ in range(100):
+        if hasher.in_flight == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert hasher.in_flight == 0
+    hasher.shutdown()
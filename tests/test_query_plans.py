@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from api.db.implements.indexes import QUERIES, check_query_plans, ensure_indexes
+from api.db.persistant import mongo as db
+from api.db.persistant import mongo_connection
+
+
+@pytest_asyncio.fixture
+async def mongo_available():
+    try:
+        await asyncio.wait_for(db.command("ping"), timeout=2)
+    except Exception:
+        pytest.skip("MongoDB is not available")
+    else:
+        yield
+    finally:
+        mongo_connection.close()
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(mongo_available):
+    await ensure_indexes()
+    problems = await check_query_plans()
+    assert problems == {"COLLSCAN": [], "SORT": []}, [query.name for query in QUERIES]
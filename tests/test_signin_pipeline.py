@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from api.auth import pipeline
+from api.auth.pipeline import SigninPipeline, SigninProvider
+from enums.auth import OAuthProvider
+from schemas.users import UserModel
+
+
+class StaticProvider(SigninProvider):
+    auth_provider = OAuthProvider.BASIC
+
+    async def identify(self, credential: str) -> UserModel:
+        return UserModel(
+            id="6qerhu4sd1vt1bh3",
+            email=credential,
+            auth_provider=self.auth_provider,
+            created_at=datetime.utcnow(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_upsert_is_cancelled_when_minting_fails(monkeypatch):
+    upserted = []
+
+    async def add_user(user: UserModel):
+        await asyncio.sleep(0.01)
+        upserted.append(user)
+
+    def create_access_token(**kwargs):
+        raise RuntimeError("mint failed")
+
+    monkeypatch.setattr(pipeline, "add_user", add_user)
+    monkeypatch.setattr(pipeline, "create_access_token", create_access_token)
+    with pytest.raises(RuntimeError):
+        await SigninPipeline().signin(StaticProvider(), "pipeline@p.alm")
+    # NOTE: 남아있는 upsert 작업 없이 실패해야 합니다.
+    await asyncio.sleep(0.02)
+    assert not upserted
+    assert not [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upsert_starts_before_minting(monkeypatch):
+    order = []
+
+    async def add_user(user: UserModel):
+        order.append("upsert-start")
+        await asyncio.sleep(0)
+        return True, user
+
+    def create_access_token(**kwargs):
+        order.append("mint")
+        return "access-token"
+
+    async def add_token_log(payload):
+        pass
+
+    monkeypatch.setattr(pipeline, "add_user", add_user)
+    monkeypatch.setattr(pipeline, "create_access_token", create_access_token)
+    monkeypatch.setattr(pipeline, "add_token_log", add_token_log)
+    response = await SigninPipeline().signin(StaticProvider(), "pipeline@p.alm")
+    assert response.status_code == 200
+    assert order == ["upsert-start", "mint"]
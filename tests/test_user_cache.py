@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import orjson
+import pytest
+
+from api.db.cache import redis as cache
+from api.db.implements.redis import UserCache
+from enums.auth import OAuthProvider
+from schemas.users import UserModel
+
+
+@pytest.mark.asyncio
+async def test_user_cache_does_not_store_password(fake_redis):
+    user_cache = UserCache(cache)
+    user_model = UserModel(
+        id="6qerhu4sd1vt1bh3",
+        email="cache@p.alm",
+        auth_provider=OAuthProvider.BASIC,
+        password="hashed",
+        created_at=datetime.utcnow(),
+    )
+    await user_cache.set(user_model)
+    assert user_model.password == "hashed"
+    for raw in fake_redis.values.values():
+        assert "password" not in orjson.loads(raw)
+    user_cache.local.clear()
+    cached = await user_cache.get(user_model.email, user_model.auth_provider)
+    assert cached is not None and cached.password is None
+    # NOTE: 검증 없이 만들어도 타입은 DB 문서와 같아야 합니다.
+    assert cached.created_at == user_model.created_at
+    assert cached.auth_provider is OAuthProvider.BASIC
+    assert cached.to_info().email == user_model.email
+
+
+def test_cached_user_reads_do_not_load_password():
+    from api.db.implements.mongo import CACHED_USER_PROJECTION
+
+    assert "password" not in CACHED_USER_PROJECTION
+    assert CACHED_USER_PROJECTION["email"] is True
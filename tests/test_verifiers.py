@@ -0,0 +1,27 @@
+import aiohttp
+import jwt
+import pytest
+
+from api.auth.verifiers import JWKSCache, KakaoIdTokenVerifier
+
+
+class UnavailableJWKS(JWKSCache):
+    async def refresh(self, force: bool = False):
+        raise aiohttp.ClientConnectionError("jwks unavailable")
+
+
+@pytest.mark.asyncio
+async def test_kakao_falls_back_to_tokeninfo_when_jwks_fails(monkeypatch):
+    verifier = KakaoIdTokenVerifier(
+        jwks=UnavailableJWKS("https://kauth.kakao.com/.well-known/jwks.json"),
+        audience="kakao-client",
+        tokeninfo_url="https://kauth.kakao.com/oauth/tokeninfo",
+    )
+    claims = {"iss": "https://kauth.kakao.com", "email": "kakao@p.alm"}
+
+    async def tokeninfo(token: str) -> dict:
+        return claims
+
+    monkeypatch.setattr(verifier, "tokeninfo", tokeninfo)
+    token = jwt.encode({"sub": "1"}, "secret", headers={"kid": "unknown"})
+    assert await verifier.verify(token) == claims